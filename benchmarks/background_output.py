@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gi
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import GLib  # type: ignore
+from gi.repository import Gtk  # type: ignore
+from gi.repository import Vte  # type: ignore
+import pulse_ssh.gui.managers.ActivityManager as _activity_manager
+
+SIZES = [10, 50, 100]
+DURATION_SECONDS = 10
+STREAM_COMMAND = ["sh", "-c", "while :; do seq 1 200; sleep 0.01; done"]
+
+def cpu_seconds():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+def run(count, throttled):
+    """Streams output into count terminals stacked behind a visible one and returns the GUI process CPU time spent."""
+    window = Gtk.Window(default_width=800, default_height=600)
+    stack = Gtk.Stack()
+    window.set_child(stack)
+    stack.add_named(Vte.Terminal(), "visible")
+
+    manager = _activity_manager.ActivityManager(None)
+    terminals = []
+    for i in range(count):
+        terminal = Vte.Terminal()
+        terminal.set_scroll_on_output(True)
+        stack.add_named(terminal, f"hidden-{i}")
+        terminal.spawn_async(Vte.PtyFlags.DEFAULT, os.environ['HOME'], STREAM_COMMAND, [], GLib.SpawnFlags.SEARCH_PATH, None, None, -1, None, None, None)
+        terminals.append(terminal)
+
+    stack.set_visible_child_name("visible")
+    window.present()
+    if throttled:
+        for terminal in terminals:
+            manager.on_hidden(terminal)
+
+    loop = GLib.MainLoop()
+    GLib.timeout_add_seconds(1, loop.quit)
+    loop.run()
+
+    start_cpu = cpu_seconds()
+    start = time.perf_counter()
+    GLib.timeout_add_seconds(DURATION_SECONDS, loop.quit)
+    loop.run()
+    elapsed = time.perf_counter() - start
+    spent = cpu_seconds() - start_cpu
+
+    flagged = sum(1 for terminal in terminals if getattr(terminal, 'has_activity', False))
+    window.destroy()
+    return spent, elapsed, flagged
+
+def main():
+    print(f"{'terminals':>10} {'mode':>10} {'cpu (s)':>8} {'cpu %':>6} {'vs baseline':>12} {'flagged':>8}")
+    for count in SIZES:
+        baseline = 0.0
+        for throttled in (False, True):
+            spent, elapsed, flagged = run(count, throttled)
+            mode = "throttled" if throttled else "baseline"
+            if not throttled:
+                baseline = spent
+            change = (spent - baseline) / baseline * 100 if baseline else 0.0
+            print(f"{count:>10} {mode:>10} {spent:>8.2f} {spent / elapsed * 100:>6.1f} {change:>+11.1f}% {flagged:>8}")
+
+if __name__ == "__main__":
+    main()
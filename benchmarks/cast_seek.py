@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulse_ssh.Asciicast as _asciicast
+
+HOURS = [1, 4, 8]
+FRAMES_PER_SECOND = 10
+ROWS = 24
+
+def write_recording(path, hours):
+    """Writes a recording of a terminal scrolling one line per frame, with keyframes as the recorder emits them."""
+    diff = _asciicast.ScreenDiff()
+    keyframe_at = 0.0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(_asciicast.encode_header(80, ROWS, 0, "benchmark", {}))
+        for i in range(hours * 3600 * FRAMES_PER_SECOND):
+            elapsed = i / FRAMES_PER_SECOND
+            rows = [f"{j:08d} the quick brown fox jumps over the lazy dog" for j in range(i, i + ROWS)]
+            if i == 0 or elapsed - keyframe_at >= _asciicast.KEYFRAME_INTERVAL_SECONDS:
+                data = diff.keyframe(rows, i, (ROWS - 1, 0))
+                keyframe_at = elapsed
+            else:
+                data = diff.frame(rows, i, (ROWS - 1, 0))
+            f.write(_asciicast.encode_event(elapsed, "o", data))
+
+def replay(path, offset, target):
+    """Reads and decodes every event from offset up to target, which is what a seek feeds to the terminal."""
+    count = 0
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        while (event := _asciicast.read_event(f)) and event[0] <= target:
+            count += 1
+    return count
+
+def main():
+    print(f"{'hours':>6} {'size (MB)':>10} {'index (s)':>10} {'keyframes':>10} {'seek full (s)':>14} {'seek key (s)':>13} {'events':>9}")
+    for hours in HOURS:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, f"bench{_asciicast.EXTENSION}")
+            write_recording(path, hours)
+
+            start = time.perf_counter()
+            header, index = _asciicast.build_index(path)
+            index_time = time.perf_counter() - start
+
+            target = index.duration * 0.9
+            start = time.perf_counter()
+            replay(path, index.offsets[0], target)
+            full_time = time.perf_counter() - start
+
+            keyframe_time, offset = index.seek(target)
+            start = time.perf_counter()
+            events = replay(path, offset, target)
+            keyframe_seek_time = time.perf_counter() - start
+
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            print(f"{hours:>6} {size_mb:>10.1f} {index_time:>10.3f} {len(index.times):>10} {full_time:>14.3f} {keyframe_seek_time:>13.4f} {events:>9}")
+
+if __name__ == "__main__":
+    main()
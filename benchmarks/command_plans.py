@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulse_ssh.data.AppConfig as _app_config
+import pulse_ssh.data.Connection as _connection
+import pulse_ssh.Globals as _globals
+import pulse_ssh.Utils as _utils
+
+CONNECTIONS = 10_000
+ROUNDS = 5
+
+def make_connections(count):
+    connections = {}
+    bastion = _connection.Connection(name="bastion", host="bastion.example.com", user="jump")
+    connections[bastion.uuid] = bastion
+    for i in range(count):
+        conn = _connection.Connection(
+            name=f"host-{i:05d}",
+            folder=f"dc{i % 4}",
+            host=f"10.0.{(i >> 8) & 255}.{i & 255}",
+            user="deploy",
+            identity_file="~/.ssh/id_ed25519",
+            ssh_proxy_jump=bastion.uuid if i % 2 else None,
+            ssh_additional_options=["-o ServerAliveInterval=30", "-o SetEnv=PULSE_HOST={name}"],
+            ssh_unique_sock_proxy=i % 10 == 0,
+        )
+        connections[conn.uuid] = conn
+    return connections
+
+def run(builder, app_config, connections):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for conn in connections:
+            builder(app_config, conn)
+    return (time.perf_counter() - start) / (ROUNDS * len(connections))
+
+def main():
+    app_config = _app_config.AppConfig(ssh_additional_options=["-o ConnectTimeout=10"])
+    _globals.connections = make_connections(CONNECTIONS)
+    connections = list(_globals.connections.values())
+
+    def uncached(app_config_, conn):
+        _utils.command_plan_cache.clear()
+        return _utils.build_ssh_command(app_config_, conn)
+
+    print(f"{'path':>28} {'per spawn (us)':>15}")
+    print(f"{'rebuild every spawn':>28} {run(uncached, app_config, connections) * 1e6:>15.1f}")
+    print(f"{'cached plan (warm)':>28} {run(_utils.build_ssh_command, app_config, connections) * 1e6:>15.1f}")
+    without_socks = [c for c in connections if not c.ssh_unique_sock_proxy]
+    print(f"{'cached plan, no SOCKS port':>28} {run(_utils.build_ssh_command, app_config, without_socks) * 1e6:>15.1f}")
+
+    _utils.bump_app_config_version()
+    start = time.perf_counter()
+    for conn in connections:
+        _utils.build_ssh_command(app_config, conn)
+    print(f"{'after AppConfig bump':>28} {(time.perf_counter() - start) / len(connections) * 1e6:>15.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+import json
+import os
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from dataclasses import fields
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulse_ssh.data.AppConfig as _app_config
+import pulse_ssh.data.Connection as _connection
+import pulse_ssh.Utils as _utils
+
+SIZES = [1_000, 10_000, 100_000]
+
+def make_connections(count):
+    connections = {}
+    for i in range(count):
+        conn = _connection.Connection(
+            name=f"host-{i:06d}",
+            folder=f"dc{i % 4}/rack{i % 50}",
+            host=f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}",
+            user="deploy" if i % 3 else "",
+        )
+        if i % 10 == 0:
+            conn.ssh_forward_agent = True
+            conn.ssh_additional_options = ["-o ServerAliveInterval=30"]
+        connections[conn.uuid] = conn
+    return connections
+
+def save_full(path, app_config, connections):
+    data = {
+        'config': asdict(app_config),
+        'connections': [asdict(c) for c in connections.values()],
+        'clusters': []
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=4)
+
+def load_full(path):
+    with open(path, 'r') as f:
+        data = json.load(f)
+    connections = {}
+    for tmp_data in data['connections']:
+        afields = {f.name for f in fields(_connection.Connection)}
+        filtered = {k: v for k, v in tmp_data.items() if k in afields}
+        connections[filtered['uuid']] = _connection.Connection(**filtered)
+    return connections
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    app_config = _app_config.AppConfig()
+    print(f"{'connections':>12} {'format':>7} {'size (MB)':>10} {'save (s)':>9} {'load (s)':>9}")
+    for count in SIZES:
+        connections = make_connections(count)
+        with tempfile.TemporaryDirectory() as config_dir:
+            full_path = os.path.join(config_dir, "full.json")
+            _, save_time = timed(save_full, full_path, app_config, connections)
+            loaded, load_time = timed(load_full, full_path)
+            assert len(loaded) == count
+            print(f"{count:>12} {'full':>7} {os.path.getsize(full_path) / 1e6:>10.2f} {save_time:>9.3f} {load_time:>9.3f}")
+
+            _, save_time = timed(_utils.save_app_config, config_dir, False, app_config, connections, {})
+            (_, loaded, _), load_time = timed(_utils.load_app_config, config_dir)
+            assert loaded == connections
+            sparse_path = os.path.join(config_dir, "settings.json")
+            print(f"{count:>12} {'sparse':>7} {os.path.getsize(sparse_path) / 1e6:>10.2f} {save_time:>9.3f} {load_time:>9.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulse_ssh.data.AppConfig as _app_config
+import pulse_ssh.data.Connection as _connection
+import pulse_ssh.Globals as _globals
+import pulse_ssh.Utils as _utils
+
+SIZES = [1_000, 10_000, 100_000]
+TOP_LEVEL_FOLDERS = 100
+
+def make_connections(count):
+    connections = {}
+    for i in range(count):
+        conn = _connection.Connection(
+            name=f"host-{i:06d}",
+            folder=f"site{i % TOP_LEVEL_FOLDERS:03d}/rack{i % 50}",
+            host=f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}",
+            user="deploy",
+        )
+        connections[conn.uuid] = conn
+    return connections
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    print(f"{'connections':>12} {'layout':>9} {'startup (s)':>12} {'expand (s)':>11} {'save one (s)':>13}")
+    for count in SIZES:
+        connections = make_connections(count)
+        for sharded in (False, True):
+            with tempfile.TemporaryDirectory() as config_dir:
+                _globals.config_dir = config_dir
+                _globals.config_shards = {}
+                _globals.settings_hash = None
+                app_config = _app_config.AppConfig(config_sharded=sharded)
+                _utils.save_app_config(config_dir, False, app_config, connections, {})
+
+                (app_config, loaded, clusters), startup_time = timed(_utils.load_app_config, config_dir)
+                expand_time = 0.0
+                if sharded:
+                    _, expand_time = timed(_utils.load_config_shards, config_dir, loaded, ["site000"])
+
+                conn = next(c for c in loaded.values() if c.folder.startswith("site000"))
+                conn.user = "root"
+                _, save_time = timed(_utils.save_app_config, config_dir, False, app_config, loaded, clusters)
+
+                label = "sharded" if sharded else "single"
+                print(f"{count:>12} {label:>9} {startup_time:>12.3f} {expand_time:>11.3f} {save_time:>13.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from dataclasses import MISSING
+from dataclasses import field
+from dataclasses import fields
+from dataclasses import make_dataclass
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulse_ssh.data.Connection as _connection
+import pulse_ssh.Utils as _utils
+
+SIZES = [10_000, 100_000]
+
+def make_plain_connection_class():
+    plain_fields = []
+    for f in fields(_connection.Connection):
+        if f.default_factory is not MISSING:
+            plain_fields.append((f.name, f.type, field(default_factory=f.default_factory)))
+        elif f.default is not MISSING:
+            plain_fields.append((f.name, f.type, field(default=f.default)))
+        else:
+            plain_fields.append((f.name, f.type))
+    return make_dataclass("PlainConnection", plain_fields)
+
+def make_settings_json(count):
+    entries = []
+    for i in range(count):
+        conn = _connection.Connection(
+            name=f"host-{i:06d}",
+            folder=f"dc{i % 4}/rack{i % 50}",
+            host=f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}",
+            user="deploy" if i % 3 else "root",
+            type="ssh" if i % 5 else "mosh",
+        )
+        if i % 10 == 0:
+            conn.ssh_additional_options = ["-o ServerAliveInterval=30"]
+        entries.append(_utils.to_sparse_dict(conn))
+    return json.dumps(entries)
+
+def measure(cls, raw):
+    gc.collect()
+    tracemalloc.start()
+    connections = {}
+    for tmp_data in json.loads(raw):
+        conn = _utils.from_sparse_dict(cls, tmp_data)
+        connections[conn.uuid] = conn
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+def main():
+    plain_cls = make_plain_connection_class()
+    print(f"{'connections':>12} {'model':>8} {'memory (MB)':>12} {'bytes/conn':>11}")
+    for count in SIZES:
+        raw = make_settings_json(count)
+        for label, cls in (("plain", plain_cls), ("compact", _connection.Connection)):
+            used = measure(cls, raw)
+            print(f"{count:>12} {label:>8} {used / 1e6:>12.2f} {used / count:>11.0f}")
+
+if __name__ == "__main__":
+    main()
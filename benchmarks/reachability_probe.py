@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulse_ssh.Reachability as _reachability
+
+SIZES = [1_000, 10_000, 30_000]
+
+def main():
+    print(f"{'hosts':>8} {'probe (s)':>10} {'probes/s':>10} {'request call (ms)':>18}")
+    for count in SIZES:
+        done = threading.Event()
+        results = []
+        def on_result(target, result):
+            results.append(target)
+            if len(results) == count:
+                done.set()
+
+        prober = _reachability.ReachabilityProber(on_result)
+        prober.start()
+        targets = [(f"127.{(i >> 8) & 255}.{i & 255}.1", 9) for i in range(count)]
+
+        start = time.perf_counter()
+        prober.request(targets, _reachability.PRIORITY_VISIBLE)
+        request_time = time.perf_counter() - start
+        done.wait(600)
+        elapsed = time.perf_counter() - start
+        prober.stop()
+
+        print(f"{count:>8} {elapsed:>10.2f} {count / elapsed:>10.0f} {request_time * 1000:>18.2f}")
+
+if __name__ == "__main__":
+    main()
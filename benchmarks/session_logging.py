@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import GLib  # type: ignore
+from gi.repository import Gtk  # type: ignore
+from gi.repository import Vte  # type: ignore
+import pulse_ssh.data.AppConfig as _app_config
+import pulse_ssh.data.Connection as _connection
+import pulse_ssh.Globals as _globals
+import pulse_ssh.gui.managers.SessionLogManager as _session_log_manager
+
+SIZES = [50, 100, 200]
+DURATION_SECONDS = 10
+PROBE_INTERVAL_MS = 10
+STREAM_COMMAND = ["sh", "-c", "while :; do seq 1 200; sleep 0.01; done"]
+
+def cpu_seconds():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+def run(count, logged, log_dir):
+    """Streams output into count terminals and returns the GUI process CPU time and how late a PROBE_INTERVAL_MS timer fired."""
+    _globals.app_config = _app_config.AppConfig(session_log_enabled=logged, session_log_dir=log_dir)
+    window = Gtk.Window(default_width=800, default_height=600)
+    stack = Gtk.Stack()
+    window.set_child(stack)
+
+    manager = _session_log_manager.SessionLogManager(None)
+    terminals = []
+    for i in range(count):
+        terminal = Vte.Terminal()
+        terminal.terminal_id = f"bench-{i}"
+        terminal.is_replay = False
+        terminal.pulse_conn = _connection.Connection(name=f"bench-{i}")
+        stack.add_named(terminal, f"terminal-{i}")
+        terminal.spawn_async(Vte.PtyFlags.DEFAULT, os.environ['HOME'], STREAM_COMMAND, [], GLib.SpawnFlags.SEARCH_PATH, None, None, -1, None, None, None)
+        manager.watch(terminal)
+        terminals.append(terminal)
+    window.present()
+
+    loop = GLib.MainLoop()
+    GLib.timeout_add_seconds(1, loop.quit)
+    loop.run()
+
+    delays = []
+    expected = [time.perf_counter() + PROBE_INTERVAL_MS / 1000]
+
+    def probe():
+        now = time.perf_counter()
+        delays.append(max(0.0, now - expected[0]))
+        expected[0] = now + PROBE_INTERVAL_MS / 1000
+        return GLib.SOURCE_CONTINUE
+
+    probe_id = GLib.timeout_add(PROBE_INTERVAL_MS, probe)
+    start_cpu = cpu_seconds()
+    start = time.perf_counter()
+    GLib.timeout_add_seconds(DURATION_SECONDS, loop.quit)
+    loop.run()
+    elapsed = time.perf_counter() - start
+    spent = cpu_seconds() - start_cpu
+    GLib.source_remove(probe_id)
+
+    manager.stop()
+    window.destroy()
+    delays.sort()
+    return spent, elapsed, delays[len(delays) // 2], delays[int(len(delays) * 0.99)]
+
+def main():
+    print(f"{'terminals':>10} {'mode':>9} {'cpu (s)':>8} {'cpu %':>6} {'p50 lag (ms)':>13} {'p99 lag (ms)':>13}")
+    with tempfile.TemporaryDirectory() as log_dir:
+        for count in SIZES:
+            for logged in (False, True):
+                spent, elapsed, p50, p99 = run(count, logged, log_dir)
+                mode = "logged" if logged else "baseline"
+                print(f"{count:>10} {mode:>9} {spent:>8.2f} {spent / elapsed * 100:>6.1f} {p50 * 1000:>13.1f} {p99 * 1000:>13.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulse_ssh.data.LaunchPlan as _launch_plan
+
+SPAWNS = 200
+SESSIONS = 50
+SHELL_PROGRAM = sys.argv[1] if len(sys.argv) > 1 else (shutil.which("bash") or "/bin/sh")
+
+def process_tree(pid):
+    pids = [pid]
+    for child_pid in pids:
+        try:
+            with open(f"/proc/{child_pid}/task/{child_pid}/children") as f:
+                pids.extend(int(p) for p in f.read().split())
+        except OSError:
+            pass
+    return pids
+
+def rss_kb(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+def shell_wrapped(plan):
+    return [SHELL_PROGRAM, "-c", plan.shell_command()]
+
+def spawn_time(argv):
+    start = time.perf_counter()
+    for _ in range(SPAWNS):
+        subprocess.run(argv)
+    return (time.perf_counter() - start) / SPAWNS
+
+def resident_cost(argv):
+    sessions = [subprocess.Popen(argv) for _ in range(SESSIONS)]
+    time.sleep(0.5)
+    processes = 0
+    rss = 0
+    for session in sessions:
+        for pid in process_tree(session.pid):
+            processes += 1
+            rss += rss_kb(pid)
+    for session in sessions:
+        session.kill()
+        session.wait()
+    return processes / SESSIONS, rss / SESSIONS
+
+def main():
+    print(f"shell: {SHELL_PROGRAM}")
+    print(f"{'launch':>22} {'spawn (ms)':>11} {'procs/session':>14} {'RSS/session (KB)':>17}")
+    short_plan = _launch_plan.LaunchPlan(["true"])
+    long_plan = _launch_plan.LaunchPlan(["sleep", "60"])
+    prepend_short_plan = _launch_plan.LaunchPlan(["true"], prepend_cmds=["true"])
+    prepend_long_plan = _launch_plan.LaunchPlan(["sleep", "60"], prepend_cmds=["true"])
+    launches = (
+        ("direct exec", short_plan.spawn_argv(SHELL_PROGRAM), long_plan.spawn_argv(SHELL_PROGRAM)),
+        ("shell -c (previous)", shell_wrapped(short_plan), shell_wrapped(long_plan)),
+        ("shell, prepend step", prepend_short_plan.spawn_argv(SHELL_PROGRAM), prepend_long_plan.spawn_argv(SHELL_PROGRAM)),
+    )
+    for label, short_argv, long_argv in launches:
+        per_spawn = spawn_time(short_argv)
+        processes, rss = resident_cost(long_argv)
+        print(f"{label:>22} {per_spawn * 1000:>11.2f} {processes:>14.1f} {rss:>17.0f}")
+
+if __name__ == "__main__":
+    main()
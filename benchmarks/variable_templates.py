@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+import os
+import sys
+import timeit
+from dataclasses import asdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulse_ssh.data.Connection as _connection
+import pulse_ssh.Utils as _utils
+
+ITERATIONS = 100_000
+
+LEGACY_KEYS = _utils.substitute_keys + ["proxy_port"]
+
+TEMPLATES = {
+    "no variables": "uptime",
+    "two variables": "scp {user}@{host}:/var/log/syslog /tmp/{name}.log",
+    "script": "ssh -p {port} {user}@{host} 'hostname; uptime' > /tmp/{folder}-{name}-{proxy_port}.txt",
+}
+
+def legacy_substitute_variables(command, conn, proxy_port=None):
+    if not command:
+        return ""
+
+    substitutions = asdict(conn)
+    if proxy_port:
+        substitutions['proxy_port'] = proxy_port
+
+    for key, value in substitutions.items():
+        if key in LEGACY_KEYS and value is not None:
+            command = command.replace(f'{{{key}}}', str(value))
+    return command
+
+def main():
+    conn = _connection.Connection(name="web-01", folder="prod/eu", host="10.0.0.1", user="deploy")
+    conn.ssh_additional_options = ["-o ServerAliveInterval=30"]
+    conn.ssh_prepend_cmds = ["kinit -R"]
+
+    print(f"{'template':>14} {'legacy (us)':>12} {'compiled (us)':>14} {'speedup':>8}")
+    for label, template in TEMPLATES.items():
+        assert legacy_substitute_variables(template, conn, 1080) == _utils.substitute_variables(template, conn, 1080)
+        legacy = timeit.timeit(lambda: legacy_substitute_variables(template, conn, 1080), number=ITERATIONS) / ITERATIONS
+        compiled = timeit.timeit(lambda: _utils.substitute_variables(template, conn, 1080), number=ITERATIONS) / ITERATIONS
+        print(f"{label:>14} {legacy * 1e6:>12.2f} {compiled * 1e6:>14.2f} {legacy / compiled:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -83,6 +83,7 @@ def run_curses_app(args):
     import pulse_ssh.tui.CursesWindow as _curses_window
 
     _globals.app_config, _globals.connections, _globals.clusters = _utils.load_app_config(_globals.config_dir)
+    _utils.load_config_shards(_globals.config_dir, _globals.connections)
     _curses_window.CursesWindow().run()
 
 if __name__ == '__main__':
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+from typing import Dict
+from typing import Optional
+from typing import Set
+import os
+import shlex
+import subprocess
+import threading
+import time
+
+AGENT_REFRESH_SECONDS = 300
+COMMAND_TIMEOUT = 30
+
+class AgentKeyManager:
+    """Remembers which identities the ssh-agent already holds so each key is added at most once."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.key_locks: Dict[str, threading.Lock] = {}
+        self.key_fingerprints: Dict[str, tuple[float, str]] = {}
+        self.agent_id: Optional[tuple] = None
+        self.agent_fingerprints: Set[str] = set()
+        self.agent_checked_at = 0.0
+
+    def ensure_key(self, identity_file: str, passphrase: str, sshpass_path: str = "sshpass") -> bool:
+        """Adds identity_file to the agent unless it is already loaded; returns False if it could not be added."""
+        path = os.path.expanduser(identity_file)
+        with self.lock:
+            key_lock = self.key_locks.setdefault(path, threading.Lock())
+
+        with key_lock:
+            fingerprint = self.get_key_fingerprint(path)
+            if not fingerprint:
+                return False
+
+            loaded = self.get_agent_fingerprints()
+            if loaded is None:
+                return False
+            if fingerprint in loaded:
+                return True
+
+            try:
+                result = subprocess.run(
+                    shlex.split(sshpass_path) + ["-e", "ssh-add", path],
+                    env={**os.environ, 'SSHPASS': passphrase},
+                    stdin=subprocess.DEVNULL, capture_output=True, timeout=COMMAND_TIMEOUT
+                )
+            except (OSError, subprocess.SubprocessError):
+                return False
+            if result.returncode != 0:
+                return False
+
+            with self.lock:
+                self.agent_fingerprints.add(fingerprint)
+            return True
+
+    def get_key_fingerprint(self, path: str) -> Optional[str]:
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return None
+
+        with self.lock:
+            cached = self.key_fingerprints.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            result = subprocess.run(["ssh-keygen", "-l", "-E", "sha256", "-f", path], stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=COMMAND_TIMEOUT)
+        except (OSError, subprocess.SubprocessError):
+            return None
+        fingerprint = parse_fingerprint(result.stdout) if result.returncode == 0 else None
+        if fingerprint:
+            with self.lock:
+                self.key_fingerprints[path] = (mtime, fingerprint)
+        return fingerprint
+
+    def get_agent_fingerprints(self) -> Optional[Set[str]]:
+        """Returns the fingerprints loaded in the current agent, listing them again only when the agent changed or the listing is stale."""
+        agent_id = current_agent_id()
+        if agent_id is None:
+            return None
+
+        with self.lock:
+            if agent_id == self.agent_id and time.monotonic() - self.agent_checked_at < AGENT_REFRESH_SECONDS:
+                return self.agent_fingerprints
+
+        try:
+            result = subprocess.run(["ssh-add", "-l", "-E", "sha256"], stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=COMMAND_TIMEOUT)
+        except (OSError, subprocess.SubprocessError):
+            return None
+        if result.returncode not in (0, 1):
+            return None
+
+        fingerprints = set()
+        for line in result.stdout.splitlines():
+            fingerprint = parse_fingerprint(line)
+            if fingerprint:
+                fingerprints.add(fingerprint)
+
+        with self.lock:
+            self.agent_id = agent_id
+            self.agent_fingerprints = fingerprints
+            self.agent_checked_at = time.monotonic()
+            return self.agent_fingerprints
+
+    def invalidate(self):
+        with self.lock:
+            self.agent_id = None
+            self.agent_fingerprints = set()
+
+def current_agent_id() -> Optional[tuple]:
+    sock = os.environ.get('SSH_AUTH_SOCK')
+    if not sock:
+        return None
+    try:
+        st = os.stat(sock)
+    except OSError:
+        return None
+    return (sock, st.st_ino, st.st_ctime)
+
+def parse_fingerprint(line: str) -> Optional[str]:
+    parts = line.split()
+    if len(parts) >= 2 and parts[1].startswith("SHA256:"):
+        return parts[1]
+    return None
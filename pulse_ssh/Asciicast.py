@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+from bisect import bisect_right
+from typing import BinaryIO
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+import json
+
+EXTENSION = ".cast"
+KEYFRAME_INTERVAL_SECONDS = 30.0
+# Homes the cursor and clears the screen; a frame starting with it repaints everything, so playback can start there.
+KEYFRAME_PREFIX = "\x1b[H\x1b[2J"
+ESCAPED_KEYFRAME_PREFIX = json.dumps(KEYFRAME_PREFIX)[1:-1].encode('ascii')
+
+Event = Tuple[float, str, str]
+
+def encode_header(width: int, height: int, timestamp: int, title: str, env: Dict[str, str]) -> str:
+    return json.dumps({"version": 2, "width": width, "height": height, "timestamp": timestamp, "title": title, "env": env}) + "\n"
+
+def encode_event(elapsed: float, code: str, data: str) -> str:
+    return json.dumps([round(elapsed, 6), code, data], ensure_ascii=False) + "\n"
+
+def read_header(stream: BinaryIO) -> dict:
+    try:
+        header = json.loads(stream.readline())
+    except ValueError:
+        header = None
+    if not isinstance(header, dict) or header.get("version") != 2:
+        raise ValueError("not an asciicast v2 recording")
+    return header
+
+def read_event(stream: BinaryIO) -> Optional[Event]:
+    """Returns the next event, skipping malformed lines; an unfinished last line is left for a later read."""
+    while True:
+        offset = stream.tell()
+        line = stream.readline()
+        if not line.endswith(b"\n"):
+            stream.seek(offset)
+            return None
+        try:
+            elapsed, code, data = json.loads(line)
+            return (float(elapsed), code, data)
+        except (ValueError, TypeError):
+            continue
+
+def split_rows(text: str, width: int, height: int) -> List[str]:
+    """Cuts screen text into exactly height rows, re-wrapping lines that the terminal wrapped softly."""
+    rows = []
+    for line in text.split("\n"):
+        while len(line) > width > 0:
+            rows.append(line[:width])
+            line = line[width:]
+        rows.append(line)
+    if text.endswith("\n"):
+        rows.pop()
+    rows = rows[-height:] if height > 0 else []
+    return rows + [""] * (height - len(rows))
+
+class ScreenDiff:
+    """Turns successive screen snapshots into the escape sequences that redraw only what changed."""
+
+    def __init__(self):
+        self.rows: List[str] = []
+        self.top: Optional[int] = None
+        self.cursor: Optional[Tuple[int, int]] = None
+
+    def move_cursor(self, cursor: Tuple[int, int]) -> str:
+        row = min(max(cursor[0], 0), max(len(self.rows) - 1, 0))
+        return f"\x1b[{row + 1};{cursor[1] + 1}H"
+
+    def keyframe(self, rows: List[str], top: int, cursor: Tuple[int, int]) -> str:
+        self.rows, self.top, self.cursor = list(rows), top, cursor
+        return KEYFRAME_PREFIX + "\r\n".join(rows) + self.move_cursor(cursor)
+
+    def frame(self, rows: List[str], top: int, cursor: Tuple[int, int]) -> str:
+        """Scrolls by however many lines the screen top moved, then rewrites the rows that still differ."""
+        if self.top is None or len(rows) != len(self.rows) or not 0 <= top - self.top < len(rows):
+            return self.keyframe(rows, top, cursor)
+
+        parts = []
+        shift = top - self.top
+        previous = self.rows
+        if shift:
+            parts.append(f"\x1b[{len(rows)};1H" + "\n" * shift)
+            previous = previous[shift:] + [""] * shift
+
+        for i, (old, new) in enumerate(zip(previous, rows)):
+            if old != new:
+                parts.append(f"\x1b[{i + 1};1H\x1b[2K{new}")
+
+        self.rows, self.top = list(rows), top
+        if parts or cursor != self.cursor:
+            parts.append(self.move_cursor(cursor))
+        self.cursor = cursor
+        return "".join(parts)
+
+class CastIndex:
+    """Recording times and file offsets of the frames playback can start from, plus the total duration."""
+
+    def __init__(self, start_offset: int):
+        self.times: List[float] = [0.0]
+        self.offsets: List[int] = [start_offset]
+        self.duration = 0.0
+
+    def add(self, elapsed: float, offset: int):
+        if elapsed > self.times[-1]:
+            self.times.append(elapsed)
+            self.offsets.append(offset)
+
+    def seek(self, position: float) -> Tuple[float, int]:
+        i = bisect_right(self.times, position) - 1
+        return (self.times[i], self.offsets[i])
+
+def build_index(path: str) -> Tuple[dict, CastIndex]:
+    """Scans a recording once; only lines that can be keyframes are decoded, so multi-hour files index quickly."""
+    with open(path, 'rb') as stream:
+        header = read_header(stream)
+        index = CastIndex(stream.tell())
+        last_line = b""
+        while True:
+            offset = stream.tell()
+            line = stream.readline()
+            if not line.endswith(b"\n"):
+                break
+            last_line = line
+            if ESCAPED_KEYFRAME_PREFIX in line:
+                try:
+                    elapsed, code, data = json.loads(line)
+                except (ValueError, TypeError):
+                    continue
+                if code == "o" and data.startswith(KEYFRAME_PREFIX):
+                    index.add(float(elapsed), offset)
+
+        try:
+            index.duration = float(json.loads(last_line)[0]) if last_line else 0.0
+        except (ValueError, TypeError, IndexError):
+            index.duration = index.times[-1]
+    return (header, index)
@@ -2,9 +2,14 @@
 
 from typing import Dict
 from typing import Optional
+import pulse_ssh.AgentKeys as _agent_keys
 import pulse_ssh.data.AppConfig as _app_config
 import pulse_ssh.data.Cluster as _cluster
+import pulse_ssh.data.ConfigShard as _config_shard
 import pulse_ssh.data.Connection as _connection
+import pulse_ssh.PortAllocator as _port_allocator
+import pulse_ssh.Prewarm as _prewarm
+import pulse_ssh.Resolver as _resolver
 
 __version__ = "0.0.1"
 about_info = {
@@ -15,9 +20,18 @@ about_info = {
     "version": __version__,
     "website": "https://github.com/PulseSSH/PulseSSH.git"
 }
+agent_keys: _agent_keys.AgentKeyManager = _agent_keys.AgentKeyManager()
 app_config: _app_config.AppConfig = _app_config.AppConfig()
+app_config_version: int = 0
 clusters: Dict[str, _cluster.Cluster] = {}
 config_dir: str = ""
+config_shards: Dict[str, _config_shard.ConfigShard] = {}
+connection_versions: Dict[str, int] = {}
 connections: Dict[str, _connection.Connection] = {}
 encryption_key: Optional[bytes] = None
+port_allocator: _port_allocator.PortAllocator = _port_allocator.PortAllocator()
+prewarm: _prewarm.PrewarmPool = _prewarm.PrewarmPool()
 readonly: bool = False
+resolver: _resolver.ResolverCache = _resolver.ResolverCache()
+settings_conflict_path: Optional[str] = None
+settings_hash: Optional[str] = None
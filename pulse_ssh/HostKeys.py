@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from functools import lru_cache
+import base64
+import hashlib
+import hmac
+import os
+import re
+import shlex
+import subprocess
+import tempfile
+
+SCAN_CONCURRENCY = 16
+SCAN_TIMEOUT = 5
+USER_KNOWN_HOSTS = os.path.join("~", ".ssh", "known_hosts")
+GLOBAL_KNOWN_HOSTS = os.path.join("/etc", "ssh", "ssh_known_hosts")
+
+def host_pattern(host: str, port: int) -> str:
+    """Returns the name ssh looks up in known_hosts: host for port 22, [host]:port otherwise."""
+    return host if int(port) == 22 else f"[{host}]:{port}"
+
+def load_known_hosts(paths: Iterable[str] = (USER_KNOWN_HOSTS, GLOBAL_KNOWN_HOSTS)) -> List[str]:
+    """Returns the host field of every usable known_hosts line."""
+    host_fields = []
+    for path in paths:
+        try:
+            with open(os.path.expanduser(path), 'r', errors='replace') as f:
+                for line in f:
+                    parts = line.split()
+                    if not parts or parts[0].startswith('#'):
+                        continue
+                    if parts[0].startswith('@'):
+                        if parts[0] != "@cert-authority" or len(parts) < 2:
+                            continue
+                        parts = parts[1:]
+                    host_fields.append(parts[0])
+        except OSError:
+            continue
+    return host_fields
+
+@lru_cache(maxsize=4096)
+def compile_host_pattern(pattern: str) -> re.Pattern:
+    """Translates a known_hosts pattern where only * and ? are wildcards; brackets in [host]:port stay literal."""
+    return re.compile("".join(".*" if c == "*" else "." if c == "?" else re.escape(c) for c in pattern))
+
+def is_host_known(host: str, port: int, host_fields: List[str]) -> bool:
+    name = host_pattern(host, port)
+    for host_field in host_fields:
+        if host_field.startswith("|1|"):
+            try:
+                _, _, salt, digest = host_field.split("|", 3)
+                expected = hmac.new(base64.b64decode(salt), name.encode('utf-8'), hashlib.sha1).digest()
+                if hmac.compare_digest(expected, base64.b64decode(digest)):
+                    return True
+            except ValueError:
+                pass
+            continue
+
+        matched = False
+        for pattern in host_field.split(','):
+            negated = pattern.startswith('!')
+            if compile_host_pattern(pattern.lstrip('!')).fullmatch(name):
+                if negated:
+                    matched = False
+                    break
+                matched = True
+        if matched:
+            return True
+    return False
+
+def fingerprint(key_b64: str) -> str:
+    digest = hashlib.sha256(base64.b64decode(key_b64)).digest()
+    return "SHA256:" + base64.b64encode(digest).decode('ascii').rstrip('=')
+
+def parse_keyscan(output: str) -> List[tuple[str, str]]:
+    keys = []
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) >= 3 and not parts[0].startswith('#'):
+            keys.append((parts[1], parts[2]))
+    return keys
+
+def run_keyscan(argv: List[str], timeout: int) -> List[tuple[str, str]]:
+    try:
+        result = subprocess.run(argv, stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=timeout)
+    except (OSError, subprocess.SubprocessError):
+        return []
+    return parse_keyscan(result.stdout)
+
+def scan_host(host: str, port: int) -> List[tuple[str, str]]:
+    """Returns (key type, base64 key) pairs offered by host, or an empty list if it could not be reached."""
+    return run_keyscan(["ssh-keyscan", "-T", str(SCAN_TIMEOUT), "-p", str(port), host], SCAN_TIMEOUT * 3)
+
+def scan_host_via_jump(host: str, port: int, jump_argv: List[str], jump_entries: Optional[Dict[tuple[str, int], List[tuple[str, str]]]] = None) -> List[tuple[str, str]]:
+    """Runs ssh-keyscan on the jump host, which reaches host the way ssh -J does; jump_entries pins a jump host not yet in known_hosts to its just-scanned keys."""
+    options = ["-o", "BatchMode=yes", "-o", f"ConnectTimeout={SCAN_TIMEOUT}"]
+    remote = ["ssh-keyscan", "-T", str(SCAN_TIMEOUT), "-p", str(port), shlex.quote(host)]
+    if jump_entries is None:
+        return run_keyscan(jump_argv[:-1] + options + jump_argv[-1:] + remote, SCAN_TIMEOUT * 4)
+
+    with tempfile.NamedTemporaryFile('w', prefix="pulse_ssh_known_hosts_") as f:
+        f.write("".join(known_hosts_lines(jump_entries)))
+        f.flush()
+        options += ["-o", f"UserKnownHostsFile={f.name}", "-o", "GlobalKnownHostsFile=/dev/null", "-o", "StrictHostKeyChecking=yes"]
+        return run_keyscan(jump_argv[:-1] + options + jump_argv[-1:] + remote, SCAN_TIMEOUT * 4)
+
+def scan_hosts(targets: Iterable[tuple[str, int]], concurrency: int = SCAN_CONCURRENCY) -> Dict[tuple[str, int], List[tuple[str, str]]]:
+    targets = list(dict.fromkeys(targets))
+    if not targets:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(targets)))) as pool:
+        return dict(zip(targets, pool.map(lambda target: scan_host(*target), targets)))
+
+def scan_hosts_via_jumps(targets: Dict[tuple[str, int], tuple[List[str], Optional[Dict[tuple[str, int], List[tuple[str, str]]]]]], concurrency: int = SCAN_CONCURRENCY) -> Dict[tuple[str, int], List[tuple[str, str]]]:
+    """Scans each target through its (jump ssh command, pinned jump keys) pair."""
+    if not targets:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(targets)))) as pool:
+        return dict(zip(targets, pool.map(lambda target: scan_host_via_jump(*target, *targets[target]), targets)))
+
+def known_hosts_lines(entries: Dict[tuple[str, int], List[tuple[str, str]]]) -> List[str]:
+    lines = []
+    for (host, port), keys in entries.items():
+        for key_type, key in keys:
+            lines.append(f"{host_pattern(host, port)} {key_type} {key}\n")
+    return lines
+
+def append_known_hosts(entries: Dict[tuple[str, int], List[tuple[str, str]]], path: str = USER_KNOWN_HOSTS):
+    """Appends every approved key to known_hosts in a single write."""
+    lines = known_hosts_lines(entries)
+    if not lines:
+        return
+
+    path = os.path.expanduser(path)
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o600)
+    with os.fdopen(fd, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                lines.insert(0, "\n")
+        f.write("".join(lines).encode('utf-8'))
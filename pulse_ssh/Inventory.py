@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+from typing import Dict
+from typing import List
+import json
+import os
+import pulse_ssh.data.Cluster as _cluster
+import pulse_ssh.data.Connection as _connection
+import pulse_ssh.Utils as _utils
+import pulse_ssh.data.ConfigDiff as _config_diff
+import subprocess
+import uuid
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+INVENTORY_NAMESPACE = uuid.UUID("5f0c9a52-6a43-4c1e-9d1b-2f6a8d0f7c31")
+COMMAND_TIMEOUT = 60
+
+def stable_key(entry: dict) -> str:
+    """Returns the uuid of an inventory entry, deriving one from its folder and name if absent."""
+    if entry.get('uuid'):
+        return str(entry['uuid'])
+    folder = (entry.get('folder') or "").strip('/')
+    return str(uuid.uuid5(INVENTORY_NAMESPACE, f"{folder}/{entry.get('name', '')}"))
+
+def read_inventory_source(source: str, is_command: bool) -> dict:
+    """Reads an inventory from a JSON/YAML file or from the JSON stdout of a command."""
+    if is_command:
+        result = subprocess.run(source, shell=True, capture_output=True, text=True, timeout=COMMAND_TIMEOUT)
+        if result.returncode != 0:
+            raise ValueError(f"Inventory command exited with status {result.returncode}: {result.stderr.strip()}")
+        data = json.loads(result.stdout or "{}")
+    else:
+        path = os.path.expanduser(source)
+        with open(path, 'r') as f:
+            if path.endswith(('.yaml', '.yml')):
+                if yaml is None:
+                    raise ValueError("PyYAML is required to read YAML inventories")
+                try:
+                    data = yaml.safe_load(f)
+                except yaml.YAMLError as e:
+                    raise ValueError(f"Invalid YAML inventory: {e}")
+            else:
+                data = json.load(f)
+
+    if isinstance(data, list):
+        data = {'connections': data}
+    if not isinstance(data, dict):
+        raise ValueError("Inventory must be a list of connections or an object with 'connections' and 'clusters'")
+    return data
+
+def parse_inventory(data: dict) -> tuple[Dict[str, _connection.Connection], Dict[str, _cluster.Cluster]]:
+    connections_ = {}
+    clusters_ = {}
+
+    afields = _utils.dataclass_field_names(_connection.Connection)
+    for tmp_data in data.get('connections') or []:
+        if not isinstance(tmp_data, dict) or not tmp_data.get('name'):
+            continue
+        filtered = {k: v for k, v in tmp_data.items() if k in afields}
+        filtered['uuid'] = stable_key(tmp_data)
+        filtered['inventory_managed'] = True
+        connections_[filtered['uuid']] = _connection.Connection(**filtered)
+
+    afields = _utils.dataclass_field_names(_cluster.Cluster)
+    for tmp_data in data.get('clusters') or []:
+        if not isinstance(tmp_data, dict) or not tmp_data.get('name'):
+            continue
+        filtered = {k: v for k, v in tmp_data.items() if k in afields}
+        filtered['uuid'] = stable_key(tmp_data)
+        filtered['inventory_managed'] = True
+        clusters_[filtered['uuid']] = _cluster.Cluster(**filtered)
+
+    return (connections_, clusters_)
+
+def drop_uuid_collisions(incoming: dict, current: dict) -> List[str]:
+    """Removes incoming entries whose uuid belongs to an entry not managed by the inventory and returns their names."""
+    colliding = [key for key in incoming if key in current and not current[key].inventory_managed]
+    return [incoming.pop(key).name for key in colliding]
+
+def load_inventory_diff(source: str, is_command: bool, current_connections: Dict[str, _connection.Connection], current_clusters: Dict[str, _cluster.Cluster]) -> _config_diff.ConfigDiff:
+    data = read_inventory_source(source, is_command)
+    incoming_connections, incoming_clusters = parse_inventory(data)
+    skipped = drop_uuid_collisions(incoming_connections, current_connections) + drop_uuid_collisions(incoming_clusters, current_clusters)
+    diff = _utils.diff_app_config(current_connections, current_clusters, incoming_connections, incoming_clusters, only_inventory_managed=True)
+    diff.skipped = skipped
+    return diff
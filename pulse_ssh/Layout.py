@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+
+from dataclasses import replace
+from typing import Iterator
+from typing import List
+from typing import Optional
+import math
+import pulse_ssh.data.LayoutNode as _layout_node
+import pulse_ssh.Utils as _utils
+
+MODES = ('grid', 'rows', 'columns')
+
+def leaf(terminal_id: str, conn_uuid: Optional[str] = None, cluster_id: Optional[str] = None, cluster_name: Optional[str] = None) -> _layout_node.LayoutNode:
+    return _layout_node.LayoutNode(terminal_id=terminal_id, conn_uuid=conn_uuid, cluster_id=cluster_id, cluster_name=cluster_name)
+
+def split(mode: str, children: List[_layout_node.LayoutNode], columns: Optional[int] = None) -> _layout_node.LayoutNode:
+    return _layout_node.LayoutNode(mode=mode, columns=columns, children=children)
+
+def iter_leaves(node: _layout_node.LayoutNode) -> Iterator[_layout_node.LayoutNode]:
+    if node.is_leaf():
+        yield node
+        return
+    for child in node.children:
+        yield from iter_leaves(child)
+
+def best_grid_columns(n_panes: int, width: float, height: float) -> int:
+    """Returns the column count whose cells are closest to square, preferring grids without a short last row."""
+    best_overall_cols = 1
+    max_overall_squareness = -1
+    best_perfect_cols = 0
+    max_perfect_squareness = -1
+
+    for c in range(1, n_panes + 1):
+        r = math.ceil(n_panes / c)
+        cell_w = width / c
+        cell_h = height / r
+        if cell_w == 0 or cell_h == 0:
+            continue
+
+        squareness = min(cell_w, cell_h) / max(cell_w, cell_h)
+        if c * r == n_panes and squareness > max_perfect_squareness:
+            max_perfect_squareness = squareness
+            best_perfect_cols = c
+        if squareness > max_overall_squareness:
+            max_overall_squareness = squareness
+            best_overall_cols = c
+
+    return best_perfect_cols if best_perfect_cols > 0 else best_overall_cols
+
+def normalize(node: Optional[_layout_node.LayoutNode]) -> Optional[_layout_node.LayoutNode]:
+    """Drops empty splits, collapses one-child splits and merges rows into rows and columns into columns."""
+    if node is None or node.is_leaf():
+        return node
+
+    children = []
+    merged = False
+    for child in node.children:
+        child = normalize(child)
+        if child is None:
+            continue
+        if not child.is_leaf() and child.mode == node.mode and node.mode != 'grid':
+            children.extend(child.children)
+            merged = True
+        else:
+            children.append(child)
+
+    if not children:
+        return None
+    if len(children) == 1:
+        return children[0]
+    if merged or len(children) != len(node.children):
+        return replace(node, children=children, row_ratios=[], column_ratios=[])
+    return replace(node, children=children)
+
+def rebalance(node: _layout_node.LayoutNode) -> _layout_node.LayoutNode:
+    """Gives every pane of every split an equal share again."""
+    if node.is_leaf():
+        return node
+    return replace(node, row_ratios=[], column_ratios=[], children=[rebalance(child) for child in node.children])
+
+def tabs_to_grid(tabs: List[_layout_node.LayoutNode], columns: Optional[int] = None) -> Optional[_layout_node.LayoutNode]:
+    """Gathers the panes of several tabs into one grid."""
+    leaves = [pane for tab in tabs for pane in iter_leaves(tab)]
+    if not leaves:
+        return None
+    if len(leaves) == 1:
+        return leaves[0]
+    return split('grid', leaves, columns)
+
+def grid_to_tabs(node: _layout_node.LayoutNode) -> List[_layout_node.LayoutNode]:
+    """Splits a layout into one tab per pane."""
+    return list(iter_leaves(node))
+
+def swap_panes(node: _layout_node.LayoutNode, first_id: str, second_id: str) -> _layout_node.LayoutNode:
+    """Exchanges the places of two panes, keeping every split shape and ratio."""
+    panes = {pane.terminal_id: pane for pane in iter_leaves(node)}
+    if first_id not in panes or second_id not in panes:
+        return node
+    swapped = {first_id: panes[second_id], second_id: panes[first_id]}
+
+    def _swap(current: _layout_node.LayoutNode) -> _layout_node.LayoutNode:
+        if current.is_leaf():
+            return swapped.get(current.terminal_id, current)
+        return replace(current, children=[_swap(child) for child in current.children])
+
+    return _swap(node)
+
+def remove_pane(node: _layout_node.LayoutNode, terminal_id: str) -> Optional[_layout_node.LayoutNode]:
+    def _remove(current: _layout_node.LayoutNode) -> Optional[_layout_node.LayoutNode]:
+        if current.is_leaf():
+            return None if current.terminal_id == terminal_id else current
+        children = [child for child in (_remove(child) for child in current.children) if child]
+        return replace(current, children=children)
+    return normalize(_remove(node))
+
+def layout_to_dict(node: _layout_node.LayoutNode) -> dict:
+    data = _utils.to_sparse_dict(replace(node, children=[]))
+    data.pop('terminal_id', None)
+    if node.children:
+        data['children'] = [layout_to_dict(child) for child in node.children]
+    return data
+
+def layout_from_dict(data: dict) -> Optional[_layout_node.LayoutNode]:
+    """Rebuilds a layout saved by layout_to_dict; unknown modes and leaves without a connection are dropped."""
+    if not isinstance(data, dict):
+        return None
+    node = _utils.from_sparse_dict(_layout_node.LayoutNode, {k: v for k, v in data.items() if k != 'children'})
+    if node.is_leaf():
+        return node if node.conn_uuid else None
+    if node.mode not in MODES:
+        return None
+    node.children = [child for child in (layout_from_dict(child) for child in data.get('children') or []) if child]
+    return normalize(node)
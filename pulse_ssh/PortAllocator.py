@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+from typing import Dict
+from typing import Optional
+from typing import Set
+import socket
+import threading
+
+DEFAULT_RANGE_START = 20000
+DEFAULT_RANGE_END = 20999
+
+class PortAllocator:
+    """Hands out SOCKS proxy ports from a fixed range and remembers which terminal, by id, owns each one."""
+
+    def __init__(self, range_start: int = DEFAULT_RANGE_START, range_end: int = DEFAULT_RANGE_END):
+        self.lock = threading.Lock()
+        self.range_start = range_start
+        self.range_end = range_end
+        self.next_port = range_start
+        self.port_owners: Dict[int, Optional[str]] = {}
+        self.port_holders: Dict[int, Set[str]] = {}
+        self.owner_ports: Dict[str, int] = {}
+        self.shared_ports: Dict[str, int] = {}
+
+    def configure(self, range_start: int, range_end: int):
+        with self.lock:
+            if range_end < range_start:
+                range_start, range_end = range_end, range_start
+            if (range_start, range_end) == (self.range_start, self.range_end):
+                return
+            self.range_start = range_start
+            self.range_end = range_end
+            self.next_port = range_start
+
+    def acquire(self, owner: str, share_key: Optional[str] = None) -> tuple[int, bool]:
+        """Returns (port, carrier); carrier is False when the owner joins a proxy another terminal already runs."""
+        with self.lock:
+            self._release(owner)
+
+            if share_key is not None and share_key in self.shared_ports:
+                port = self.shared_ports[share_key]
+                self.port_holders[port].add(owner)
+                self.owner_ports[owner] = port
+                if self.port_owners[port] is None:
+                    self.port_owners[port] = owner
+                    return (port, True)
+                return (port, False)
+
+            port = self._reserve()
+            self.port_owners[port] = owner
+            self.port_holders[port] = {owner}
+            self.owner_ports[owner] = port
+            if share_key is not None:
+                self.shared_ports[share_key] = port
+            return (port, True)
+
+    def release(self, owner: str):
+        with self.lock:
+            self._release(owner)
+
+    def owner_of(self, port: int) -> Optional[str]:
+        """Returns the terminal running the proxy on port, or None when its carrier left and the sharers wait for a new one."""
+        with self.lock:
+            return self.port_owners.get(port)
+
+    def leases(self) -> Dict[int, Optional[str]]:
+        with self.lock:
+            return dict(self.port_owners)
+
+    def _release(self, owner: str):
+        """Drops owner from its port; a shared port stays reserved until its last sharer leaves, and the next one to join carries it."""
+        port = self.owner_ports.pop(owner, None)
+        if port is None:
+            return
+
+        holders = self.port_holders[port]
+        holders.discard(owner)
+        if self.port_owners[port] == owner:
+            self.port_owners[port] = None
+        if holders:
+            return
+
+        del self.port_holders[port]
+        del self.port_owners[port]
+        for key, shared_port in list(self.shared_ports.items()):
+            if shared_port == port:
+                del self.shared_ports[key]
+
+    def _reserve(self) -> int:
+        size = self.range_end - self.range_start + 1
+        for _ in range(size):
+            port = self.next_port
+            self.next_port = self.range_start if port >= self.range_end else port + 1
+            if port not in self.port_holders and is_port_available(port):
+                return port
+        raise RuntimeError(f"No free SOCKS proxy port left in {self.range_start}-{self.range_end}")
+
+def is_port_available(port: int) -> bool:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        try:
+            s.bind(('localhost', port))
+        except OSError:
+            return False
+        return True
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+from typing import Dict
+from typing import List
+from typing import Optional
+import os
+import pulse_ssh.data.PrewarmedMaster as _prewarmed_master
+import shlex
+import subprocess
+import tempfile
+import threading
+import time
+
+DEFAULT_MAX_MASTERS = 4
+DEFAULT_IDLE_TIMEOUT = 120
+MASTER_START_TIMEOUT = 30
+MASTER_EXIT_TIMEOUT = 5
+
+class PrewarmPool:
+    """Keeps a few background ssh ControlMaster connections open for hosts the user is about to open."""
+
+    def __init__(self, max_masters: int = DEFAULT_MAX_MASTERS, idle_timeout: int = DEFAULT_IDLE_TIMEOUT):
+        self.lock = threading.Lock()
+        self.max_masters = max_masters
+        self.idle_timeout = idle_timeout
+        self.ssh_path = "ssh"
+        self.masters: Dict[str, _prewarmed_master.PrewarmedMaster] = {}
+
+    def configure(self, max_masters: int, idle_timeout: int, ssh_path: str = "ssh"):
+        with self.lock:
+            self.max_masters = max(1, max_masters)
+            self.idle_timeout = max(1, idle_timeout)
+            self.ssh_path = ssh_path
+
+    def get_socket_dir(self) -> str:
+        base_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+        socket_dir = os.path.join(base_dir, f"pulse_ssh-{os.getuid()}")
+        os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+        return socket_dir
+
+    def is_warm(self, key: str) -> bool:
+        with self.lock:
+            self._prune(time.monotonic())
+            return key in self.masters
+
+    def start_master(self, key: str, argv: List[str], env: Dict[str, str]) -> bool:
+        """Opens a master for argv (an ssh command ending with its destination) unless one is already up; blocks until it authenticated."""
+        now = time.monotonic()
+        evicted = []
+        with self.lock:
+            self._prune(now)
+            if key in self.masters:
+                return self.masters[key].ready
+
+            unused = sorted((m for m in self.masters.items() if not m[1].attached), key=lambda m: m[1].started_at)
+            while unused and len(unused) >= self.max_masters:
+                evicted_key, master = unused.pop(0)
+                del self.masters[evicted_key]
+                evicted.append(master)
+
+            master = _prewarmed_master.PrewarmedMaster(os.path.join(self.get_socket_dir(), key), now)
+            self.masters[key] = master
+            idle_timeout = self.idle_timeout
+
+        for old_master in evicted:
+            self._exit_master(old_master)
+
+        cmd = argv[:-1] + ['-M', '-N', '-o', f"ControlPath={master.control_path}", '-o', f"ControlPersist={idle_timeout}"] + argv[-1:]
+        try:
+            result = subprocess.run(
+                cmd, env={**os.environ, **env},
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                start_new_session=True, timeout=MASTER_START_TIMEOUT
+            )
+            ready = result.returncode == 0 and os.path.exists(master.control_path)
+        except (OSError, subprocess.SubprocessError):
+            ready = False
+
+        with self.lock:
+            if self.masters.get(key) is not master:
+                ready = False
+            elif ready:
+                master.ready = True
+            else:
+                del self.masters[key]
+        return ready
+
+    def attach(self, key: str) -> Optional[str]:
+        """Returns the control socket of a ready master for key and marks it as used, or None."""
+        with self.lock:
+            self._prune(time.monotonic())
+            master = self.masters.get(key)
+            if not master or not master.ready:
+                return None
+            master.attached = True
+            return master.control_path
+
+    def close_connection(self, conn_uuid: str):
+        """Drops every master of an edited or removed connection; unused ones exit, attached ones end with their sessions."""
+        with self.lock:
+            masters = [self.masters.pop(key) for key in list(self.masters) if key.startswith(f"{conn_uuid}-")]
+        for master in masters:
+            if not master.attached:
+                self._exit_master(master)
+
+    def close(self):
+        """Closes every master no terminal attached to; attached ones end on their own once their sessions do."""
+        with self.lock:
+            unused = [master for master in self.masters.values() if not master.attached]
+            self.masters.clear()
+        for master in unused:
+            self._exit_master(master)
+
+    def _prune(self, now: float):
+        for key, master in list(self.masters.items()):
+            if not master.ready:
+                continue
+            if not os.path.exists(master.control_path) or (not master.attached and now - master.started_at > self.idle_timeout):
+                del self.masters[key]
+
+    def _exit_master(self, master: _prewarmed_master.PrewarmedMaster):
+        if not master.ready or not os.path.exists(master.control_path):
+            return
+        try:
+            subprocess.run(
+                shlex.split(self.ssh_path) + ['-o', f"ControlPath={master.control_path}", '-O', 'exit', 'pulse_ssh'],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=MASTER_EXIT_TIMEOUT
+            )
+        except (OSError, subprocess.SubprocessError):
+            pass
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+import asyncio
+import ipaddress
+import itertools
+import pulse_ssh.data.ProbeResult as _probe_result
+import socket
+import threading
+import time
+
+GLOBAL_CONCURRENCY = 256
+SUBNET_CONCURRENCY = 16
+PROBE_TIMEOUT = 3.0
+BANNER_MAX_BYTES = 256
+
+PRIORITY_VISIBLE = 0
+PRIORITY_EXPANDED = 1
+PRIORITY_BACKGROUND = 2
+
+def subnet_key(address: str) -> str:
+    """Groups addresses by /24 (IPv4) or /64 (IPv6) so one network segment is never flooded."""
+    ip = ipaddress.ip_address(address.split('%', 1)[0])
+    prefix = 24 if ip.version == 4 else 64
+    return str(ipaddress.ip_network(f"{ip}/{prefix}", strict=False))
+
+class ReachabilityProber:
+    """Runs TCP (and optionally SSH banner) probes on a private asyncio loop and caches the results for ttl seconds."""
+
+    def __init__(self, on_result: Callable[[tuple[str, int], _probe_result.ProbeResult], None], ttl: float = 60, read_banner: bool = False):
+        self.on_result = on_result
+        self.ttl = ttl
+        self.read_banner = read_banner
+        self.results: Dict[tuple[str, int], _probe_result.ProbeResult] = {}
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+        self.queue: Optional[asyncio.PriorityQueue] = None
+        self.pending: Dict[tuple[str, int], int] = {}
+        self.in_progress = set()
+        self.subnet_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.sequence = itertools.count()
+
+    def start(self):
+        if self.thread:
+            return
+        ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(ready,), daemon=True)
+        self.thread.start()
+        ready.wait()
+
+    def stop(self):
+        if not self.thread:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.thread = None
+        self.loop = None
+        self.pending.clear()
+        self.in_progress.clear()
+        self.subnet_semaphores.clear()
+
+    def configure(self, ttl: float, read_banner: bool):
+        if read_banner != self.read_banner:
+            self.results.clear()
+        self.ttl = ttl
+        self.read_banner = read_banner
+
+    def get(self, target: tuple[str, int]) -> Optional[_probe_result.ProbeResult]:
+        return self.results.get(target)
+
+    def is_fresh(self, target: tuple[str, int]) -> bool:
+        result = self.results.get(target)
+        return result is not None and time.monotonic() - result.checked_at < self.ttl
+
+    def request(self, targets: Iterable[tuple[str, int]], priority: int = PRIORITY_BACKGROUND):
+        """Queues probes for targets without fresh results; safe to call from any thread."""
+        if not self.loop:
+            return
+        targets = [target for target in targets if not self.is_fresh(target)]
+        if targets:
+            self.loop.call_soon_threadsafe(self._enqueue, targets, priority)
+
+    def _run(self, ready: threading.Event):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.queue = asyncio.PriorityQueue()
+        workers = [self.loop.create_task(self._worker()) for _ in range(GLOBAL_CONCURRENCY)]
+        ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            self.loop.run_until_complete(asyncio.gather(*workers, return_exceptions=True))
+            self.loop.close()
+
+    def _enqueue(self, targets, priority: int):
+        for target in targets:
+            if target in self.in_progress or self.is_fresh(target):
+                continue
+            queued = self.pending.get(target)
+            if queued is not None and queued <= priority:
+                continue
+            self.pending[target] = priority
+            self.queue.put_nowait((priority, next(self.sequence), target))
+
+    async def _worker(self):
+        while True:
+            priority, _, target = await self.queue.get()
+            if self.pending.get(target) != priority:
+                continue
+            del self.pending[target]
+            if self.is_fresh(target):
+                continue
+
+            self.in_progress.add(target)
+            try:
+                result = await self._probe(*target)
+            finally:
+                self.in_progress.discard(target)
+            self.results[target] = result
+            self.on_result(target, result)
+
+    async def _probe(self, host: str, port: int) -> _probe_result.ProbeResult:
+        start = time.monotonic()
+        try:
+            infos = await asyncio.wait_for(self.loop.getaddrinfo(host, port, type=socket.SOCK_STREAM), PROBE_TIMEOUT)
+            address = infos[0][4][0]
+            semaphore = self.subnet_semaphores.setdefault(subnet_key(address), asyncio.Semaphore(SUBNET_CONCURRENCY))
+            async with semaphore:
+                start = time.monotonic()
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(address, port), PROBE_TIMEOUT)
+                latency = time.monotonic() - start
+                banner = None
+                try:
+                    if self.read_banner:
+                        line = await asyncio.wait_for(reader.readline(), PROBE_TIMEOUT)
+                        banner = line[:BANNER_MAX_BYTES].decode('utf-8', 'replace').strip() or None
+                finally:
+                    writer.close()
+            return _probe_result.ProbeResult(True, time.monotonic(), latency, banner)
+        except (OSError, ValueError, asyncio.TimeoutError) as e:
+            return _probe_result.ProbeResult(False, time.monotonic(), error=str(e) or type(e).__name__)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+from typing import Dict
+from typing import List
+from typing import Optional
+import ipaddress
+import random
+import time
+
+def backoff_delay(attempt: int, initial: float, maximum: float, rng: random.Random = random) -> float:
+    """Returns a delay in seconds for the given 0-based attempt: half of min(maximum, initial * 2^attempt) plus up to as much jitter."""
+    ceiling = min(float(maximum), initial * (2 ** min(attempt, 32)))
+    return ceiling / 2 + rng.uniform(0, ceiling / 2)
+
+def failure_domain(first_hop: Optional[str], via_jump: bool, address: Optional[str]) -> Optional[str]:
+    """Groups connections that fail together: everything behind a jump host, or the /24 (/64 for IPv6) of a direct host."""
+    if via_jump:
+        return f"via {first_hop}" if first_hop else None
+    if address:
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return first_hop
+        return str(ipaddress.ip_network(f"{ip}/{24 if ip.version == 4 else 64}", strict=False))
+    return first_hop
+
+class BreakerState:
+    def __init__(self):
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_started_at: Optional[float] = None
+
+class CircuitBreaker:
+    """Stops reconnects to a failure domain after consecutive failures, then lets a single trial through per cooldown."""
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.domains: Dict[str, BreakerState] = {}
+
+    def is_open(self, domain: Optional[str]) -> bool:
+        state = self.domains.get(domain) if domain else None
+        return bool(state and state.opened_at is not None)
+
+    def get_open_domains(self) -> List[str]:
+        return [domain for domain, state in self.domains.items() if state.opened_at is not None]
+
+    def acquire(self, domain: Optional[str], now: Optional[float] = None) -> float:
+        """Returns 0 when a reconnect to domain may start now, otherwise the seconds to wait before asking again."""
+        state = self.domains.get(domain) if domain else None
+        if not state or state.opened_at is None or self.threshold <= 0:
+            return 0.0
+
+        now = time.monotonic() if now is None else now
+        remaining = state.opened_at + self.cooldown - now
+        if remaining > 0:
+            return remaining
+        if state.trial_started_at is not None and now - state.trial_started_at < self.cooldown:
+            return state.trial_started_at + self.cooldown - now
+        state.trial_started_at = now
+        return 0.0
+
+    def record_failure(self, domain: Optional[str], now: Optional[float] = None):
+        if not domain:
+            return
+        now = time.monotonic() if now is None else now
+        state = self.domains.setdefault(domain, BreakerState())
+        state.failures += 1
+        state.trial_started_at = None
+        if self.threshold > 0 and (state.failures >= self.threshold or state.opened_at is not None):
+            state.opened_at = now
+
+    def record_success(self, domain: Optional[str]):
+        if domain:
+            self.domains.pop(domain, None)
+
+    def clear(self):
+        self.domains.clear()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+import ipaddress
+import pulse_ssh.data.ResolvedHost as _resolved_host
+import socket
+import threading
+import time
+
+try:
+    import dns.exception
+    import dns.resolver
+except ImportError:
+    dns = None
+
+RESOLVER_THREADS = 32
+MIN_TTL = 5
+NEGATIVE_TTL = 30
+
+def is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+def record_ttl(host: str, address: str, default_ttl: int) -> int:
+    """Returns the DNS TTL of the record that holds address, or default_ttl when it came from /etc/hosts or another nsswitch source."""
+    if dns is None:
+        return default_ttl
+    try:
+        ip = ipaddress.ip_address(address)
+        answer = dns.resolver.resolve(host, 'AAAA' if ip.version == 6 else 'A')
+    except (dns.exception.DNSException, OSError, ValueError):
+        return default_ttl
+    if not any(ipaddress.ip_address(record.to_text()) == ip for record in answer):
+        return default_ttl
+    return max(MIN_TTL, answer.rrset.ttl)
+
+def resolve_host(host: str, default_ttl: int) -> tuple[str, int]:
+    """Returns (address, ttl); the address always comes from getaddrinfo, dnspython (when installed) only supplies its TTL."""
+    infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    address = infos[0][4][0]
+    return (address, record_ttl(host, address, default_ttl))
+
+class ResolverCache:
+    """Resolves hostnames on a thread pool and keeps each answer until its TTL runs out."""
+
+    def __init__(self, on_resolved: Optional[Callable[[str, _resolved_host.ResolvedHost], None]] = None, default_ttl: int = 300):
+        self.on_resolved = on_resolved
+        self.default_ttl = default_ttl
+        self.lock = threading.Lock()
+        self.entries: Dict[str, _resolved_host.ResolvedHost] = {}
+        self.in_progress = set()
+        self.executor = ThreadPoolExecutor(max_workers=RESOLVER_THREADS, thread_name_prefix="resolver")
+
+    def lookup(self, host: str) -> Optional[_resolved_host.ResolvedHost]:
+        """Returns the cached answer for host if it is still valid, without ever blocking on DNS."""
+        with self.lock:
+            entry = self.entries.get(host)
+        if entry and entry.expires_at > time.monotonic():
+            return entry
+        return None
+
+    def prefetch(self, hosts: Iterable[str]):
+        now = time.monotonic()
+        with self.lock:
+            pending = []
+            for host in dict.fromkeys(hosts):
+                if not host or is_ip_address(host) or host in self.in_progress:
+                    continue
+                entry = self.entries.get(host)
+                if entry and entry.expires_at > now:
+                    continue
+                self.in_progress.add(host)
+                pending.append(host)
+
+        for host in pending:
+            self.executor.submit(self._resolve, host)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def _resolve(self, host: str):
+        start = time.monotonic()
+        try:
+            address, ttl = resolve_host(host, self.default_ttl)
+            entry = _resolved_host.ResolvedHost(address, time.monotonic() - start, time.monotonic() + ttl)
+        except (OSError, UnicodeError) as e:
+            entry = _resolved_host.ResolvedHost(None, time.monotonic() - start, time.monotonic() + NEGATIVE_TTL, str(e))
+
+        with self.lock:
+            self.entries[host] = entry
+            self.in_progress.discard(host)
+
+        if self.on_resolved:
+            self.on_resolved(host, entry)
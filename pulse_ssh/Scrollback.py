@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import List
+import gzip
+import math
+import os
+import pulse_ssh.data.ScrollbackUsage as _scrollback_usage
+
+# Rough cost of one cell in VTE's scrollback ring: the character plus its share of attribute runs and row records.
+BYTES_PER_CELL = 8
+
+def estimate_bytes(rows: int, columns: int) -> int:
+    return max(0, rows) * max(0, columns) * BYTES_PER_CELL
+
+def kept_rows(usage: _scrollback_usage.ScrollbackUsage) -> int:
+    return usage.rows if usage.limit < 0 else min(usage.rows, usage.limit)
+
+def plan_limits(usages: List[_scrollback_usage.ScrollbackUsage], default_limit: int, budget_bytes: int, min_lines: int, now: float) -> Dict[str, int]:
+    """Returns a scrollback limit per terminal key that fits the budget, shrinking disconnected and then longest-hidden terminals first; visible ones keep the default."""
+    limits = {usage.key: default_limit for usage in usages}
+    def rows_at_default(usage):
+        return usage.rows if default_limit < 0 else min(usage.rows, default_limit)
+
+    total = sum(estimate_bytes(rows_at_default(usage), usage.columns) for usage in usages)
+    if budget_bytes <= 0 or total <= budget_bytes:
+        return limits
+
+    candidates = sorted((usage for usage in usages if not usage.visible), key=lambda usage: (usage.connected, usage.hidden_since if usage.hidden_since is not None else now))
+    for usage in candidates:
+        if total <= budget_bytes:
+            break
+        row_bytes = estimate_bytes(1, usage.columns)
+        current = rows_at_default(usage)
+        if not row_bytes or current <= min_lines:
+            continue
+        keep = max(min_lines, current - math.ceil((total - budget_bytes) / row_bytes))
+        limits[usage.key] = keep
+        total -= (current - keep) * row_bytes
+    return limits
+
+def get_spill_dir() -> str:
+    base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    spill_dir = os.path.join(base_dir, 'pulse_ssh', 'scrollback')
+    os.makedirs(spill_dir, mode=0o700, exist_ok=True)
+    return spill_dir
+
+class SpillWriter:
+    """Appends trimmed scrollback to per-terminal gzip files on a single background thread, so writes stay in order."""
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scrollback-spill")
+
+    def get_path(self, key: str) -> str:
+        return os.path.join(get_spill_dir(), f"{key}.txt.gz")
+
+    def append(self, key: str, text: str):
+        self.executor.submit(self._append, self.get_path(key), text)
+
+    def discard(self, key: str):
+        self.executor.submit(self._discard, self.get_path(key))
+
+    def _append(self, path: str, text: str):
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        with os.fdopen(fd, 'ab') as raw, gzip.GzipFile(fileobj=raw, mode='ab') as f:
+            f.write(text.encode('utf-8'))
+
+    def _discard(self, path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
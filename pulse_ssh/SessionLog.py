@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+import gzip
+import os
+import queue
+import re
+import threading
+import time
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+FLUSH_INTERVAL_SECONDS = 1.0
+BUFFER_LIMIT_BYTES = 256 * 1024
+EXTENSIONS = {'none': '.log', 'gzip': '.log.gz', 'zstd': '.log.zst'}
+WRITE_ERRORS = (OSError, ValueError) + ((zstandard.ZstdError,) if zstandard else ())
+
+def get_default_log_dir() -> str:
+    base_dir = os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share')
+    return os.path.join(base_dir, 'pulse_ssh', 'logs')
+
+def safe_file_name(name: str) -> str:
+    return re.sub(r'[^\w.-]+', '_', name).strip('._') or "session"
+
+def available_compression(compression: str) -> str:
+    """Falls back to gzip when zstd is asked for but the zstandard module is not installed."""
+    if compression == 'zstd' and zstandard is None:
+        return 'gzip'
+    return compression if compression in EXTENSIONS else 'none'
+
+class LogSpec:
+    def __init__(self, directory: str, name: str, compression: str, max_bytes: int, max_age: float, extension: Optional[str] = None):
+        self.directory = directory
+        self.name = name
+        self.compression = available_compression(compression)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.extension = extension or EXTENSIONS[self.compression]
+
+class LogFile:
+    def __init__(self, key: str, spec: LogSpec):
+        self.key = key
+        self.spec = spec
+        self.raw = None
+        self.stream = None
+        self.path: Optional[str] = None
+        self.size = 0
+        self.opened_at = 0.0
+        self.buffer: List[str] = []
+        self.buffered = 0
+
+    def open(self):
+        directory = os.path.join(os.path.expanduser(self.spec.directory), safe_file_name(self.spec.name))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        stem = os.path.join(directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{self.key[:8]}")
+        extension = self.spec.extension
+        path = f"{stem}{extension}"
+        counter = 1
+        while os.path.exists(path):
+            path = f"{stem}.{counter}{extension}"
+            counter += 1
+
+        self.raw = os.fdopen(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), 'wb')
+        if self.spec.compression == 'gzip':
+            self.stream = gzip.GzipFile(fileobj=self.raw, mode='wb')
+        elif self.spec.compression == 'zstd':
+            self.stream = zstandard.ZstdCompressor().stream_writer(self.raw, closefd=False)
+        else:
+            self.stream = self.raw
+        self.path = path
+        self.size = 0
+        self.opened_at = time.monotonic()
+
+    def close(self):
+        if self.stream is not None and self.stream is not self.raw:
+            self.stream.close()
+        if self.raw is not None:
+            self.raw.close()
+        self.raw = None
+        self.stream = None
+
+    def needs_rotation(self) -> bool:
+        if self.stream is None:
+            return True
+        if self.spec.max_bytes > 0 and self.size >= self.spec.max_bytes:
+            return True
+        return self.spec.max_age > 0 and time.monotonic() - self.opened_at >= self.spec.max_age
+
+    def flush(self):
+        if not self.buffer:
+            return
+        data = "".join(self.buffer).encode('utf-8', errors='replace')
+        self.buffer = []
+        self.buffered = 0
+        if self.needs_rotation():
+            self.close()
+            self.open()
+        self.stream.write(data)
+        self.size += len(data)
+        if self.stream is self.raw:
+            self.raw.flush()
+        elif self.spec.compression == 'zstd':
+            self.stream.flush(zstandard.FLUSH_BLOCK)
+        else:
+            self.stream.flush()
+
+class SessionLogWriter:
+    """Buffers session output per log and writes it on one background thread, rotating files by size and age."""
+
+    def __init__(self, on_error: Optional[Callable[[str, str], None]] = None):
+        self.on_error = on_error
+        self.queue = queue.SimpleQueue()
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    def open(self, key: str, spec: LogSpec):
+        self._put(('open', key, spec))
+
+    def write(self, key: str, text: str):
+        self._put(('write', key, text))
+
+    def close(self, key: str):
+        self._put(('close', key, None))
+
+    def shutdown(self, timeout: float = 2.0):
+        with self.lock:
+            thread = self.thread
+            self.thread = None
+        if thread:
+            self.queue.put(('stop', None, None))
+            thread.join(timeout)
+
+    def _put(self, item):
+        with self.lock:
+            if not self.thread:
+                self.thread = threading.Thread(target=self._run, name="session-log", daemon=True)
+                self.thread.start()
+        self.queue.put(item)
+
+    def _run(self):
+        logs: Dict[str, LogFile] = {}
+        next_flush = time.monotonic() + FLUSH_INTERVAL_SECONDS
+        while True:
+            try:
+                op, key, payload = self.queue.get(timeout=max(0.0, next_flush - time.monotonic()))
+            except queue.Empty:
+                op, key, payload = (None, None, None)
+
+            if op == 'open':
+                logs[key] = LogFile(key, payload)
+            elif op == 'write' and key in logs:
+                log = logs[key]
+                log.buffer.append(payload)
+                log.buffered += len(payload)
+                if log.buffered >= BUFFER_LIMIT_BYTES:
+                    self._flush(logs, log)
+            elif op == 'close' and key in logs:
+                self._flush(logs, logs[key])
+                self._close(logs, logs.get(key))
+            elif op == 'stop':
+                for log in list(logs.values()):
+                    self._flush(logs, log)
+                    self._close(logs, logs.get(log.key))
+                return
+
+            if time.monotonic() >= next_flush:
+                for log in list(logs.values()):
+                    self._flush(logs, log)
+                next_flush = time.monotonic() + FLUSH_INTERVAL_SECONDS
+
+    def _flush(self, logs: Dict[str, LogFile], log: LogFile):
+        try:
+            log.flush()
+        except WRITE_ERRORS as e:
+            logs.pop(log.key, None)
+            self._close(logs, log)
+            if self.on_error:
+                self.on_error(log.key, f"{log.path or log.spec.directory}: {e}")
+
+    def _close(self, logs: Dict[str, LogFile], log: Optional[LogFile]):
+        if log is None:
+            return
+        logs.pop(log.key, None)
+        try:
+            log.close()
+        except OSError:
+            pass
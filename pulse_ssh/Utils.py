@@ -4,20 +4,33 @@ from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from dataclasses import MISSING
 from dataclasses import asdict
 from dataclasses import fields
 from typing import Dict
+from typing import List
 from typing import Optional
 import base64
+import functools
+import hashlib
 import json
 import os
 import pulse_ssh.data.AppConfig as _app_config
 import pulse_ssh.data.CacheConfig as _cache_config
 import pulse_ssh.data.Cluster as _cluster
+import pulse_ssh.data.ConfigDiff as _config_diff
+import pulse_ssh.data.ConfigShard as _config_shard
 import pulse_ssh.data.Connection as _connection
+import pulse_ssh.data.LaunchPlan as _launch_plan
+import pulse_ssh.data.SessionTab as _session_tab
 import pulse_ssh.Globals as _globals
+import pulse_ssh.HostKeys as _host_keys
+import pulse_ssh.Reconnect as _reconnect
+import pulse_ssh.Resolver as _resolver
+import re
 import shlex
 import socket
+import urllib.parse
 
 color_iblue = '\x1b[34;1m'
 color_igreen = '\x1b[32;1m'
@@ -40,14 +53,20 @@ substitute_keys = [
     "user",
     "password",
     "identity_file",
-    "key_passphrase",
-    "proxy_port"
+    "key_passphrase"
 ]
 
+template_pattern = re.compile(r"\{\{(?P<escaped>[A-Za-z_][A-Za-z0-9_]*(?::[A-Za-z0-9_]+)?)\}\}|\{(?P<name>[A-Za-z_][A-Za-z0-9_]*(?::[A-Za-z0-9_]+)?)\}")
+
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 ENCRYPTION_CANARY_PLAINTEXT = "d11d1ec3692ce6d554068424915baf630064b457"
 
+SETTINGS_FORMAT_VERSION = 2
+CONFIG_SHARDS_DIR = "connections"
+
+command_plan_cache: Dict[tuple[str, str], tuple[tuple, _launch_plan.LaunchPlan]] = {}
+
 def _derive_key(password: str, salt: bytes) -> bytes:
     """Derives a cryptographic key from a password and salt."""
     kdf = PBKDF2HMAC(
@@ -114,14 +133,19 @@ def decrypt_string(encrypted_text: str) -> Optional[str]:
 
 def decrypt_all_connections() -> bool:
     """Iterates and decrypts all connection passwords and passphrases."""
+    return decrypt_connections(_globals.connections)
+
+def decrypt_connections(connections_: Dict[str, _connection.Connection]) -> bool:
+    """Decrypts the passwords and passphrases of the given connections in place."""
     if not _globals.encryption_key:
         return False
     try:
-        for conn in _globals.connections.values():
+        for conn in connections_.values():
             if conn.password:
                 conn.password = decrypt_string(conn.password)
             if conn.key_passphrase:
                 conn.key_passphrase = decrypt_string(conn.key_passphrase)
+            bump_connection_version(conn.uuid)
         return True
     except (InvalidToken, ValueError, TypeError):
         return False
@@ -159,68 +183,268 @@ def load_themes() -> Dict:
 
     return themes
 
-def load_app_config(config_dir: str) -> tuple[_app_config.AppConfig, Dict[str, _connection.Connection], Dict[str, _cluster.Cluster]]:
-    if config_dir is None:
-        config_dir = os.path.expanduser("~/.config/pulse_ssh")
+@functools.cache
+def dataclass_field_names(cls) -> frozenset[str]:
+    return frozenset(f.name for f in fields(cls))
+
+@functools.cache
+def dataclass_field_defaults(cls) -> tuple:
+    defaults = []
+    for f in fields(cls):
+        if f.default is not MISSING:
+            defaults.append((f.name, f.default))
+        elif f.default_factory is not MISSING:
+            defaults.append((f.name, f.default_factory()))
+        else:
+            defaults.append((f.name, MISSING))
+    return tuple(defaults)
+
+def to_sparse_dict(obj) -> dict:
+    """Serializes a dataclass instance, omitting every field that still holds its default value."""
+    sparse = {}
+    for name, default in dataclass_field_defaults(type(obj)):
+        value = getattr(obj, name)
+        if default is MISSING or value != default:
+            sparse[name] = value
+    return sparse
+
+def from_sparse_dict(cls, data: dict):
+    """Builds a dataclass instance from a (possibly sparse) dict, restoring omitted fields from their defaults."""
+    afields = dataclass_field_names(cls)
+    return cls(**{k: v for k, v in data.items() if k in afields})
+
+def hash_settings(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+def read_settings_hash(cfg_path: str) -> Optional[str]:
+    try:
+        with open(cfg_path, 'rb') as f:
+            return hash_settings(f.read())
+    except OSError:
+        return None
 
-    cfg_path = os.path.join(config_dir, "settings.json")
+def config_shard_key(folder: str) -> str:
+    return (folder or "").split('/')[0]
+
+def config_shard_file(key: str) -> str:
+    name = urllib.parse.quote(key, safe='') if key else "@root"
+    return f"{CONFIG_SHARDS_DIR}/{name}.json"
+
+def connections_digest(connections_: List[_connection.Connection]) -> str:
+    raw = json.dumps([to_sparse_dict(c) for c in connections_]).encode('utf-8')
+    return hash_settings(raw)
+
+def parse_config_shards(data: dict) -> Dict[str, _config_shard.ConfigShard]:
+    shards = {}
+    for tmp_data in data.get('shards') or []:
+        shard = from_sparse_dict(_config_shard.ConfigShard, tmp_data)
+        shards[shard.folder] = shard
+    return shards
+
+def read_config_shard(config_dir: str, shard: _config_shard.ConfigShard) -> Dict[str, _connection.Connection]:
+    try:
+        with open(os.path.join(config_dir, shard.file), 'rb') as f:
+            data = json.loads(f.read()) or {}
+    except FileNotFoundError:
+        return {}
+
+    connections_ = {}
+    for tmp_data in data.get('connections') or []:
+        conn = from_sparse_dict(_connection.Connection, tmp_data)
+        connections_[conn.uuid] = conn
+    return connections_
+
+def read_all_config_shards(config_dir: str, data: dict) -> Dict[str, _connection.Connection]:
+    connections_ = {}
+    for shard in parse_config_shards(data).values():
+        connections_.update(read_config_shard(config_dir, shard))
+    return connections_
+
+def read_config_shards(config_dir: str, keys: Optional[List[str]] = None) -> Dict[str, Dict[str, _connection.Connection]]:
+    """Reads and decrypts the given (or all) unloaded folder shards without marking them loaded, so it can run off the GUI thread."""
+    shards = {}
+    for key in list(_globals.config_shards) if keys is None else keys:
+        shard = _globals.config_shards.get(key)
+        if not shard or shard.loaded:
+            continue
 
+        shard_connections = read_config_shard(config_dir, shard)
+        if _globals.app_config.encryption_enabled:
+            decrypt_connections(shard_connections)
+        shards[key] = shard_connections
+    return shards
+
+def install_config_shards(connections_: Dict[str, _connection.Connection], shards: Dict[str, Dict[str, _connection.Connection]]) -> List[_connection.Connection]:
+    """Marks shards returned by read_config_shards as loaded, adds their connections to connections_ and returns the ones added."""
+    added = []
+    for key, shard_connections in shards.items():
+        shard = _globals.config_shards.get(key)
+        if not shard or shard.loaded:
+            continue
+
+        shard.loaded = True
+        shard.digest = connections_digest(sorted(shard_connections.values(), key=lambda c: c.uuid))
+
+        for conn in shard_connections.values():
+            if conn.uuid not in connections_:
+                connections_[conn.uuid] = conn
+                added.append(conn)
+    return added
+
+def load_config_shards(config_dir: str, connections_: Dict[str, _connection.Connection], keys: Optional[List[str]] = None) -> List[_connection.Connection]:
+    """Loads the given (or all) unloaded folder shards into connections_ and returns the connections that were added."""
+    return install_config_shards(connections_, read_config_shards(config_dir, keys))
+
+def has_unloaded_config_shards() -> bool:
+    return any(not shard.loaded for shard in _globals.config_shards.values())
+
+def parse_app_config(data: dict) -> tuple[_app_config.AppConfig, Dict[str, _connection.Connection], Dict[str, _cluster.Cluster]]:
     app_config_ = _app_config.AppConfig()
     connections_ = {}
     clusters_ = {}
 
-    if os.path.exists(cfg_path):
-        with open(cfg_path, 'r') as f:
-            data = json.load(f) or {}
+    tmp_data = data.get('config', {})
+    if tmp_data:
+        app_config_ = from_sparse_dict(_app_config.AppConfig, tmp_data)
+
+    for tmp_data in data.get('connections') or []:
+        conn = from_sparse_dict(_connection.Connection, tmp_data)
+        connections_[conn.uuid] = conn
 
-        tmp_data = data.get('config', {})
-        if tmp_data:
-            afields = {f.name for f in fields(_app_config.AppConfig)}
-            filtered = {k: v for k, v in tmp_data.items() if k in afields}
-            app_config_ = _app_config.AppConfig(**filtered)
-
-        temps_data = data.get('connections', [])
-        if temps_data:
-            afields = {f.name for f in fields(_connection.Connection)}
-            for tmp_data in temps_data:
-                filtered = {k: v for k, v in tmp_data.items() if k in afields}
-                connections_[filtered['uuid']] = _connection.Connection(**filtered)
-
-        temps_data = data.get('clusters', [])
-        if temps_data:
-            afields = {f.name for f in fields(_cluster.Cluster)}
-            for tmp_data in temps_data:
-                filtered = {k: v for k, v in tmp_data.items() if k in afields}
-                clusters_[filtered['uuid']] = _cluster.Cluster(**filtered)
+    for tmp_data in data.get('clusters') or []:
+        cluster = from_sparse_dict(_cluster.Cluster, tmp_data)
+        clusters_[cluster.uuid] = cluster
 
     return (app_config_, connections_, clusters_)
 
-def save_app_config(config_dir: str, readonly: bool, app_config_: _app_config.AppConfig, connections_: Dict[str, _connection.Connection], clusters_: Dict[str, _cluster.Cluster]):
-    if readonly:
-        return
+def load_app_config(config_dir: str) -> tuple[_app_config.AppConfig, Dict[str, _connection.Connection], Dict[str, _cluster.Cluster]]:
+    if config_dir is None:
+        config_dir = os.path.expanduser("~/.config/pulse_ssh")
 
-    os.makedirs(config_dir, exist_ok=True)
     cfg_path = os.path.join(config_dir, "settings.json")
 
-    connections_to_save = []
+    _globals.config_shards = {}
+    if os.path.exists(cfg_path):
+        with open(cfg_path, 'rb') as f:
+            raw = f.read()
+        _globals.settings_hash = hash_settings(raw)
+        data = json.loads(raw) or {}
+        app_config_, connections_, clusters_ = parse_app_config(data)
+        _globals.config_shards = parse_config_shards(data)
+        load_config_shards(config_dir, connections_, [""])
+        return (app_config_, connections_, clusters_)
+
+    return (_app_config.AppConfig(), {}, {})
+
+def serialize_connection(conn: _connection.Connection) -> dict:
+    conn_dict = to_sparse_dict(conn)
+    if _globals.encryption_key:
+        if conn_dict.get('password'):
+            conn_dict['password'] = encrypt_string(conn_dict['password'])
+        if conn_dict.get('key_passphrase'):
+            conn_dict['key_passphrase'] = encrypt_string(conn_dict['key_passphrase'])
+    return conn_dict
+
+def plan_config_shards(config_dir: str, connections_: Dict[str, _connection.Connection]) -> tuple[Dict[str, _config_shard.ConfigShard], Dict[str, List[_connection.Connection]]]:
+    """Groups connections into one shard per top-level folder and returns the new manifest plus the shards whose content changed."""
+    groups: Dict[str, List[_connection.Connection]] = {}
     for c in connections_.values():
-        if c.uuid == "local":
-            continue
-        conn_dict = asdict(c)
-        if _globals.encryption_key:
-            if conn_dict.get('password'):
-                conn_dict['password'] = encrypt_string(conn_dict['password'])
-            if conn_dict.get('key_passphrase'):
-                conn_dict['key_passphrase'] = encrypt_string(conn_dict['key_passphrase'])
-        connections_to_save.append(conn_dict)
+        if c.uuid != "local":
+            groups.setdefault(config_shard_key(c.folder), []).append(c)
+
+    touched = [key for key in groups if key in _globals.config_shards and not _globals.config_shards[key].loaded]
+    for c in load_config_shards(config_dir, connections_, touched):
+        groups.setdefault(config_shard_key(c.folder), []).append(c)
+
+    shards = {key: shard for key, shard in _globals.config_shards.items() if not shard.loaded}
+    dirty = {}
+    for key, conns in groups.items():
+        conns.sort(key=lambda c: c.uuid)
+        digest = connections_digest(conns)
+        previous = _globals.config_shards.get(key)
+        shards[key] = _config_shard.ConfigShard(folder=key, file=config_shard_file(key), count=len(conns), loaded=True, digest=digest)
+        if not previous or previous.digest != digest:
+            dirty[key] = conns
+    return (shards, dirty)
+
+def save_app_config(config_dir: str, readonly: bool, app_config_: _app_config.AppConfig, connections_: Dict[str, _connection.Connection], clusters_: Dict[str, _cluster.Cluster]) -> bool:
+    """Writes settings.json. Refuses to clobber a file that was modified externally since it was last read."""
+    if readonly:
+        return False
+
+    os.makedirs(config_dir, exist_ok=True)
+    cfg_path = os.path.join(config_dir, "settings.json")
 
     data = {
-        'config': asdict(app_config_),
-        'connections': connections_to_save,
-        'clusters': [asdict(c) for c in clusters_.values()]
+        'format_version': SETTINGS_FORMAT_VERSION,
+        'config': to_sparse_dict(app_config_),
     }
-    with open(cfg_path, 'w') as f:
-        json.dump(data, f, indent=4)
+
+    if app_config_.config_sharded:
+        shards, dirty = plan_config_shards(config_dir, connections_)
+        data['shards'] = [{'folder': s.folder, 'file': s.file, 'count': s.count} for s in sorted(shards.values(), key=lambda s: s.folder)]
+    else:
+        load_config_shards(config_dir, connections_)
+        shards, dirty = {}, {}
+        data['connections'] = [serialize_connection(c) for c in connections_.values() if c.uuid != "local"]
+
+    data['clusters'] = [to_sparse_dict(c) for c in clusters_.values()]
+    raw = json.dumps(data, indent=4).encode('utf-8')
+
+    disk_hash = read_settings_hash(cfg_path)
+    if _globals.settings_hash and disk_hash and disk_hash != _globals.settings_hash:
+        conflict_path = f"{cfg_path}.conflict"
+        with open(conflict_path, 'wb') as f:
+            f.write(raw)
+        _globals.settings_conflict_path = conflict_path
+        return False
+
+    for key, conns in dirty.items():
+        shard_path = os.path.join(config_dir, shards[key].file)
+        os.makedirs(os.path.dirname(shard_path), exist_ok=True)
+        with open(shard_path, 'w') as f:
+            json.dump({'folder': key, 'connections': [serialize_connection(c) for c in conns]}, f, indent=4)
+
+    for key, shard in _globals.config_shards.items():
+        if key not in shards:
+            try:
+                os.remove(os.path.join(config_dir, shard.file))
+            except FileNotFoundError:
+                pass
+    _globals.config_shards = shards
+
+    new_hash = hash_settings(raw)
+    if disk_hash != new_hash:
+        with open(cfg_path, 'wb') as f:
+            f.write(raw)
+    _globals.settings_hash = new_hash
+    return True
+
+def diff_app_config(current_connections: Dict[str, _connection.Connection], current_clusters: Dict[str, _cluster.Cluster], incoming_connections: Dict[str, _connection.Connection], incoming_clusters: Dict[str, _cluster.Cluster], only_inventory_managed: bool = False) -> _config_diff.ConfigDiff:
+    """Computes the delta from the current to the incoming state, matching entries by uuid."""
+    diff = _config_diff.ConfigDiff()
+
+    for key, conn in incoming_connections.items():
+        existing = current_connections.get(key)
+        if existing is None:
+            diff.added_connections.append(conn)
+        elif existing != conn:
+            diff.changed_connections.append(conn)
+    for key, conn in current_connections.items():
+        if key not in incoming_connections and (conn.inventory_managed or not only_inventory_managed):
+            diff.removed_connections.append(conn)
+
+    for key, cluster in incoming_clusters.items():
+        existing = current_clusters.get(key)
+        if existing is None:
+            diff.added_clusters.append(cluster)
+        elif existing != cluster:
+            diff.changed_clusters.append(cluster)
+    for key, cluster in current_clusters.items():
+        if key not in incoming_clusters and (cluster.inventory_managed or not only_inventory_managed):
+            diff.removed_clusters.append(cluster)
+
+    return diff
 
 def load_cache_config(config_dir: str) -> _cache_config.CacheConfig:
     if config_dir is None:
@@ -237,6 +461,7 @@ def load_cache_config(config_dir: str) -> _cache_config.CacheConfig:
         cfields = {f.name for f in fields(_cache_config.CacheConfig)}
         filtered = {k: v for k, v in data.items() if k in cfields}
         cache_config_ = _cache_config.CacheConfig(**filtered)
+        cache_config_.session_tabs = [from_sparse_dict(_session_tab.SessionTab, tab) for tab in cache_config_.session_tabs if isinstance(tab, dict)]
 
     return cache_config_
 
@@ -260,26 +485,220 @@ def get_free_port():
         s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         return s.getsockname()[1]
 
-def substitute_variables(command: str, conn: _connection.Connection, proxy_port: Optional[int] = None) -> str:
+@functools.lru_cache(maxsize=1024)
+def compile_template(template: str) -> tuple:
+    """Splits a command template into (literal, variable) tokens; {{name}} escapes a literal {name}."""
+    tokens = []
+    literal = []
+    last = 0
+    for match in template_pattern.finditer(template):
+        literal.append(template[last:match.start()])
+        if match.group('escaped'):
+            literal.append(f"{{{match.group('escaped')}}}")
+        else:
+            tokens.append(("".join(literal), match.group('name')))
+            literal = []
+        last = match.end()
+    literal.append(template[last:])
+    tokens.append(("".join(literal), None))
+    return tuple(tokens)
+
+def resolve_variable(name: str, conn: _connection.Connection, proxy_port: Optional[int], cluster_name: Optional[str], terminal_index: Optional[int]):
+    if name in substitute_keys:
+        return getattr(conn, name, None)
+    if name == "proxy_port":
+        return proxy_port
+    if name == "cluster_name":
+        return cluster_name
+    if name == "terminal_index":
+        return terminal_index
+    if name.startswith("env:"):
+        return os.environ.get(name[4:])
+    return None
+
+def substitute_variables(command: str, conn: _connection.Connection, proxy_port: Optional[int] = None, cluster_name: Optional[str] = None, terminal_index: Optional[int] = None) -> str:
     if not command:
         return ""
 
-    substitutions = asdict(conn)
-    if proxy_port:
-        substitutions['proxy_port'] = proxy_port
+    tokens = compile_template(command)
+    if len(tokens) == 1:
+        return tokens[0][0]
+
+    parts = []
+    for literal, name in tokens:
+        parts.append(literal)
+        if name is None:
+            continue
+        value = resolve_variable(name, conn, proxy_port, cluster_name, terminal_index)
+        parts.append(f"{{{name}}}" if value is None else str(value))
+    return "".join(parts)
+
+def bump_connection_version(conn_uuid: str):
+    """Invalidates cached command plans after a connection was edited in place."""
+    _globals.connection_versions[conn_uuid] = _globals.connection_versions.get(conn_uuid, 0) + 1
+
+def bump_app_config_version():
+    _globals.app_config_version += 1
+
+def command_plan_key(app_config: _app_config.AppConfig, connection: _connection.Connection) -> tuple:
+    jump_conn = _globals.connections.get(connection.ssh_proxy_jump) if connection.ssh_proxy_jump else None
+    return (
+        connection, _globals.connection_versions.get(connection.uuid, 0),
+        jump_conn, _globals.connection_versions.get(jump_conn.uuid, 0) if jump_conn else 0,
+        app_config, _globals.app_config_version
+    )
+
+def get_command_plan(kind: str, builder, app_config: _app_config.AppConfig, connection: _connection.Connection) -> _launch_plan.LaunchPlan:
+    """Returns the launch plan template for a connection, rebuilding it only when the connection, its jump host or the app config changed."""
+    if _globals.connections.get(connection.uuid) is not connection:
+        return builder(app_config, connection)
+
+    key = command_plan_key(app_config, connection)
+    cached = command_plan_cache.get((kind, connection.uuid))
+    if cached and cached[0] == key:
+        return cached[1]
+
+    plan = builder(app_config, connection)
+    command_plan_cache[(kind, connection.uuid)] = (key, plan)
+    return plan
+
+def socks_proxy_share_key(kind: str, connection: _connection.Connection) -> str:
+    return f"{kind}:{connection.user}@{connection.host}:{connection.port}/{connection.ssh_proxy_jump or ''}"
+
+def resolve_launch_plan(kind: str, plan: _launch_plan.LaunchPlan, app_config: _app_config.AppConfig, connection: _connection.Connection, owner: Optional[str] = None) -> _launch_plan.LaunchPlan:
+    """Fills in the SOCKS proxy port, leasing it to owner (a terminal id) so it can be released when the terminal exits."""
+    if not plan.socks_proxy:
+        return plan
+    if owner is None:
+        return plan.with_proxy_port(get_free_port())
 
-    for key, value in substitutions.items():
-        if key in substitute_keys and value is not None:
-            command = command.replace(f'{{{key}}}', str(value))
-    return command
+    _globals.port_allocator.configure(app_config.ssh_proxy_port_range_start, app_config.ssh_proxy_port_range_end)
+    share_key = socks_proxy_share_key(kind, connection) if app_config.ssh_shared_sock_proxy else None
+    try:
+        port, carrier = _globals.port_allocator.acquire(owner, share_key)
+    except RuntimeError:
+        return plan.with_proxy_port(get_free_port())
+    return plan.with_proxy_port(port) if carrier else plan.with_shared_proxy_port(port)
+
+def needs_agent_key(connection: _connection.Connection) -> bool:
+    return bool(connection.identity_file and connection.key_passphrase)
+
+def ensure_agent_key(app_config: _app_config.AppConfig, connection: _connection.Connection) -> bool:
+    """Loads the connection's key into the agent; runs ssh-keygen and ssh-add, so call it off the GUI thread."""
+    return _globals.agent_keys.ensure_key(connection.identity_file, connection.key_passphrase, app_config.sshpass_path)
+
+def resolve_agent_key(plan: _launch_plan.LaunchPlan, app_config: _app_config.AppConfig, connection: _connection.Connection, key_loaded: Optional[bool] = None) -> _launch_plan.LaunchPlan:
+    """Falls back to an ssh-add step in the plan when the key is not in the agent; key_loaded=None checks the agent here, blocking."""
+    if not needs_agent_key(connection):
+        return plan
+    if key_loaded is None:
+        key_loaded = ensure_agent_key(app_config, connection)
+    if key_loaded:
+        return plan
+    return plan.with_prepend_cmds(build_add_key_cmds(app_config, connection))
+
+def resolve_destination(plan: _launch_plan.LaunchPlan, app_config: _app_config.AppConfig, connection: _connection.Connection) -> _launch_plan.LaunchPlan:
+    """Points ssh at a pre-resolved address while host-key checks keep using the connection's name."""
+    if not app_config.dns_cache_enabled or not app_config.dns_pass_resolved_ip or connection.ssh_proxy_jump:
+        return plan
+
+    entry = _globals.resolver.lookup(connection.host)
+    if not entry or not entry.address:
+        _globals.resolver.prefetch([connection.host])
+        return plan
+    return plan.with_destination_options(['-o', f"HostName={entry.address}", '-o', f"HostKeyAlias={_host_keys.host_pattern(connection.host, connection.port)}"])
+
+def prewarm_key(plan: _launch_plan.LaunchPlan, connection: _connection.Connection) -> str:
+    """Names a master after the connection and its ssh command, so a master never serves a connection whose host, port, user or jump host changed."""
+    digest = hashlib.sha1("\0".join(plan.without_socks_forward().argv).encode('utf-8')).hexdigest()[:16]
+    return f"{connection.uuid}-{digest}"
+
+def resolve_control_path(plan: _launch_plan.LaunchPlan, app_config: _app_config.AppConfig, connection: _connection.Connection) -> _launch_plan.LaunchPlan:
+    """Attaches ssh to a pre-warmed master for the connection when one is up."""
+    if not app_config.prewarm_enabled:
+        return plan
+
+    control_path = _globals.prewarm.attach(prewarm_key(plan, connection))
+    if not control_path:
+        return plan
+    return plan.with_destination_options(['-o', f"ControlPath={control_path}", '-o', "ControlMaster=no"])
+
+def prewarm_connection(app_config: _app_config.AppConfig, connection: _connection.Connection) -> bool:
+    """Opens a background ControlMaster for an ssh connection; blocks until it is up, so call it off the GUI thread."""
+    if connection.type != 'ssh' or not connection.host or connection.use_sudo:
+        return False
+
+    plan = resolve_agent_key(get_command_plan('ssh', build_ssh_plan, app_config, connection), app_config, connection)
+    if plan.needs_shell():
+        return False
+    key = prewarm_key(plan, connection)
+    if _globals.prewarm.is_warm(key):
+        return True
+    plan = resolve_destination(plan.without_socks_forward(), app_config, connection)
+    return _globals.prewarm.start_master(key, plan.argv, plan.env)
 
-def build_ssh_command(app_config: _app_config.AppConfig, connection: _connection.Connection) -> tuple[str, Optional[int]]:
+def release_proxy_port(owner: str):
+    _globals.port_allocator.release(owner)
+
+def build_ssh_command(app_config: _app_config.AppConfig, connection: _connection.Connection, owner: Optional[str] = None, key_loaded: Optional[bool] = None) -> _launch_plan.LaunchPlan:
+    plan = resolve_agent_key(get_command_plan('ssh', build_ssh_plan, app_config, connection), app_config, connection, key_loaded)
+    plan = resolve_destination(resolve_control_path(plan, app_config, connection), app_config, connection)
+    return resolve_launch_plan('ssh', plan, app_config, connection, owner)
+
+def build_mosh_command(app_config: _app_config.AppConfig, connection: _connection.Connection, owner: Optional[str] = None, key_loaded: Optional[bool] = None) -> _launch_plan.LaunchPlan:
+    plan = resolve_agent_key(get_command_plan('mosh', build_mosh_plan, app_config, connection), app_config, connection, key_loaded)
+    return resolve_launch_plan('mosh', plan, app_config, connection, owner)
+
+def build_sftp_command(app_config: _app_config.AppConfig, connection: _connection.Connection) -> _launch_plan.LaunchPlan:
+    return resolve_destination(get_command_plan('sftp', build_sftp_plan, app_config, connection), app_config, connection)
+
+def build_ftp_command(app_config: _app_config.AppConfig, connection: _connection.Connection) -> _launch_plan.LaunchPlan:
+    return get_command_plan('ftp', build_ftp_plan, app_config, connection)
+
+def build_sshpass_env(connection: _connection.Connection) -> Dict[str, str]:
+    if connection.use_sshpass and connection.password:
+        return {'SSHPASS': connection.password}
+    return {}
+
+def build_jump_argv(app_config: _app_config.AppConfig, jump_conn: _connection.Connection) -> List[str]:
+    """Returns an ssh command line, without the remote command, that logs into a jump host to run something there."""
+    argv = shlex.split(app_config.ssh_path) + ['-p', str(jump_conn.port or 22)]
+    if jump_conn.identity_file:
+        argv += ['-i', jump_conn.identity_file]
+    return argv + [jump_conn.host if not jump_conn.user else f"{jump_conn.user}@{jump_conn.host}"]
+
+def get_first_hop(connection: _connection.Connection) -> str:
+    """Returns the host the connection's SSH handshake actually reaches first: its jump host, or itself."""
+    if connection.ssh_proxy_jump and connection.ssh_proxy_jump in _globals.connections:
+        return _globals.connections[connection.ssh_proxy_jump].host
+    return connection.host
+
+def get_failure_domain(connection: _connection.Connection) -> Optional[str]:
+    """Returns the key reconnects of this connection share a circuit breaker under; local shells have none."""
+    if connection.type == 'local':
+        return None
+    via_jump = bool(connection.ssh_proxy_jump and connection.ssh_proxy_jump in _globals.connections)
+    first_hop = get_first_hop(connection)
+    address = None
+    if first_hop and not via_jump:
+        if _resolver.is_ip_address(first_hop):
+            address = first_hop
+        elif entry := _globals.resolver.lookup(first_hop):
+            address = entry.address
+    return _reconnect.failure_domain(first_hop, via_jump, address)
+
+def build_add_key_cmds(app_config: _app_config.AppConfig, connection: _connection.Connection) -> List[str]:
+    if connection.identity_file and connection.key_passphrase:
+        return [f"{app_config.sshpass_path} -p {shlex.quote(connection.key_passphrase)} ssh-add {shlex.quote(connection.identity_file)}"]
+    return []
+
+def build_ssh_plan(app_config: _app_config.AppConfig, connection: _connection.Connection) -> _launch_plan.LaunchPlan:
     ssh_base_cmd = app_config.ssh_path
     if connection.use_sudo:
         ssh_base_cmd = f'{app_config.sudo_path} {ssh_base_cmd}'
 
     if connection.use_sshpass and connection.password:
-        ssh_base_cmd = f"{app_config.sshpass_path} -p {shlex.quote(connection.password)} {ssh_base_cmd}"
+        ssh_base_cmd = f"{app_config.sshpass_path} -e {ssh_base_cmd}"
 
     ssh_cmd_parts = shlex.split(ssh_base_cmd) + ['-p', str(connection.port)]
     if connection.identity_file:
@@ -301,37 +720,28 @@ def build_ssh_command(app_config: _app_config.AppConfig, connection: _connection
     if app_config.ssh_force_pty or connection.ssh_force_pty:
         ssh_cmd_parts += ['-t']
 
-    proxy_port = None
-    if app_config.ssh_unique_sock_proxy or connection.ssh_unique_sock_proxy:
-        proxy_port = get_free_port()
-        ssh_cmd_parts += ['-D', f'localhost:{proxy_port}']
+    socks_proxy = app_config.ssh_unique_sock_proxy or connection.ssh_unique_sock_proxy
+    if socks_proxy:
+        ssh_cmd_parts += ['-D', _launch_plan.SOCKS_FORWARD]
 
     combined_options = list(dict.fromkeys(app_config.ssh_additional_options + connection.ssh_additional_options))
     for option in combined_options:
-        substituted_option = substitute_variables(option, connection, proxy_port)
+        substituted_option = substitute_variables(option, connection)
         ssh_cmd_parts += shlex.split(substituted_option)
 
     ssh_cmd_parts += [connection.host if not connection.user else f"{connection.user}@{connection.host}"]
 
-    add_key_cmd = []
-    if connection.identity_file and connection.key_passphrase:
-        ssh_add_cmd = f"{app_config.sshpass_path} -p {shlex.quote(connection.key_passphrase)} ssh-add {shlex.quote(connection.identity_file)}"
-        add_key_cmd.append(ssh_add_cmd)
+    substituted_prepend_cmds = [substitute_variables(cmd, connection) for cmd in connection.ssh_prepend_cmds]
 
-    quoted_ssh_command = " ".join([shlex.quote(part) for part in ssh_cmd_parts])
-    all_prepend_cmds = add_key_cmd + connection.ssh_prepend_cmds
-    substituted_prepend_cmds = [substitute_variables(cmd, connection, proxy_port) for cmd in all_prepend_cmds]
-    final_cmd = " && ".join(substituted_prepend_cmds + [quoted_ssh_command])
+    return _launch_plan.LaunchPlan(ssh_cmd_parts, build_sshpass_env(connection), substituted_prepend_cmds, socks_proxy=socks_proxy, first_hop=get_first_hop(connection))
 
-    return final_cmd, proxy_port
-
-def build_mosh_command(app_config: _app_config.AppConfig, connection: _connection.Connection) -> tuple[str, Optional[int]]:
+def build_mosh_plan(app_config: _app_config.AppConfig, connection: _connection.Connection) -> _launch_plan.LaunchPlan:
     ssh_base_cmd = app_config.ssh_path
     if connection.use_sudo:
         ssh_base_cmd = f'{app_config.sudo_path} {ssh_base_cmd}'
 
     if connection.use_sshpass and connection.password:
-        ssh_base_cmd = f"{app_config.sshpass_path} -p {shlex.quote(connection.password)} {ssh_base_cmd}"
+        ssh_base_cmd = f"{app_config.sshpass_path} -e {ssh_base_cmd}"
 
     ssh_base_cmd += f" -p {str(connection.port)}"
 
@@ -354,41 +764,32 @@ def build_mosh_command(app_config: _app_config.AppConfig, connection: _connectio
     if app_config.ssh_force_pty or connection.ssh_force_pty:
         ssh_base_cmd += f" -t"
 
-    proxy_port = None
-    if app_config.ssh_unique_sock_proxy or connection.ssh_unique_sock_proxy:
-        proxy_port = get_free_port()
-        ssh_base_cmd += f" -D localhost:{proxy_port}"
+    socks_proxy = app_config.ssh_unique_sock_proxy or connection.ssh_unique_sock_proxy
+    if socks_proxy:
+        ssh_base_cmd += f" -D {_launch_plan.SOCKS_FORWARD}"
 
     combined_options = list(dict.fromkeys(app_config.ssh_additional_options + connection.ssh_additional_options))
     for option in combined_options:
-        substituted_option = substitute_variables(option, connection, proxy_port)
+        substituted_option = substitute_variables(option, connection)
         ssh_base_cmd += f" {substituted_option}"
 
-    add_key_cmd = []
-    if connection.identity_file and connection.key_passphrase:
-        ssh_add_cmd = f"{app_config.sshpass_path} -p {shlex.quote(connection.key_passphrase)} ssh-add {shlex.quote(connection.identity_file)}"
-        add_key_cmd.append(ssh_add_cmd)
-
     mosh_cmd_parts = shlex.split(app_config.mosh_path) + ['--ssh', ssh_base_cmd]
     if connection.mosh_local_echo:
         mosh_cmd_parts += [f'--predict={connection.mosh_local_echo}']
 
     mosh_cmd_parts += [connection.host if not connection.user else f"{connection.user}@{connection.host}"]
 
-    quoted_mosh_command = " ".join([shlex.quote(part) for part in mosh_cmd_parts])
-    all_prepend_cmds = add_key_cmd + connection.ssh_prepend_cmds
-    substituted_prepend_cmds = [substitute_variables(cmd, connection, proxy_port) for cmd in all_prepend_cmds]
-    final_cmd = " && ".join(substituted_prepend_cmds + [quoted_mosh_command])
+    substituted_prepend_cmds = [substitute_variables(cmd, connection) for cmd in connection.ssh_prepend_cmds]
 
-    return final_cmd, proxy_port
+    return _launch_plan.LaunchPlan(mosh_cmd_parts, build_sshpass_env(connection), substituted_prepend_cmds, socks_proxy=socks_proxy, first_hop=get_first_hop(connection))
 
-def build_sftp_command(app_config: _app_config.AppConfig, connection: _connection.Connection) -> str:
+def build_sftp_plan(app_config: _app_config.AppConfig, connection: _connection.Connection) -> _launch_plan.LaunchPlan:
     sftp_base_cmd = app_config.sftp_path
     if connection.use_sudo:
         sftp_base_cmd = f'{app_config.sudo_path} {sftp_base_cmd}'
 
     if connection.use_sshpass and connection.password:
-        sftp_base_cmd = f"{app_config.sshpass_path} -p {shlex.quote(connection.password)} {sftp_base_cmd}"
+        sftp_base_cmd = f"{app_config.sshpass_path} -e {sftp_base_cmd}"
 
     sftp_cmd_parts = shlex.split(sftp_base_cmd) + ['-P', str(connection.port)]
     if connection.identity_file:
@@ -413,11 +814,9 @@ def build_sftp_command(app_config: _app_config.AppConfig, connection: _connectio
 
     sftp_cmd_parts += [connection.host if not connection.user else f"{connection.user}@{connection.host}"]
 
-    quoted_sftp_command = " ".join([shlex.quote(part) for part in sftp_cmd_parts])
+    return _launch_plan.LaunchPlan(sftp_cmd_parts, build_sshpass_env(connection), first_hop=get_first_hop(connection))
 
-    return quoted_sftp_command
-
-def build_ftp_command(app_config: _app_config.AppConfig, connection: _connection.Connection) -> str:
+def build_ftp_plan(app_config: _app_config.AppConfig, connection: _connection.Connection) -> _launch_plan.LaunchPlan:
     ftp_base_cmd = app_config.ftp_path
     if connection.use_sudo:
         ftp_base_cmd = f'{app_config.sudo_path} {ftp_base_cmd}'
@@ -435,6 +834,4 @@ def build_ftp_command(app_config: _app_config.AppConfig, connection: _connection
 
     ftp_cmd_parts += [connection.host, str(connection.port)]
 
-    quoted_ftp_command = " ".join([shlex.quote(part) for part in ftp_cmd_parts])
-
-    return quoted_ftp_command
+    return _launch_plan.LaunchPlan(ftp_cmd_parts)
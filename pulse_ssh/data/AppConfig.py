@@ -24,9 +24,13 @@ class AppConfig:
     shell_program: str = "bash"
     color_scheme: str = "default"
     scrollback_lines: int = 10000
+    scrollback_budget_mb: int = 0
+    scrollback_min_lines: int = 1000
+    scrollback_spill: bool = False
     scroll_on_output: bool = True
     scroll_on_keystroke: bool = True
     scroll_on_insert: bool = True
+    throttle_hidden_terminals: bool = True
     sidebar_on_right: bool = False
     use_adw_window: bool = False
     scrollbar_visible: bool = True
@@ -39,6 +43,36 @@ class AppConfig:
     ssh_verbose: bool = False
     ssh_force_pty: bool = False
     ssh_unique_sock_proxy: bool = False
+    ssh_shared_sock_proxy: bool = False
+    ssh_proxy_port_range_start: int = 20000
+    ssh_proxy_port_range_end: int = 20999
+    admission_rate: float = 4.0
+    admission_burst: int = 8
+    admission_max_in_flight: int = 8
+    reconnect_initial_delay: float = 1.0
+    reconnect_max_delay: int = 60
+    reconnect_max_attempts: int = 10
+    reconnect_stable_seconds: int = 15
+    reconnect_breaker_threshold: int = 5
+    reconnect_breaker_cooldown: int = 30
+    host_key_prescan: bool = True
+    reachability_enabled: bool = True
+    reachability_ssh_banner: bool = False
+    reachability_ttl: int = 60
+    dns_cache_enabled: bool = True
+    dns_cache_ttl: int = 300
+    dns_pass_resolved_ip: bool = False
+    prewarm_enabled: bool = False
+    prewarm_delay_ms: int = 400
+    prewarm_idle_timeout: int = 120
+    prewarm_max_masters: int = 4
+    restore_session: bool = True
+    session_log_enabled: bool = False
+    session_log_dir: Optional[str] = None
+    session_log_compression: str = "gzip"
+    session_log_max_mb: int = 64
+    session_log_max_age_hours: int = 24
+    session_record_enabled: bool = False
     ssh_additional_options: List[str] = field(default_factory=list)
     ssh_remote_cmds: Dict[str, str] = field(default_factory=dict)
     ssh_local_cmds: Dict[str, str] = field(default_factory=dict)
@@ -57,3 +91,7 @@ class AppConfig:
     ftp_path: str = "ftp"
     sshpass_path: str = "sshpass"
     sudo_path: str = "sudo"
+    inventory_source: Optional[str] = None
+    inventory_is_command: bool = False
+    inventory_poll_interval: int = 300
+    config_sharded: bool = False
@@ -1,10 +1,15 @@
 #!/usr/bin/env python
 
 from dataclasses import dataclass
+from dataclasses import field
+from typing import List
+import pulse_ssh.data.SessionTab as _session_tab
 
 @dataclass
 class CacheConfig:
     window_width: int = 800
     window_height: int = 600
     window_maximized: bool = False
-    sidebar_visible: bool = True
\ No newline at end of file
+    sidebar_visible: bool = True
+    session_tabs: List[_session_tab.SessionTab] = field(default_factory=list)
+    session_selected: int = 0
\ No newline at end of file
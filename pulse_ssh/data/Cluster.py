@@ -11,3 +11,4 @@ class Cluster:
     connection_uuids: List[str] = field(default_factory=list)
     open_mode: str = "split"
     uuid: str = field(default_factory=lambda: str(uuid.uuid4()))
+    inventory_managed: bool = False
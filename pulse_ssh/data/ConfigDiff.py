@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import List
+from typing import Optional
+import pulse_ssh.data.AppConfig as _app_config
+import pulse_ssh.data.Cluster as _cluster
+import pulse_ssh.data.Connection as _connection
+
+@dataclass
+class ConfigDiff:
+    added_connections: List[_connection.Connection] = field(default_factory=list)
+    removed_connections: List[_connection.Connection] = field(default_factory=list)
+    changed_connections: List[_connection.Connection] = field(default_factory=list)
+    added_clusters: List[_cluster.Cluster] = field(default_factory=list)
+    removed_clusters: List[_cluster.Cluster] = field(default_factory=list)
+    changed_clusters: List[_cluster.Cluster] = field(default_factory=list)
+    app_config: Optional[_app_config.AppConfig] = None
+    skipped: List[str] = field(default_factory=list)
+    duration: float = 0.0
+
+    def is_empty(self) -> bool:
+        return not (
+            self.app_config or
+            self.added_connections or self.removed_connections or self.changed_connections or
+            self.added_clusters or self.removed_clusters or self.changed_clusters
+        )
+
+    def summary(self) -> str:
+        return (
+            f"+{len(self.added_connections)} -{len(self.removed_connections)} ~{len(self.changed_connections)} connections, "
+            f"+{len(self.added_clusters)} -{len(self.removed_clusters)} ~{len(self.changed_clusters)} clusters"
+        )
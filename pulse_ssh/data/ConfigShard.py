@@ -0,0 +1,12 @@
+#!/usr/bin/env python
+
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class ConfigShard:
+    folder: str
+    file: str
+    count: int = 0
+    loaded: bool = False
+    digest: Optional[str] = None
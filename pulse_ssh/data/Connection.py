@@ -7,9 +7,54 @@ from dataclasses import fields
 from typing import Dict
 from typing import List
 from typing import Optional
+import sys
 import uuid
 
-@dataclass
+class FrozenList(list):
+    """An immutable empty list shared by every connection that leaves a list field unset."""
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("shared empty list is immutable; assign a new list instead")
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (list, ())
+
+class FrozenDict(dict):
+    """An immutable empty dict shared by every connection that leaves a dict field unset."""
+    __slots__ = ()
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("shared empty dict is immutable; assign a new dict instead")
+
+    pop = popitem = clear = update = setdefault = _immutable
+    __setitem__ = __delitem__ = __ior__ = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (dict, ())
+
+EMPTY_LIST = FrozenList()
+EMPTY_DICT = FrozenDict()
+
+INTERNED_FIELDS = ('type', 'folder', 'user', 'mosh_local_echo')
+SHARED_EMPTY_FIELDS = ('ssh_additional_options', 'ssh_prepend_cmds', 'ssh_remote_cmds', 'ssh_local_cmds', 'sftp_additional_options')
+
+@dataclass(slots=True)
 class Connection:
     name: str
     type: str = "ssh"
@@ -44,10 +89,24 @@ class Connection:
     ftp_verbose: bool = False
     use_sudo: bool = False
     use_sshpass: bool = False
+    session_log: bool = False
+    inventory_managed: bool = False
+
+    def __post_init__(self):
+        for name in INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+
+        for name in SHARED_EMPTY_FIELDS:
+            value = getattr(self, name)
+            if not value and isinstance(value, (list, dict)):
+                setattr(self, name, EMPTY_LIST if isinstance(value, list) else EMPTY_DICT)
 
     def get_cloned_connection(self) -> "Connection":
         new_conn_dict = asdict(self)
         new_conn_dict['uuid'] = str(uuid.uuid4())
+        new_conn_dict['inventory_managed'] = False
 
         for f in fields(self):
             if f.default_factory is list:
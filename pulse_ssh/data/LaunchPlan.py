@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import List
+from typing import Optional
+import shlex
+
+PROXY_PORT_TOKEN = "{proxy_port}"
+SOCKS_FORWARD = f"localhost:{PROXY_PORT_TOKEN}"
+
+@dataclass
+class LaunchPlan:
+    argv: List[str]
+    env: Dict[str, str] = field(default_factory=dict, repr=False)
+    prepend_cmds: List[str] = field(default_factory=list)
+    proxy_port: Optional[int] = None
+    socks_proxy: bool = False
+    first_hop: Optional[str] = None
+
+    def with_proxy_port(self, proxy_port: int) -> "LaunchPlan":
+        return LaunchPlan(
+            argv=[arg.replace(PROXY_PORT_TOKEN, str(proxy_port)) for arg in self.argv],
+            env=self.env,
+            prepend_cmds=[cmd.replace(PROXY_PORT_TOKEN, str(proxy_port)) for cmd in self.prepend_cmds],
+            proxy_port=proxy_port,
+            socks_proxy=self.socks_proxy,
+            first_hop=self.first_hop
+        )
+
+    def with_shared_proxy_port(self, proxy_port: int) -> "LaunchPlan":
+        """Points the plan at a SOCKS proxy another terminal already runs, dropping its own -D forward."""
+        return self.without_socks_forward().with_proxy_port(proxy_port)
+
+    def without_socks_forward(self) -> "LaunchPlan":
+        argv = []
+        for arg in self.argv:
+            if arg == SOCKS_FORWARD and argv and argv[-1] == "-D":
+                argv.pop()
+                continue
+            argv.append(arg.replace(f" -D {SOCKS_FORWARD}", ""))
+        return LaunchPlan(argv=argv, env=self.env, prepend_cmds=self.prepend_cmds, proxy_port=None, socks_proxy=self.socks_proxy, first_hop=self.first_hop)
+
+    def with_prepend_cmds(self, prepend_cmds: List[str]) -> "LaunchPlan":
+        return LaunchPlan(argv=self.argv, env=self.env, prepend_cmds=prepend_cmds + self.prepend_cmds, proxy_port=self.proxy_port, socks_proxy=self.socks_proxy, first_hop=self.first_hop)
+
+    def with_destination_options(self, options: List[str]) -> "LaunchPlan":
+        return LaunchPlan(argv=self.argv[:-1] + options + self.argv[-1:], env=self.env, prepend_cmds=self.prepend_cmds, proxy_port=self.proxy_port, socks_proxy=self.socks_proxy, first_hop=self.first_hop)
+
+    def needs_shell(self) -> bool:
+        return bool(self.prepend_cmds)
+
+    def shell_command(self) -> str:
+        return " && ".join(self.prepend_cmds + [shlex.join(self.argv)])
+
+    def spawn_argv(self, shell_program: str) -> List[str]:
+        if self.needs_shell():
+            return [shell_program, "-c", self.shell_command()]
+        return list(self.argv)
+
+    def spawn_envv(self) -> List[str]:
+        return [f"{key}={value}" for key, value in self.env.items()]
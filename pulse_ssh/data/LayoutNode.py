@@ -0,0 +1,21 @@
+#!/usr/bin/env python
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import List
+from typing import Optional
+
+@dataclass
+class LayoutNode:
+    mode: Optional[str] = None
+    columns: Optional[int] = None
+    row_ratios: List[float] = field(default_factory=list)
+    column_ratios: List[float] = field(default_factory=list)
+    children: List["LayoutNode"] = field(default_factory=list)
+    terminal_id: Optional[str] = None
+    conn_uuid: Optional[str] = None
+    cluster_id: Optional[str] = None
+    cluster_name: Optional[str] = None
+
+    def is_leaf(self) -> bool:
+        return self.mode is None
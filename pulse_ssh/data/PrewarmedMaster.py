@@ -0,0 +1,10 @@
+#!/usr/bin/env python
+
+from dataclasses import dataclass
+
+@dataclass
+class PrewarmedMaster:
+    control_path: str
+    started_at: float
+    ready: bool = False
+    attached: bool = False
@@ -0,0 +1,12 @@
+#!/usr/bin/env python
+
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class ProbeResult:
+    reachable: bool
+    checked_at: float
+    latency: Optional[float] = None
+    banner: Optional[str] = None
+    error: Optional[str] = None
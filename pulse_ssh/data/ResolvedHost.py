@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class ResolvedHost:
+    address: Optional[str]
+    latency: float
+    expires_at: float
+    error: Optional[str] = None
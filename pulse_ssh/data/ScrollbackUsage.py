@@ -0,0 +1,16 @@
+#!/usr/bin/env python
+
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class ScrollbackUsage:
+    key: str
+    name: str
+    rows: int
+    columns: int
+    limit: int
+    connected: bool
+    visible: bool
+    hidden_since: Optional[float] = None
+    spilled_lines: int = 0
@@ -0,0 +1,10 @@
+#!/usr/bin/env python
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Optional
+
+@dataclass
+class SessionTab:
+    layout: dict = field(default_factory=dict)
+    custom_title: Optional[str] = None
@@ -13,16 +13,42 @@ import hashlib
 import pulse_ssh.data.CacheConfig as _cache_config
 import pulse_ssh.data.ClusterCache as _cluster_cache
 import pulse_ssh.data.HistoryEntry as _history_entry
+import pulse_ssh.gui.managers.ActivityManager as _activity_manager
+import pulse_ssh.gui.managers.AdmissionManager as _admission_manager
 import pulse_ssh.gui.managers.ClusterManager as _cluster_manager
+import pulse_ssh.gui.managers.ConfigReloadManager as _config_reload_manager
+import pulse_ssh.gui.managers.HostKeyManager as _host_key_manager
+import pulse_ssh.gui.managers.InventoryManager as _inventory_manager
 import pulse_ssh.gui.managers.LayoutManager as _layout_manager
+import pulse_ssh.gui.managers.PrewarmManager as _prewarm_manager
+import pulse_ssh.gui.managers.ReachabilityManager as _reachability_manager
+import pulse_ssh.gui.managers.ReconnectManager as _reconnect_manager
+import pulse_ssh.gui.managers.RecordingManager as _recording_manager
+import pulse_ssh.gui.managers.ScrollbackManager as _scrollback_manager
+import pulse_ssh.gui.managers.ResolverManager as _resolver_manager
+import pulse_ssh.gui.managers.SessionLogManager as _session_log_manager
+import pulse_ssh.gui.managers.SessionManager as _session_manager
 import pulse_ssh.gui.managers.ShortcutManager as _shortcut_manager
 
 active_clusters: Dict[str, _cluster_cache.ClusterCache] = {}
+activity_manager: _activity_manager.ActivityManager
+admission_manager: _admission_manager.AdmissionManager
 all_notebooks: List[Adw.TabView] = []
 cache_config: _cache_config.CacheConfig
 cluster_manager: _cluster_manager.ClusterManager
 command_history: Dict[str, List[_history_entry.HistoryEntry]] = {}
+config_reload_manager: _config_reload_manager.ConfigReloadManager
+host_key_manager: _host_key_manager.HostKeyManager
+inventory_manager: _inventory_manager.InventoryManager
 layout_manager: _layout_manager.LayoutManager
+prewarm_manager: _prewarm_manager.PrewarmManager
+reachability_manager: _reachability_manager.ReachabilityManager
+reconnect_manager: _reconnect_manager.ReconnectManager
+recording_manager: _recording_manager.RecordingManager
+scrollback_manager: _scrollback_manager.ScrollbackManager
+resolver_manager: _resolver_manager.ResolverManager
+session_log_manager: _session_log_manager.SessionLogManager
+session_manager: _session_manager.SessionManager
 shortcut_manager: _shortcut_manager.ShortcutManager
 
 def ask_for_cluster_name(parent, callback):
@@ -12,20 +12,36 @@ from gi.repository import Gio  # type: ignore
 from gi.repository import GLib  # type: ignore
 from gi.repository import Gtk  # type: ignore
 from typing import List
+from typing import Set
 from typing import Optional
-import math
 import os
+import pulse_ssh.data.ConfigDiff as _config_diff
 import pulse_ssh.data.Connection as _connection
 import pulse_ssh.Globals as _globals
 import pulse_ssh.gui.dialogs.PasswordDialog as _password_dialog
 import pulse_ssh.gui.Globals as _gui_globals
+import pulse_ssh.gui.managers.ActivityManager as _activity_manager
+import pulse_ssh.gui.managers.AdmissionManager as _admission_manager
 import pulse_ssh.gui.managers.ClusterManager as _cluster_manager
+import pulse_ssh.gui.managers.ConfigReloadManager as _config_reload_manager
+import pulse_ssh.gui.managers.HostKeyManager as _host_key_manager
+import pulse_ssh.gui.managers.InventoryManager as _inventory_manager
 import pulse_ssh.gui.managers.LayoutManager as _layout_manager
+import pulse_ssh.gui.managers.PrewarmManager as _prewarm_manager
+import pulse_ssh.gui.managers.ReachabilityManager as _reachability_manager
+import pulse_ssh.gui.managers.ReconnectManager as _reconnect_manager
+import pulse_ssh.gui.managers.RecordingManager as _recording_manager
+import pulse_ssh.gui.managers.ScrollbackManager as _scrollback_manager
+import pulse_ssh.gui.managers.ResolverManager as _resolver_manager
+import pulse_ssh.gui.managers.SessionLogManager as _session_log_manager
+import pulse_ssh.gui.managers.SessionManager as _session_manager
 import pulse_ssh.gui.managers.ShortcutManager as _shortcut_manager
+import pulse_ssh.gui.TilingLayout as _tiling_layout
 import pulse_ssh.gui.views.ClustersView as _clusters_view
 import pulse_ssh.gui.views.ConnectionsView as _connections_view
 import pulse_ssh.gui.views.HistoryView as _history_view
 import pulse_ssh.gui.VteTerminal as _vte_terminal
+import pulse_ssh.Layout as _layout
 import pulse_ssh.Utils as _utils
 
 
@@ -38,8 +54,21 @@ class MainWindow(BASE_WINDOW_CLASS):
     def __init__(self, app):
         super().__init__(application=app, title="PulseSSH")
 
+        _gui_globals.activity_manager = _activity_manager.ActivityManager(self)
+        _gui_globals.admission_manager = _admission_manager.AdmissionManager(self)
         _gui_globals.cluster_manager = _cluster_manager.ClusterManager(self)
+        _gui_globals.config_reload_manager = _config_reload_manager.ConfigReloadManager(self)
+        _gui_globals.host_key_manager = _host_key_manager.HostKeyManager(self)
+        _gui_globals.inventory_manager = _inventory_manager.InventoryManager(self)
         _gui_globals.layout_manager = _layout_manager.LayoutManager(self)
+        _gui_globals.prewarm_manager = _prewarm_manager.PrewarmManager(self)
+        _gui_globals.reachability_manager = _reachability_manager.ReachabilityManager(self)
+        _gui_globals.reconnect_manager = _reconnect_manager.ReconnectManager(self)
+        _gui_globals.recording_manager = _recording_manager.RecordingManager(self)
+        _gui_globals.scrollback_manager = _scrollback_manager.ScrollbackManager(self)
+        _gui_globals.resolver_manager = _resolver_manager.ResolverManager(self)
+        _gui_globals.session_log_manager = _session_log_manager.SessionLogManager(self)
+        _gui_globals.session_manager = _session_manager.SessionManager(self)
         _gui_globals.shortcut_manager = _shortcut_manager.ShortcutManager(self)
 
         self.fix_icon(self)
@@ -69,6 +98,17 @@ class MainWindow(BASE_WINDOW_CLASS):
 
         self.apply_config_settings()
 
+        _gui_globals.config_reload_manager.start()
+        _gui_globals.inventory_manager.start()
+        _gui_globals.reachability_manager.start()
+        _gui_globals.resolver_manager.start()
+        _gui_globals.prewarm_manager.start()
+        _gui_globals.reconnect_manager.start()
+        _gui_globals.scrollback_manager.start()
+        _gui_globals.activity_manager.start()
+        _gui_globals.session_log_manager.start()
+        _gui_globals.recording_manager.start()
+
     def fix_icon(self, window):
         icon_dir = os.path.join(_utils.project_root, 'res', 'icons', 'hicolor', '512x512', 'apps')
         icon_name = "pulse_ssh"
@@ -86,6 +126,8 @@ class MainWindow(BASE_WINDOW_CLASS):
             print("Icon file missing:", icon_path)
 
     def apply_config_settings(self):
+        _utils.bump_app_config_version()
+
         color_scheme_map = {
             "default": Adw.ColorScheme.DEFAULT,
             "force-light": Adw.ColorScheme.FORCE_LIGHT,
@@ -102,6 +144,21 @@ class MainWindow(BASE_WINDOW_CLASS):
             background-color: @headerbar_bg_color;
             border-bottom: 1px solid @headerbar_shade_color;
         }}
+        label.status-dot.reachability-up {{
+            color: @success_color;
+        }}
+        label.status-dot.reachability-down {{
+            color: @error_color;
+        }}
+        label.status-dot.reachability-partial {{
+            color: @warning_color;
+        }}
+        label.status-dot.reachability-pending {{
+            opacity: 0.3;
+        }}
+        .tiling-layout {{
+            background-color: alpha(currentColor, 0.15);
+        }}
         """
 
         color_styles = []
@@ -129,6 +186,51 @@ class MainWindow(BASE_WINDOW_CLASS):
 
         self.set_sidebar_toggle_btn_icon()
 
+    def load_all_config_shards(self):
+        self.connections_view.load_config_shards()
+
+    def apply_config_diff(self, diff: _config_diff.ConfigDiff):
+        removed_uuids: Set[str] = set()
+        for conn in diff.removed_connections:
+            if existing := _globals.connections.pop(conn.uuid, None):
+                self.connections_view.delete_tree_entry(existing)
+                removed_uuids.add(conn.uuid)
+
+        for conn in diff.changed_connections:
+            if existing := _globals.connections.get(conn.uuid):
+                self.connections_view.delete_tree_entry(existing)
+            _globals.connections[conn.uuid] = conn
+            self.connections_view.add_tree_entry(conn)
+
+        for conn in diff.added_connections:
+            if conn.uuid in _globals.connections:
+                continue
+            _globals.connections[conn.uuid] = conn
+            self.connections_view.add_tree_entry(conn)
+
+        clusters_changed = bool(diff.added_clusters or diff.removed_clusters or diff.changed_clusters)
+        for cluster in diff.removed_clusters:
+            _globals.clusters.pop(cluster.uuid, None)
+        for cluster in diff.changed_clusters + diff.added_clusters:
+            _globals.clusters[cluster.uuid] = cluster
+
+        if removed_uuids:
+            for cluster in _globals.clusters.values():
+                kept_uuids = [u for u in cluster.connection_uuids if u not in removed_uuids]
+                if len(kept_uuids) != len(cluster.connection_uuids):
+                    cluster.connection_uuids = kept_uuids
+                    clusters_changed = True
+
+        if clusters_changed:
+            self.clusters_view.populate_tree()
+
+        if diff.app_config:
+            _globals.app_config = diff.app_config
+            self.apply_config_settings()
+            for notebook in _gui_globals.all_notebooks:
+                for terminal in self._find_all_terminals_in_widget(notebook):
+                    terminal.apply_theme()
+
     def _build_ui(self):
         self.connect("realize", self.on_realize)
 
@@ -179,6 +281,7 @@ class MainWindow(BASE_WINDOW_CLASS):
         self.set_sidebar_toggle_btn_icon()
 
         self.top_bar_view.append(tab_bar)
+        self.top_bar_view.append(_gui_globals.reconnect_manager.build_indicator())
 
         content_toolbar_view = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
         content_toolbar_view.append(self.top_bar_view)
@@ -208,12 +311,15 @@ class MainWindow(BASE_WINDOW_CLASS):
             self.set_child(self.toast_overlay)
 
         _gui_globals.shortcut_manager._setup_shortcuts_for_window(self)
+        _gui_globals.activity_manager.watch_window(self)
 
         self.connections_view.list_view.grab_focus()
 
     def on_realize(self, widget):
         if _globals.app_config.encryption_enabled and _globals.app_config.encryption_canary:
             self._prompt_for_decryption_password()
+        else:
+            _gui_globals.session_manager.restore()
 
     def set_sidebar_toggle_btn_icon(self):
         if self.split_view.get_collapsed() == _globals.app_config.sidebar_on_right:
@@ -236,6 +342,7 @@ class MainWindow(BASE_WINDOW_CLASS):
             if response_id == Gtk.ResponseType.OK and password:
                 if _utils.verify_encryption_password(password):
                     if _utils.decrypt_all_connections():
+                        _gui_globals.session_manager.restore()
                         return
                     else:
                         fail_dialog = Adw.MessageDialog(transient_for=self, modal=True, heading="Decryption Failed", body="Could not decrypt connection data. The configuration might be corrupted. The application will now exit.")
@@ -284,6 +391,7 @@ class MainWindow(BASE_WINDOW_CLASS):
         _gui_globals.all_notebooks.append(notebook)
 
         _gui_globals.shortcut_manager._setup_shortcuts_for_window(win)
+        _gui_globals.activity_manager.watch_window(win)
 
         win.connect("close-request", lambda w: self.on_sub_window_close_request(win, notebook))
 
@@ -299,6 +407,8 @@ class MainWindow(BASE_WINDOW_CLASS):
 
             _gui_globals.cache_config.sidebar_visible = not self.split_view.get_collapsed()
 
+            _gui_globals.session_manager.save()
+
             _utils.save_cache_config(_globals.config_dir, _globals.readonly, _gui_globals.cache_config)
 
     def on_app_close_request(self, window):
@@ -312,6 +422,9 @@ class MainWindow(BASE_WINDOW_CLASS):
             app = self.get_application()
             if app:
                 self._save_window_state()
+                _gui_globals.prewarm_manager.stop()
+                _gui_globals.recording_manager.stop()
+                _gui_globals.session_log_manager.stop()
                 app.quit()
 
         dialog = Adw.MessageDialog(
@@ -331,6 +444,9 @@ class MainWindow(BASE_WINDOW_CLASS):
                 app = self.get_application()
                 if app:
                     self._save_window_state()
+                    _gui_globals.prewarm_manager.stop()
+                    _gui_globals.recording_manager.stop()
+                    _gui_globals.session_log_manager.stop()
                     app.quit()
 
         dialog.connect("response", on_response)
@@ -338,8 +454,13 @@ class MainWindow(BASE_WINDOW_CLASS):
 
         return True
 
+    def close_terminals(self, widget: Gtk.Widget):
+        for terminal in self._find_all_terminals_in_widget(widget):
+            terminal.close()
+
     def on_sub_window_close_request(self, window, notebook):
         if window._force_quit:
+            self.close_terminals(notebook)
             _gui_globals.all_notebooks.remove(notebook)
             return False
 
@@ -347,6 +468,7 @@ class MainWindow(BASE_WINDOW_CLASS):
         is_active = any(t.connected for t in terminals)
 
         if not is_active:
+            self.close_terminals(notebook)
             _gui_globals.all_notebooks.remove(notebook)
             return False
 
@@ -381,6 +503,7 @@ class MainWindow(BASE_WINDOW_CLASS):
                 break
 
         if not is_active:
+            self.close_terminals(page.get_child())
             return False
 
         dialog = Adw.MessageDialog(
@@ -397,6 +520,7 @@ class MainWindow(BASE_WINDOW_CLASS):
 
         def on_response(d, response_id):
             if response_id == "close":
+                self.close_terminals(page.get_child())
                 notebook.close_page_finish(page, True)
             else:
                 notebook.close_page_finish(page, False)
@@ -419,13 +543,19 @@ class MainWindow(BASE_WINDOW_CLASS):
             self.history_view.open_history_in_tab(None, None, page.pulse_history_uuid)
             return
 
+        _gui_globals.session_manager.materialize(page)
+
         terminal = self._find_first_terminal_in_widget(content)
         self.connections_view.select_connection_from_terminal(terminal)
 
-    def open_all_connections_in_tabs(self, action, param, conns_to_start: Optional[List[_connection.Connection]], clustered=False, cluster_id: Optional[str] = None, cluster_name: Optional[str] = None):
+    def open_all_connections_in_tabs(self, action, param, conns_to_start: Optional[List[_connection.Connection]], clustered=False, cluster_id: Optional[str] = None, cluster_name: Optional[str] = None, prescanned=False):
         if not conns_to_start:
             return
 
+        if len(conns_to_start) > 1 and not prescanned:
+            _gui_globals.host_key_manager.prescan(conns_to_start, lambda: self.open_all_connections_in_tabs(action, param, conns_to_start, clustered, cluster_id, cluster_name, True))
+            return
+
         def do_open(c_id: Optional[str] = None, c_name: Optional[str] = None):
             if clustered and len(conns_to_start) > 1:
                 if not c_id or not c_name:
@@ -445,7 +575,7 @@ class MainWindow(BASE_WINDOW_CLASS):
                 return
         do_open()
 
-    def open_all_connections_split(self, action, param, conns_to_start: Optional[List[_connection.Connection]], clustered=False, cluster_id: Optional[str] = None, cluster_name: Optional[str] = None):
+    def open_all_connections_split(self, action, param, conns_to_start: Optional[List[_connection.Connection]], clustered=False, cluster_id: Optional[str] = None, cluster_name: Optional[str] = None, prescanned=False):
         if not conns_to_start:
             return
 
@@ -453,84 +583,29 @@ class MainWindow(BASE_WINDOW_CLASS):
         if num_conns == 0:
             return
 
+        if num_conns > 1 and not prescanned:
+            _gui_globals.host_key_manager.prescan(conns_to_start, lambda: self.open_all_connections_split(action, param, conns_to_start, clustered, cluster_id, cluster_name, True))
+            return
+
         if num_conns == 1:
             _gui_globals.layout_manager.open_connection_tab(conns_to_start[0])
             return
 
         notebook_w = _gui_globals.all_notebooks[0].get_allocated_width()
         notebook_h = _gui_globals.all_notebooks[0].get_allocated_height()
-
-        best_overall_cols = 1
-        best_overall_rows = num_conns
-        max_overall_squareness = -1
-
-        best_perfect_cols = 0
-        best_perfect_rows = 0
-        max_perfect_squareness = -1
-
-        for c in range(1, num_conns + 1):
-            r = math.ceil(num_conns / c)
-            cell_w = notebook_w / c
-            cell_h = notebook_h / r
-            if cell_w == 0 or cell_h == 0:
-                continue
-
-            squareness = min(cell_w, cell_h) / max(cell_w, cell_h)
-
-            if c * r == num_conns:
-                if squareness > max_perfect_squareness:
-                    max_perfect_squareness = squareness
-                    best_perfect_cols = c
-                    best_perfect_rows = r
-
-            if squareness > max_overall_squareness:
-                max_overall_squareness = squareness
-                best_overall_cols = c
-                best_overall_rows = r
-
-        cols = best_perfect_cols if best_perfect_cols > 0 else best_overall_cols
-        rows = best_perfect_rows if best_perfect_rows > 0 else best_overall_rows
-
-        def build_grid(items, is_vertical, total_items):
-            if not items or len(items) == 0:
-                return None
-            if len(items) == 1:
-                return items[0]
-
-            mid = len(items) // 2
-            start_items = items[:mid]
-            end_items = items[mid:]
-
-            paned = Gtk.Paned(orientation=Gtk.Orientation.VERTICAL if is_vertical else Gtk.Orientation.HORIZONTAL)
-            paned.set_start_child(build_grid(start_items, is_vertical, total_items))
-            paned.set_end_child(build_grid(end_items, is_vertical, total_items))
-
-            def _set_paned_position(paned: Gtk.Paned, start_items_len: int, items_len: int, is_vertical: bool):
-                if is_vertical:
-                    allocated_size = paned.get_allocated_height()
-                    if allocated_size > 0:
-                        paned.set_position(allocated_size * start_items_len // items_len)
-                else:
-                    allocated_size = paned.get_allocated_width()
-                    if allocated_size > 0:
-                        paned.set_position(allocated_size * start_items_len // items_len)
-                return GLib.SOURCE_REMOVE
-
-            GLib.idle_add(_set_paned_position, paned, len(start_items), len(items), is_vertical)
-            return paned
+        cols = _layout.best_grid_columns(num_conns, notebook_w, notebook_h)
 
         def do_open(c_id: Optional[str] = None, c_name: Optional[str] = None):
             if clustered and len(conns_to_start) > 1:
                 if not c_id or not c_name:
                     return
 
-            terminals = [_gui_globals.layout_manager.create_terminal(conn, c_id, c_name) for conn in conns_to_start]
-
-            grid_rows = [build_grid([terminals[r * cols + c] for c in range(cols) if r * cols + c < num_conns], False, cols) for r in range(rows)]
-            final_grid = build_grid(grid_rows, True, rows)
+            tiling_layout = _tiling_layout.TilingLayout('grid', cols)
+            for conn in conns_to_start:
+                tiling_layout.append(_gui_globals.layout_manager.create_terminal(conn, c_id, c_name))
 
             boxy = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-            boxy.append(final_grid)
+            boxy.append(tiling_layout)
             page = _gui_globals.all_notebooks[0].append(boxy)
             if len(conns_to_start) > 1 and cluster_id and cluster_name:
                 page.custom_title = cluster_name
@@ -572,15 +647,6 @@ class MainWindow(BASE_WINDOW_CLASS):
         if isinstance(widget, _vte_terminal.VteTerminal):
             return widget
 
-        if hasattr(widget, 'get_start_child') and widget.get_start_child():
-            term = self._find_first_terminal_in_widget(widget.get_start_child())
-            if term:
-                return term
-        if hasattr(widget, 'get_end_child') and widget.get_end_child():
-            term = self._find_first_terminal_in_widget(widget.get_end_child())
-            if term:
-                return term
-
         if hasattr(widget, 'get_child') and widget.get_child():
              term = self._find_first_terminal_in_widget(widget.get_child())
              if term:
@@ -603,12 +669,7 @@ class MainWindow(BASE_WINDOW_CLASS):
             return terminals
 
         children = []
-        if hasattr(widget, 'get_start_child') and widget.get_start_child():
-            children.append(widget.get_start_child())
-        if hasattr(widget, 'get_end_child') and widget.get_end_child():
-            children.append(widget.get_end_child())
-
-        if not children and hasattr(widget, 'get_child') and widget.get_child():
+        if hasattr(widget, 'get_child') and widget.get_child():
              children.append(widget.get_child())
 
         if not children and hasattr(widget, 'get_first_child'):
@@ -633,6 +694,15 @@ class MainWindow(BASE_WINDOW_CLASS):
             page.set_needs_attention(False)
             return
 
+        pending_layout = getattr(page, 'pending_layout', None)
+        if pending_layout:
+            custom_title = getattr(page, 'custom_title', None)
+            conn_names = [_globals.connections[leaf.conn_uuid].name for leaf in _layout.iter_leaves(pending_layout) if leaf.conn_uuid in _globals.connections]
+            page.set_title(GLib.markup_escape_text(custom_title or " + ".join(dict.fromkeys(conn_names))))
+            page.set_indicator_icon(Gio.Icon.new_for_string("emblem-unmounted"))
+            page.set_needs_attention(False)
+            return
+
         terminals = self._find_all_terminals_in_widget(content)
 
         custom_title = page.custom_title if hasattr(page, 'custom_title') else None
@@ -660,3 +730,10 @@ class MainWindow(BASE_WINDOW_CLASS):
         else:
             page.set_indicator_icon(Gio.Icon.new_for_string("emblem-unmounted"))
             page.set_needs_attention(True)
+
+        active_terminals = [t for t in terminals if t.has_activity]
+        if active_terminals:
+            page.set_needs_attention(True)
+            page.set_tooltip("\n".join(GLib.markup_escape_text(f"{t.pulse_conn.name}: {_gui_globals.activity_manager.get_new_lines(t)} new lines") for t in active_terminals))
+        else:
+            page.set_tooltip("")
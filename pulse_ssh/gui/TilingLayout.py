@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import Gdk  # type: ignore
+from gi.repository import Gtk  # type: ignore
+from typing import List
+from typing import Optional
+import math
+
+MODES = ('grid', 'rows', 'columns')
+HANDLE_SIZE = 1
+GRAB_MARGIN = 4
+MIN_PANE_SIZE = 24
+
+def orientation_mode(orientation: Gtk.Orientation) -> str:
+    """Maps a split orientation to a layout mode: horizontal splits put panes side by side."""
+    return 'columns' if orientation == Gtk.Orientation.HORIZONTAL else 'rows'
+
+def grid_shape(mode: str, n_panes: int, columns: Optional[int] = None) -> tuple[int, int]:
+    if n_panes == 0:
+        return (0, 0)
+    if mode == 'columns':
+        return (n_panes, 1)
+    if mode == 'rows':
+        return (1, n_panes)
+    cols = max(1, min(columns or math.ceil(math.sqrt(n_panes)), n_panes))
+    return (cols, math.ceil(n_panes / cols))
+
+def split_sizes(total: int, ratios: List[float]) -> List[int]:
+    """Splits total pixels by ratios, giving the rounding leftover to the last cell."""
+    weight = sum(ratios) or 1
+    sizes = [int(total * ratio / weight) for ratio in ratios]
+    if sizes:
+        sizes[-1] += total - sum(sizes)
+    return sizes
+
+def compute_cells(mode: str, n_panes: int, columns: Optional[int], row_ratios: List[float], column_ratios: List[float], width: int, height: int, spacing: int = HANDLE_SIZE) -> List[tuple[int, int, int, int]]:
+    """Returns an (x, y, width, height) cell per pane; a short last row spreads its panes over the full width."""
+    cols, rows = grid_shape(mode, n_panes, columns)
+    if not rows:
+        return []
+
+    heights = split_sizes(max(0, height - spacing * (rows - 1)), row_ratios if len(row_ratios) == rows else [1] * rows)
+    cells = []
+    y = 0
+    for row in range(rows):
+        count = min(cols, n_panes - row * cols)
+        ratios = column_ratios if count == cols and len(column_ratios) == cols else [1] * count
+        x = 0
+        for cell_width in split_sizes(max(0, width - spacing * (count - 1)), ratios):
+            cells.append((x, y, cell_width, heights[row]))
+            x += cell_width + spacing
+        y += heights[row] + spacing
+    return cells
+
+class TilingLayout(Gtk.Widget):
+    """Lays out a flat list of panes as a grid, a row or a column in a single allocation pass."""
+    __gtype_name__ = 'TilingLayout'
+
+    def __init__(self, mode: str = 'grid', columns: Optional[int] = None):
+        super().__init__()
+        self.mode = mode if mode in MODES else 'grid'
+        self.columns = columns
+        self.row_ratios: List[float] = []
+        self.column_ratios: List[float] = []
+        self.n_panes = 0
+        self.cells: List[tuple[int, int, int, int]] = []
+        self.drag_handle: Optional[tuple[str, int]] = None
+        self.drag_sizes: List[int] = []
+
+        self.set_hexpand(True)
+        self.set_vexpand(True)
+        self.set_overflow(Gtk.Overflow.HIDDEN)
+        self.add_css_class("tiling-layout")
+
+        # Capture phase: the margin around a handle overlaps the panes, whose terminals would otherwise take the press first.
+        drag_gesture = Gtk.GestureDrag()
+        drag_gesture.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+        drag_gesture.connect("drag-begin", self.on_drag_begin)
+        drag_gesture.connect("drag-update", self.on_drag_update)
+        drag_gesture.connect("drag-end", self.on_drag_end)
+        self.add_controller(drag_gesture)
+
+        motion_controller = Gtk.EventControllerMotion()
+        motion_controller.connect("motion", self.on_motion)
+        self.add_controller(motion_controller)
+
+    def get_panes(self) -> List[Gtk.Widget]:
+        panes = []
+        child = self.get_first_child()
+        while child:
+            panes.append(child)
+            child = child.get_next_sibling()
+        return panes
+
+    def append(self, pane: Gtk.Widget):
+        pane.insert_before(self, None)
+        self._panes_changed(1)
+
+    def insert_after(self, pane: Gtk.Widget, sibling: Optional[Gtk.Widget]):
+        """Places pane right after sibling, or first when sibling is None."""
+        pane.insert_after(self, sibling)
+        self._panes_changed(1)
+
+    def remove(self, pane: Gtk.Widget):
+        pane.unparent()
+        self._panes_changed(-1)
+
+    def replace(self, old_pane: Gtk.Widget, new_pane: Gtk.Widget):
+        new_pane.insert_after(self, old_pane)
+        old_pane.unparent()
+        self.queue_allocate()
+
+    def set_layout(self, mode: str, columns: Optional[int] = None, row_ratios: Optional[List[float]] = None, column_ratios: Optional[List[float]] = None):
+        self.mode = mode if mode in MODES else 'grid'
+        self.columns = columns
+        self.row_ratios = list(row_ratios or [])
+        self.column_ratios = list(column_ratios or [])
+        self.queue_resize()
+
+    def _panes_changed(self, delta: int):
+        self.n_panes += delta
+        cols, rows = grid_shape(self.mode, self.n_panes, self.columns)
+        if len(self.row_ratios) != rows:
+            self.row_ratios = []
+        if len(self.column_ratios) != cols:
+            self.column_ratios = []
+        self.queue_resize()
+
+    def do_measure(self, orientation, for_size):
+        cols, rows = grid_shape(self.mode, self.n_panes, self.columns)
+        if not rows:
+            return (0, 0, -1, -1)
+
+        line_minimum = [0] * rows
+        line_natural = [0] * rows
+        for index, pane in enumerate(self.get_panes()):
+            minimum, natural, _, _ = pane.measure(orientation, -1)
+            row = index // cols
+            if orientation == Gtk.Orientation.HORIZONTAL:
+                line_minimum[row] += minimum
+                line_natural[row] += natural
+            else:
+                line_minimum[row] = max(line_minimum[row], minimum)
+                line_natural[row] = max(line_natural[row], natural)
+
+        if orientation == Gtk.Orientation.HORIZONTAL:
+            spacing = HANDLE_SIZE * (cols - 1)
+            return (max(line_minimum) + spacing, max(line_natural) + spacing, -1, -1)
+        spacing = HANDLE_SIZE * (rows - 1)
+        return (sum(line_minimum) + spacing, sum(line_natural) + spacing, -1, -1)
+
+    def do_size_allocate(self, width, height, baseline):
+        self.cells = compute_cells(self.mode, self.n_panes, self.columns, self.row_ratios, self.column_ratios, width, height)
+        for pane, (x, y, cell_width, cell_height) in zip(self.get_panes(), self.cells):
+            allocation = Gdk.Rectangle()
+            allocation.x, allocation.y, allocation.width, allocation.height = x, y, cell_width, cell_height
+            pane.size_allocate(allocation, -1)
+
+    def do_dispose(self):
+        child = self.get_first_child()
+        while child:
+            next_child = child.get_next_sibling()
+            child.unparent()
+            child = next_child
+        self.n_panes = 0
+        Gtk.Widget.do_dispose(self)
+
+    def find_handle(self, x: float, y: float) -> Optional[tuple[str, int]]:
+        """Returns ('column', i) or ('row', i) when (x, y) is on the gap after column or row i."""
+        cols, rows = grid_shape(self.mode, self.n_panes, self.columns)
+        if not self.cells:
+            return None
+        for col in range(min(cols, len(self.cells)) - 1):
+            cell_x, _, cell_width, _ = self.cells[col]
+            if abs(x - (cell_x + cell_width + HANDLE_SIZE / 2)) <= GRAB_MARGIN:
+                return ('column', col)
+        for row in range(rows - 1):
+            _, cell_y, _, cell_height = self.cells[row * cols]
+            if abs(y - (cell_y + cell_height + HANDLE_SIZE / 2)) <= GRAB_MARGIN:
+                return ('row', row)
+        return None
+
+    def on_motion(self, controller, x, y):
+        handle = self.find_handle(x, y)
+        if handle:
+            self.set_cursor_from_name("col-resize" if handle[0] == 'column' else "row-resize")
+        else:
+            self.set_cursor(None)
+
+    def on_drag_begin(self, gesture, x, y):
+        self.drag_handle = self.find_handle(x, y)
+        if not self.drag_handle:
+            gesture.set_state(Gtk.EventSequenceState.DENIED)
+            return
+        gesture.set_state(Gtk.EventSequenceState.CLAIMED)
+
+        cols, rows = grid_shape(self.mode, self.n_panes, self.columns)
+        if self.drag_handle[0] == 'column':
+            self.drag_sizes = [cell[2] for cell in self.cells[:cols]]
+        else:
+            self.drag_sizes = [self.cells[row * cols][3] for row in range(rows)]
+
+    def on_drag_update(self, gesture, offset_x, offset_y):
+        if not self.drag_handle:
+            return
+        kind, index = self.drag_handle
+        sizes = list(self.drag_sizes)
+        pair_total = sizes[index] + sizes[index + 1]
+        offset = offset_x if kind == 'column' else offset_y
+        sizes[index] = int(min(max(sizes[index] + offset, MIN_PANE_SIZE), pair_total - MIN_PANE_SIZE))
+        sizes[index + 1] = pair_total - sizes[index]
+        if kind == 'column':
+            self.column_ratios = sizes
+        else:
+            self.row_ratios = sizes
+        self.queue_allocate()
+
+    def on_drag_end(self, gesture, offset_x, offset_y):
+        self.drag_handle = None
+        self.drag_sizes = []
@@ -14,20 +14,43 @@ from gi.repository import GLib  # type: ignore
 from gi.repository import Gtk  # type: ignore
 from gi.repository import Pango  # type: ignore
 from gi.repository import Vte  # type: ignore
+from typing import Callable
 from typing import Optional
+import os
+import pulse_ssh.data.Connection as _connection
 import pulse_ssh.data.HistoryEntry as _history_entry
+import pulse_ssh.data.LaunchPlan as _launch_plan
 import pulse_ssh.Globals as _globals
 import pulse_ssh.gui.Globals as _gui_globals
 import pulse_ssh.Utils as _utils
+import signal
+import threading
+import time
+import uuid
+
+# Leaves the alternate screen and soft-resets modes a dead session may have left on, so the old output stays in scrollback.
+RESET_SESSION_MODES = "\x1b[?1049l\x1b[!p"
 
 class VteTerminal(Vte.Terminal):
     def __init__(self, app_window, **kwargs):
         super().__init__()
         self.app_window = app_window
+        self.terminal_id = uuid.uuid4().hex
+        self.reconnect_attempts = 0
+        self.closed = False
+        self.child_pid: Optional[int] = None
+        self.is_replay = False
 
         self.set_hexpand(True)
         self.set_vexpand(True)
-        self.set_scrollback_lines(_globals.app_config.scrollback_lines)
+        self.scrollback_limit = _globals.app_config.scrollback_lines
+        self.hidden_since: Optional[float] = None
+        self.spilled_lines = 0
+        self.throttled = False
+        self.has_activity = False
+        self.activity_handler_id: Optional[int] = None
+        self.hidden_row = 0
+        self.set_scrollback_lines(self.scrollback_limit)
         self.set_scroll_on_output(_globals.app_config.scroll_on_output)
         self.set_scroll_on_keystroke(_globals.app_config.scroll_on_keystroke)
         self.set_scroll_on_insert(_globals.app_config.scroll_on_insert)
@@ -39,6 +62,116 @@ class VteTerminal(Vte.Terminal):
         self.set_margin_start(1)
         self.set_margin_end(1)
 
+        self.connect("destroy", self.on_terminal_destroyed)
+        self.connect("map", self.on_terminal_mapped)
+        self.connect("unmap", self.on_terminal_unmapped)
+
+    def spawn_launch_plan(self, plan: _launch_plan.LaunchPlan):
+        _gui_globals.admission_manager.submit(self, plan.first_hop, lambda: self.start_launch_plan(plan))
+
+    def start_launch_plan(self, plan: _launch_plan.LaunchPlan):
+        cursor = self.get_cursor_position()
+        handler_id = [None]
+        def on_first_output(terminal):
+            if terminal.get_cursor_position() == cursor:
+                return
+            terminal.disconnect(handler_id[0])
+            _gui_globals.admission_manager.release(terminal)
+        handler_id[0] = self.connect("contents-changed", on_first_output)
+
+        self.spawn_async(
+            Vte.PtyFlags.DEFAULT,
+            os.environ['HOME'],
+            plan.spawn_argv(_globals.app_config.shell_program),
+            plan.spawn_envv(),
+            GLib.SpawnFlags.SEARCH_PATH,
+            None, None, -1, None, self.on_spawned, None
+        )
+
+    def on_spawned(self, terminal, pid, error, user_data):
+        if pid > 0:
+            self.child_pid = pid
+
+    def spawn_session(self, connection: _connection.Connection):
+        raise NotImplementedError
+
+    def load_agent_key(self, connection: _connection.Connection, on_ready: Callable[[Optional[bool]], None]):
+        """Checks the connection's key against ssh-agent on a worker thread, then calls on_ready(loaded) on the GTK thread; None when no key is involved."""
+        if not _utils.needs_agent_key(connection):
+            on_ready(None)
+            return
+        threading.Thread(target=self._agent_key_worker, args=(connection, on_ready), daemon=True).start()
+
+    def _agent_key_worker(self, connection: _connection.Connection, on_ready: Callable[[Optional[bool]], None]):
+        key_loaded = _utils.ensure_agent_key(_globals.app_config, connection)
+        GLib.idle_add(self._on_agent_key_ready, on_ready, key_loaded)
+
+    def _on_agent_key_ready(self, on_ready: Callable[[Optional[bool]], None], key_loaded: bool):
+        if not self.closed:
+            on_ready(key_loaded)
+        return GLib.SOURCE_REMOVE
+
+    def watch_for_prompt(self):
+        pass
+
+    def respawn(self):
+        """Starts a new session in this widget, keeping its scrollback, controllers and cluster membership."""
+        connection = _globals.connections.get(self.pulse_conn.uuid, self.pulse_conn)
+        timestamp = GLib.DateTime.new_now_local().format("%Y-%m-%d %H:%M:%S")
+        message = f"\r\n{_utils.color_iyellow} --- Reconnecting to '{connection.name}' at {timestamp}.{_utils.color_reset}\r\n"
+        self.feed(message.encode('utf-8'))
+
+        self.pulse_conn = connection
+        self.connect_time = GLib.get_monotonic_time()
+        self.connected = True
+        self.spawn_session(connection)
+        self.watch_for_prompt()
+
+        notebook, page = self.get_ancestor_page()
+        if page:
+            self.app_window.updatePageTitle(page)
+
+    def substitute_variables(self, command: str) -> str:
+        cluster_name = None
+        terminal_index = None
+        cluster_id = getattr(self, 'pulse_cluster_id', None)
+        if cluster_id and cluster_id in _gui_globals.active_clusters:
+            cluster = _gui_globals.active_clusters[cluster_id]
+            cluster_name = cluster.name
+            if self in cluster.terminals:
+                terminal_index = cluster.terminals.index(self) + 1
+        return _utils.substitute_variables(command, self.pulse_conn, getattr(self, 'proxy_port', None), cluster_name, terminal_index)
+
+    def close(self):
+        """Hangs up the session and gives back what it holds when its pane or tab closes; "destroy" only fires once nothing references the widget."""
+        if self.closed:
+            return
+        self.closed = True
+        _gui_globals.admission_manager.release(self)
+        _gui_globals.reconnect_manager.cancel(self)
+        _gui_globals.scrollback_manager.release(self)
+        _utils.release_proxy_port(self.terminal_id)
+        _gui_globals.session_log_manager.unwatch(self)
+        _gui_globals.recording_manager.release(self)
+        if self.child_pid:
+            try:
+                os.kill(self.child_pid, signal.SIGHUP)
+            except OSError:
+                pass
+            self.child_pid = None
+
+    def on_terminal_destroyed(self, terminal):
+        self.close()
+
+    def on_terminal_mapped(self, terminal):
+        self.hidden_since = None
+        if _gui_globals.activity_manager.is_visible(self):
+            _gui_globals.activity_manager.on_shown(self)
+
+    def on_terminal_unmapped(self, terminal):
+        self.hidden_since = time.monotonic()
+        _gui_globals.activity_manager.on_hidden(self)
+
     def add_toast(self, toast: Adw.Toast):
         ancestor = self.get_ancestor(Gtk.ApplicationWindow)
         if ancestor and ancestor.toast_overlay:
@@ -55,6 +188,11 @@ class VteTerminal(Vte.Terminal):
 
     def on_terminal_child_exited(self, terminal, exit_code):
         self.connected = False
+        self.child_pid = None
+        _gui_globals.admission_manager.release(self)
+        _utils.release_proxy_port(self.terminal_id)
+        if self.closed:
+            return
 
         notebook, page = self.get_ancestor_page()
         if not notebook or not page:
@@ -67,8 +205,9 @@ class VteTerminal(Vte.Terminal):
         timestamp = GLib.DateTime.new_now_local().format("%Y-%m-%d %H:%M:%S")
 
         connection = self.pulse_conn
-        cluster_id = self.pulse_cluster_id
-        cluster_name = self.pulse_cluster_name
+
+        if behavior != "close":
+            self.feed(RESET_SESSION_MODES.encode('utf-8'))
 
         def wait_for_key_behavior():
             message = (
@@ -84,7 +223,8 @@ class VteTerminal(Vte.Terminal):
             def on_key_pressed(controller, keyval, keycode, state):
                 if keyval in (Gdk.KEY_Return, Gdk.KEY_KP_Enter):
                     self.remove_controller(evk)
-                    _gui_globals.layout_manager.replace_terminal(self, _gui_globals.layout_manager.create_terminal(connection, cluster_id, cluster_name))
+                    self.reconnect_attempts = 0
+                    self.respawn()
                     return True
                 if keyval == Gdk.KEY_Escape:
                     self.remove_controller(evk)
@@ -97,12 +237,9 @@ class VteTerminal(Vte.Terminal):
         if behavior == "close":
             _gui_globals.layout_manager.close_terminal(None, None, self)
         elif behavior == "restart":
-            connect_duration = GLib.get_monotonic_time() - self.connect_time
-            if connect_duration < 5 * 1_000_000:
-                self.add_toast(Adw.Toast.new(GLib.markup_escape_text(f"Restart loop detected for '{connection.name}'. Pausing auto-restart.")))
+            if not _gui_globals.reconnect_manager.schedule(self):
+                self.add_toast(Adw.Toast.new(GLib.markup_escape_text(f"Gave up reconnecting to '{connection.name}' after {_globals.app_config.reconnect_max_attempts} attempts.")))
                 wait_for_key_behavior()
-            else:
-                _gui_globals.layout_manager.replace_terminal(self, _gui_globals.layout_manager.create_terminal(connection, cluster_id, cluster_name))
         elif behavior == "wait_for_key":
             wait_for_key_behavior()
 
@@ -130,6 +267,43 @@ class VteTerminal(Vte.Terminal):
 
         return submenu
 
+    def _create_layout_submenu(self, action_group, page):
+        submenu = Gio.Menu()
+
+        rebalance_action = Gio.SimpleAction.new("layout_rebalance", None)
+        rebalance_action.connect("activate", _gui_globals.layout_manager.rebalance_page, self)
+        action_group.add_action(rebalance_action)
+        submenu.append("Rebalance", "term.layout_rebalance")
+
+        tabs_to_grid_action = Gio.SimpleAction.new("layout_tabs_to_grid", None)
+        tabs_to_grid_action.connect("activate", _gui_globals.layout_manager.tabs_to_grid, self)
+        action_group.add_action(tabs_to_grid_action)
+        submenu.append("Gather Tabs into Grid", "term.layout_tabs_to_grid")
+
+        grid_to_tabs_action = Gio.SimpleAction.new("layout_grid_to_tabs", None)
+        grid_to_tabs_action.connect("activate", _gui_globals.layout_manager.grid_to_tabs, self)
+        action_group.add_action(grid_to_tabs_action)
+        submenu.append("Split Grid into Tabs", "term.layout_grid_to_tabs")
+
+        swap_submenu = Gio.Menu()
+        others = [t for t in self.app_window._find_all_terminals_in_widget(page.get_child()) if t is not self] if page else []
+        for index, other in enumerate(others):
+            action_name = f"layout_swap_{index}"
+            swap_action = Gio.SimpleAction.new(action_name, None)
+            swap_action.connect("activate", _gui_globals.layout_manager.swap_panes, self, other)
+            action_group.add_action(swap_action)
+            swap_submenu.append(f"{index + 1}: {other.pulse_conn.name}", f"term.{action_name}")
+        if others:
+            submenu.append_submenu("Swap With", swap_submenu)
+
+        return submenu
+
+    def _create_record_action(self, action_group) -> str:
+        record_action = Gio.SimpleAction.new("record", None)
+        record_action.connect("activate", _gui_globals.recording_manager.toggle, self)
+        action_group.add_action(record_action)
+        return "Stop Recording" if _gui_globals.recording_manager.is_recording(self) else "Record Session"
+
     def _create_new_cluster(self, terminal):
         def on_name_received(cluster_id, cluster_name):
             if cluster_id and cluster_name:
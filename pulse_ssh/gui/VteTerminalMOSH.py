@@ -10,13 +10,13 @@ from gi.repository import Gdk  # type: ignore
 from gi.repository import Gio  # type: ignore
 from gi.repository import GLib  # type: ignore
 from gi.repository import Gtk  # type: ignore
-from gi.repository import Vte  # type: ignore
 from typing import Optional
 import json
 import os
 import pulse_ssh.data.Connection as _connection
 import pulse_ssh.Globals as _globals
 import pulse_ssh.gui.Globals as _gui_globals
+import pulse_ssh.gui.TilingLayout as _tiling_layout
 import pulse_ssh.gui.VteTerminal as _vte_terminal
 import pulse_ssh.Utils as _utils
 
@@ -28,34 +28,9 @@ class VteTerminalMOSH(_vte_terminal.VteTerminal):
         self.proxy_port: Optional[int] = None
         self.ssh_orchestrator_process: Optional[Gio.Subprocess] = None
 
-        final_cmd, self.proxy_port = _utils.build_mosh_command(_globals.app_config, connection)
-        args = [_globals.app_config.shell_program, "-c", final_cmd]
+        self.spawn_session(connection)
 
-        self.spawn_async(
-            Vte.PtyFlags.DEFAULT,
-            os.environ['HOME'],
-            args,
-            [],
-            GLib.SpawnFlags.SEARCH_PATH,
-            None, None, -1, None, None, None
-        )
-
-        handler_id = [None]
-        def on_prompt_detected(terminal):
-            last_line = terminal.get_last_line()
-            if last_line and last_line.rstrip().endswith(('$', '#', '>', '%')):
-                if handler_id[0]:
-                    terminal.disconnect(handler_id[0])
-                    handler_id[0] = None
-                terminal.grab_focus()
-                self.app_window.connections_view.select_connection_from_terminal(terminal)
-
-                self.start_ssh_orchestrator_script()
-
-                return True
-            return False
-
-        handler_id[0] = self.connect("contents-changed", on_prompt_detected)
+        self.watch_for_prompt()
 
         click_gesture = Gtk.GestureClick()
         click_gesture.set_button(Gdk.BUTTON_SECONDARY)
@@ -81,6 +56,33 @@ class VteTerminalMOSH(_vte_terminal.VteTerminal):
 
         self.connected = True
 
+    def spawn_session(self, connection: _connection.Connection):
+        self.load_agent_key(connection, lambda key_loaded: self.start_session(connection, key_loaded))
+
+    def start_session(self, connection: _connection.Connection, key_loaded: Optional[bool]):
+        plan = _utils.build_mosh_command(_globals.app_config, connection, self.terminal_id, key_loaded)
+        self.proxy_port = plan.proxy_port
+        self.spawn_launch_plan(plan)
+
+    def watch_for_prompt(self):
+        handler_id = [None]
+        def on_prompt_detected(terminal):
+            last_line = terminal.get_last_line()
+            if last_line and last_line.rstrip().endswith(('$', '#', '>', '%')):
+                if handler_id[0]:
+                    terminal.disconnect(handler_id[0])
+                    handler_id[0] = None
+                terminal.grab_focus()
+                self.app_window.connections_view.select_connection_from_terminal(terminal)
+
+                if not self.ssh_orchestrator_process:
+                    self.start_ssh_orchestrator_script()
+
+                return True
+            return False
+
+        handler_id[0] = self.connect("contents-changed", on_prompt_detected)
+
     def build_menu(self, gesture, n_press, x, y):
         notebook, page = self.get_ancestor_page()
         if not notebook or not page:
@@ -129,12 +131,18 @@ class VteTerminalMOSH(_vte_terminal.VteTerminal):
         split_v_submenu = self._create_split_submenu(action_group, Gtk.Orientation.VERTICAL, page)
         menu_model.append_submenu("Split Vertical", split_v_submenu)
 
+        layout_submenu = self._create_layout_submenu(action_group, page)
+        menu_model.append_submenu("Layout", layout_submenu)
+
         cluster_submenu = self._create_cluster_submenu(self, action_group)
         menu_model.append_submenu("Cluster", cluster_submenu)
 
         page_cluster_submenu = self._create_page_cluster_submenu(self, action_group)
         menu_model.append_submenu("Page Cluster", page_cluster_submenu)
 
+        record_label = self._create_record_action(action_group)
+        menu_model.append(record_label, "term.record")
+
         menu_model.append_section(None, Gio.Menu())
 
         rename_action = Gio.SimpleAction.new("rename_tab", None)
@@ -154,7 +162,7 @@ class VteTerminalMOSH(_vte_terminal.VteTerminal):
             menu_model.append("Attach to Main Window", "term.attach")
 
         parent = self.get_parent().get_parent()
-        if isinstance(parent, Gtk.Paned):
+        if isinstance(parent, _tiling_layout.TilingLayout):
             unsplit_action = Gio.SimpleAction.new("unsplit", None)
             unsplit_action.connect("activate", _gui_globals.layout_manager.unsplit_terminal, self)
             action_group.add_action(unsplit_action)
@@ -213,7 +221,7 @@ class VteTerminalMOSH(_vte_terminal.VteTerminal):
         return submenu
 
     def run_local_cmd(self, action, param, cmd):
-        substituted_cmd = _utils.substitute_variables(cmd, self.pulse_conn, self.proxy_port)
+        substituted_cmd = self.substitute_variables(cmd)
         def on_finished(subprocess, result, cmd, conn_uuid):
             try:
                 ok, stdout, stderr = subprocess.communicate_utf8_finish(result)
@@ -230,10 +238,10 @@ class VteTerminalMOSH(_vte_terminal.VteTerminal):
     def run_remote_cmd(self, action, param, cmd):
         if self.pulse_cluster_id and self.pulse_cluster_id in _gui_globals.active_clusters:
             for terminal in _gui_globals.active_clusters[self.pulse_cluster_id].terminals:
-                substituted_cmd = _utils.substitute_variables(cmd, terminal.pulse_conn, terminal.proxy_port)
+                substituted_cmd = terminal.substitute_variables(cmd)
                 terminal.feed_child(f"{substituted_cmd}\n".encode('utf-8'))
         else:
-            substituted_cmd = _utils.substitute_variables(cmd, self.pulse_conn, self.proxy_port)
+            substituted_cmd = self.substitute_variables(cmd)
             self.feed_child(f"{substituted_cmd}\n".encode('utf-8'))
 
     def open_sftp_tab(self, action, param):
@@ -287,7 +295,7 @@ class VteTerminalMOSH(_vte_terminal.VteTerminal):
                                 elif action == 'get-variable':
                                     variable = msg.get('data')
                                     if variable:
-                                        output = _utils.substitute_variables(variable, self.pulse_conn, self.proxy_port)
+                                        output = self.substitute_variables(variable)
 
                                 if output:
                                     self.ssh_orchestrator_stdin.write(f"{output}\n".encode('utf-8'), None)
@@ -325,7 +333,7 @@ class VteTerminalMOSH(_vte_terminal.VteTerminal):
                 self.add_history_item(self.pulse_conn.uuid, script_path, "", message, False)
                 return
 
-            self.subbed_ssh_orchestrator_script_path = _utils.substitute_variables(script_path, self.pulse_conn, self.proxy_port)
+            self.subbed_ssh_orchestrator_script_path = self.substitute_variables(script_path)
 
             try:
                 self.ssh_orchestrator_process = Gio.Subprocess.new(
@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import GLib  # type: ignore
+from gi.repository import Gtk  # type: ignore
+from typing import Optional
+import os
+import pulse_ssh.Asciicast as _asciicast
+import pulse_ssh.data.Connection as _connection
+import pulse_ssh.gui.VteTerminal as _vte_terminal
+import threading
+import time
+
+PLAYBACK_SPEEDS = {
+    "0.5×": 0.5,
+    "1×": 1.0,
+    "2×": 2.0,
+    "4×": 4.0,
+    "16×": 16.0,
+}
+TICK_MS = 100
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+class VteTerminalPlayer(_vte_terminal.VteTerminal):
+    """Replays an asciicast v2 recording; seeking starts from the nearest keyframe instead of the beginning."""
+
+    def __init__(self, app_window, path: str, **kwargs):
+        super().__init__(app_window, **kwargs)
+        self.is_replay = True
+        self.set_input_enabled(False)
+
+        self.path = path
+        self.stream = open(path, 'rb')
+        try:
+            self.header = _asciicast.read_header(self.stream)
+        except ValueError:
+            self.stream.close()
+            raise
+        self.index = _asciicast.CastIndex(self.stream.tell())
+        self.index_ready = False
+
+        self.position = 0.0
+        self.play_started: Optional[float] = None
+        self.speed = 1.0
+        self.pending: Optional[_asciicast.Event] = None
+        self.source_id: Optional[int] = None
+
+        title = self.header.get("title") or os.path.basename(path)
+        self.pulse_conn = _connection.Connection(name=f"Replay: {title}", type="local")
+        self.pulse_cluster_id = None
+        self.pulse_cluster_name = None
+        self.connect_time = GLib.get_monotonic_time()
+        self.connected = False
+        self.resize_to(self.header.get("width"), self.header.get("height"))
+
+        threading.Thread(target=self._index_worker, daemon=True).start()
+
+    def _index_worker(self):
+        try:
+            _, index = _asciicast.build_index(self.path)
+        except (OSError, ValueError):
+            return
+        GLib.idle_add(self._on_index_ready, index)
+
+    def _on_index_ready(self, index: _asciicast.CastIndex):
+        if self.stream.closed:
+            return GLib.SOURCE_REMOVE
+        self.index = index
+        self.index_ready = True
+        if hasattr(self, 'position_scale'):
+            self.position_scale.set_range(0, max(index.duration, 1.0))
+            self.position_scale.set_sensitive(True)
+        self.update_controls()
+        return GLib.SOURCE_REMOVE
+
+    def build_controls(self) -> Gtk.Box:
+        bar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        bar.add_css_class("toolbar")
+
+        self.play_button = Gtk.Button(icon_name="media-playback-start-symbolic")
+        self.play_button.set_tooltip_text("Play")
+        self.play_button.connect("clicked", self.on_play_clicked)
+        bar.append(self.play_button)
+
+        self.position_scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, 0, 1, 1)
+        self.position_scale.set_hexpand(True)
+        self.position_scale.set_draw_value(False)
+        self.position_scale.set_sensitive(False)
+        self.position_scale.connect("change-value", self.on_scale_change_value)
+        bar.append(self.position_scale)
+
+        self.time_label = Gtk.Label()
+        bar.append(self.time_label)
+
+        self.speed_dropdown = Gtk.DropDown.new_from_strings(list(PLAYBACK_SPEEDS.keys()))
+        self.speed_dropdown.set_selected(list(PLAYBACK_SPEEDS.values()).index(self.speed))
+        self.speed_dropdown.set_tooltip_text("Playback Speed")
+        self.speed_dropdown.connect("notify::selected", self.on_speed_changed)
+        bar.append(self.speed_dropdown)
+
+        self.update_controls()
+        return bar
+
+    def is_playing(self) -> bool:
+        return self.play_started is not None
+
+    def current_position(self) -> float:
+        if self.play_started is None:
+            return self.position
+        return self.position + (time.monotonic() - self.play_started) * self.speed
+
+    def play(self):
+        if self.is_playing():
+            return
+        if self.index_ready and self.position >= self.index.duration:
+            self.seek(0.0)
+        self.play_started = time.monotonic()
+        self._schedule()
+        self.update_controls()
+
+    def pause(self):
+        if not self.is_playing():
+            return
+        self.position = self.current_position()
+        self.play_started = None
+        if self.source_id:
+            GLib.source_remove(self.source_id)
+            self.source_id = None
+        self.update_controls()
+
+    def seek(self, target: float):
+        """Resets the screen, jumps to the last keyframe before target and replays only the events in between."""
+        keyframe_time, offset = self.index.seek(target)
+        fed = self.current_position()
+        if target < fed or keyframe_time > fed:
+            self.reset(True, True)
+            self.stream.seek(offset)
+            self.pending = None
+        self._feed_until(target)
+        self.position = target
+        if self.is_playing():
+            self.play_started = time.monotonic()
+            if self.source_id:
+                GLib.source_remove(self.source_id)
+            self._schedule()
+        self.update_controls()
+
+    def resize_to(self, columns, rows):
+        if isinstance(columns, int) and isinstance(rows, int) and columns > 0 and rows > 0:
+            self.set_size(columns, rows)
+
+    def _feed_until(self, position: float):
+        chunks = []
+        while True:
+            if self.pending is None:
+                self.pending = _asciicast.read_event(self.stream)
+                if self.pending is None:
+                    break
+            elapsed, code, data = self.pending
+            if elapsed > position:
+                break
+            self.pending = None
+            if code == "o":
+                chunks.append(data)
+            elif code == "r":
+                self.feed("".join(chunks).encode('utf-8'))
+                chunks = []
+                columns, _, rows = data.partition("x")
+                if columns.isdigit() and rows.isdigit():
+                    self.resize_to(int(columns), int(rows))
+        if chunks:
+            self.feed("".join(chunks).encode('utf-8'))
+
+    def _schedule(self):
+        delay = TICK_MS
+        if self.pending:
+            delay = min(TICK_MS, max(1, int((self.pending[0] - self.current_position()) / self.speed * 1000)))
+        self.source_id = GLib.timeout_add(delay, self._on_tick)
+
+    def _on_tick(self):
+        self.source_id = None
+        position = self.current_position()
+        self._feed_until(position)
+        if self.pending is None and (not self.index_ready or position >= self.index.duration):
+            self.position = min(position, self.index.duration) if self.index_ready else position
+            self.play_started = None
+        else:
+            self._schedule()
+        self.update_controls()
+        return GLib.SOURCE_REMOVE
+
+    def update_controls(self):
+        if not hasattr(self, 'play_button'):
+            return
+        playing = self.is_playing()
+        self.play_button.set_icon_name("media-playback-pause-symbolic" if playing else "media-playback-start-symbolic")
+        self.play_button.set_tooltip_text("Pause" if playing else "Play")
+
+        position = self.current_position()
+        if self.index_ready:
+            position = min(position, self.index.duration)
+            self.position_scale.set_value(position)
+            self.time_label.set_text(f"{format_duration(position)} / {format_duration(self.index.duration)}")
+        else:
+            self.time_label.set_text(f"{format_duration(position)} / indexing…")
+
+    def on_play_clicked(self, button):
+        if self.is_playing():
+            self.pause()
+        else:
+            self.play()
+
+    def on_scale_change_value(self, scale, scroll, value):
+        self.seek(min(max(value, 0.0), self.index.duration))
+        return True
+
+    def on_speed_changed(self, dropdown, param):
+        position = self.current_position()
+        self.speed = list(PLAYBACK_SPEEDS.values())[dropdown.get_selected()]
+        if self.is_playing():
+            self.position = position
+            self.play_started = time.monotonic()
+
+    def close(self):
+        if self.source_id:
+            GLib.source_remove(self.source_id)
+            self.source_id = None
+        self.stream.close()
+        super().close()
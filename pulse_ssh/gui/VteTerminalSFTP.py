@@ -10,12 +10,11 @@ from gi.repository import Gdk  # type: ignore
 from gi.repository import Gio  # type: ignore
 from gi.repository import GLib  # type: ignore
 from gi.repository import Gtk  # type: ignore
-from gi.repository import Vte  # type: ignore
 from typing import Optional
-import os
 import pulse_ssh.data.Connection as _connection
 import pulse_ssh.Globals as _globals
 import pulse_ssh.gui.Globals as _gui_globals
+import pulse_ssh.gui.TilingLayout as _tiling_layout
 import pulse_ssh.gui.VteTerminal as _vte_terminal
 import pulse_ssh.Utils as _utils
 
@@ -23,32 +22,9 @@ class VteTerminalSFTP(_vte_terminal.VteTerminal):
     def __init__(self, app_window, connection: _connection.Connection, cluster_id: Optional[str] = None, cluster_name: Optional[str] = None, **kwargs):
         super().__init__(app_window, **kwargs)
 
-        final_cmd = _utils.build_sftp_command(_globals.app_config, connection)
-        args = [_globals.app_config.shell_program, "-c", final_cmd]
+        self.spawn_session(connection)
 
-        self.spawn_async(
-            Vte.PtyFlags.DEFAULT,
-            os.environ['HOME'],
-            args,
-            [],
-            GLib.SpawnFlags.SEARCH_PATH,
-            None, None, -1, None, None, None
-        )
-
-        handler_id = [None]
-        def on_prompt_detected(terminal):
-            last_line = terminal.get_last_line()
-            if last_line and last_line.rstrip().endswith(('$', '#', '>', '%')):
-                if handler_id[0]:
-                    terminal.disconnect(handler_id[0])
-                    handler_id[0] = None
-                terminal.grab_focus()
-                self.app_window.connections_view.select_connection_from_terminal(terminal)
-
-                return True
-            return False
-
-        handler_id[0] = self.connect("contents-changed", on_prompt_detected)
+        self.watch_for_prompt()
 
         click_gesture = Gtk.GestureClick()
         click_gesture.set_button(Gdk.BUTTON_SECONDARY)
@@ -74,6 +50,25 @@ class VteTerminalSFTP(_vte_terminal.VteTerminal):
 
         self.connected = True
 
+    def spawn_session(self, connection: _connection.Connection):
+        self.spawn_launch_plan(_utils.build_sftp_command(_globals.app_config, connection))
+
+    def watch_for_prompt(self):
+        handler_id = [None]
+        def on_prompt_detected(terminal):
+            last_line = terminal.get_last_line()
+            if last_line and last_line.rstrip().endswith(('$', '#', '>', '%')):
+                if handler_id[0]:
+                    terminal.disconnect(handler_id[0])
+                    handler_id[0] = None
+                terminal.grab_focus()
+                self.app_window.connections_view.select_connection_from_terminal(terminal)
+
+                return True
+            return False
+
+        handler_id[0] = self.connect("contents-changed", on_prompt_detected)
+
     def build_menu(self, gesture, n_press, x, y):
         notebook, page = self.get_ancestor_page()
         if not notebook or not page:
@@ -102,12 +97,18 @@ class VteTerminalSFTP(_vte_terminal.VteTerminal):
         split_v_submenu = self._create_split_submenu(action_group, Gtk.Orientation.VERTICAL, page)
         menu_model.append_submenu("Split Vertical", split_v_submenu)
 
+        layout_submenu = self._create_layout_submenu(action_group, page)
+        menu_model.append_submenu("Layout", layout_submenu)
+
         cluster_submenu = self._create_cluster_submenu(self, action_group)
         menu_model.append_submenu("Cluster", cluster_submenu)
 
         page_cluster_submenu = self._create_page_cluster_submenu(self, action_group)
         menu_model.append_submenu("Page Cluster", page_cluster_submenu)
 
+        record_label = self._create_record_action(action_group)
+        menu_model.append(record_label, "term.record")
+
         menu_model.append_section(None, Gio.Menu())
 
         rename_action = Gio.SimpleAction.new("rename_tab", None)
@@ -127,7 +128,7 @@ class VteTerminalSFTP(_vte_terminal.VteTerminal):
             menu_model.append("Attach to Main Window", "term.attach")
 
         parent = self.get_parent().get_parent()
-        if isinstance(parent, Gtk.Paned):
+        if isinstance(parent, _tiling_layout.TilingLayout):
             unsplit_action = Gio.SimpleAction.new("unsplit", None)
             unsplit_action.connect("activate", _gui_globals.layout_manager.unsplit_terminal, self)
             action_group.add_action(unsplit_action)
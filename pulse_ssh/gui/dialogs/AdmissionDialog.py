@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import Adw  # type: ignore
+from gi.repository import Gdk  # type: ignore
+from gi.repository import GLib  # type: ignore
+from gi.repository import Gtk  # type: ignore
+import pulse_ssh.Globals as _globals
+import pulse_ssh.gui.Globals as _gui_globals
+
+class AdmissionDialog(Adw.Window):
+    def __init__(self, parent):
+        super().__init__(transient_for=parent)
+        self.set_title("Connection Pacing")
+        self.set_default_size(640, 480)
+
+        content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=12, margin_bottom=12, margin_start=12, margin_end=12)
+
+        self.summary_label = Gtk.Label(wrap=True, xalign=0)
+        content.append(self.summary_label)
+
+        self.list_box = Gtk.ListBox(selection_mode=Gtk.SelectionMode.NONE)
+        self.list_box.add_css_class("boxed-list")
+
+        scrolled_window = Gtk.ScrolledWindow(hexpand=True, vexpand=True)
+        scrolled_window.set_child(self.list_box)
+        content.append(scrolled_window)
+
+        refresh_button = Gtk.Button(icon_name="view-refresh-symbolic")
+        refresh_button.set_tooltip_text("Refresh")
+        refresh_button.connect("clicked", lambda b: self.populate())
+
+        header_bar = Adw.HeaderBar()
+        header_bar.pack_start(refresh_button)
+
+        toolbar_view = Adw.ToolbarView(content=content)
+        toolbar_view.add_top_bar(header_bar)
+        self.set_content(toolbar_view)
+
+        evk = Gtk.EventControllerKey()
+        evk.connect("key-pressed", self.on_key_pressed)
+        self.add_controller(evk)
+
+        self.populate()
+
+    def on_key_pressed(self, controller, keyval, keycode, state):
+        if keyval == Gdk.KEY_Escape:
+            self.close()
+            return True
+
+    def populate(self):
+        while row := self.list_box.get_first_child():
+            self.list_box.remove(row)
+
+        config = _globals.app_config
+        metrics = _gui_globals.admission_manager.get_metrics()
+        if config.admission_max_in_flight <= 0:
+            limits = "pacing is disabled"
+        else:
+            rate = f"{config.admission_rate:g} per second" if config.admission_rate > 0 else "no rate limit"
+            limits = f"{rate}, bursts of {config.admission_burst}, at most {config.admission_max_in_flight} in flight per host"
+        queued = sum(hop['queued'] for hop in metrics.values())
+        self.summary_label.set_text(f"{len(metrics)} hosts paced, {queued} connections waiting ({limits}).")
+
+        for hop, hop_metrics in sorted(metrics.items(), key=lambda item: (-item[1]['queued'], item[0])):
+            self.list_box.append(self.build_row(hop, hop_metrics))
+
+    def build_row(self, hop: str, hop_metrics: dict) -> Adw.ActionRow:
+        subtitle = (
+            f"{hop_metrics['admitted']} admitted · average wait {hop_metrics['average_wait']:.1f} s · "
+            f"longest queue {hop_metrics['max_queue_depth']}"
+        )
+        row = Adw.ActionRow(title=GLib.markup_escape_text(hop), subtitle=GLib.markup_escape_text(subtitle))
+        row.add_suffix(Gtk.Label(label=f"{hop_metrics['queued']} queued · {hop_metrics['in_flight']} connecting"))
+        return row
@@ -18,6 +18,7 @@ import pulse_ssh.data.AppConfig as _app_config
 import pulse_ssh.Globals as _globals
 import pulse_ssh.gui.dialogs.PasswordDialog as _password_dialog
 import pulse_ssh.gui.views.list_items.StringObject as _string_object
+import pulse_ssh.SessionLog as _session_log
 import pulse_ssh.Utils as _utils
 
 SHELL_PROGRAMS = [
@@ -40,6 +41,11 @@ WINDOW_CONTROLS_POSITIONS = {
     "Right": "right",
     "Left": "left",
 }
+SESSION_LOG_COMPRESSIONS = {
+    "Gzip": "gzip",
+    "Zstandard": "zstd",
+    "None": "none",
+}
 COLOR_SCHEMES = {
     "Follow System": "default",
     "Light": "force-light",
@@ -157,6 +163,12 @@ class AppConfigDialog(Adw.Window):
         binaries_page = self._build_binaries_page(config)
         self.stack.add_titled(binaries_page, "binaries", "Binaries")
 
+        inventory_page = self._build_inventory_page(config)
+        self.stack.add_titled(inventory_page, "inventory", "Inventory")
+
+        logging_page = self._build_logging_page(config)
+        self.stack.add_titled(logging_page, "logging", "Logging")
+
         shortcuts_page = self._build_shortcuts_page()
         self.stack.add_titled(shortcuts_page, "shortcuts", "Shortcuts")
 
@@ -361,6 +373,9 @@ class AppConfigDialog(Adw.Window):
         self.split_at_root = Adw.SwitchRow(title="Split at the Root", subtitle="Splits the whole tab area instead of just the current terminal", active=config.split_at_root)
         behavior_group.add(self.split_at_root)
 
+        self.restore_session = Adw.SwitchRow(title="Restore Session", subtitle="Reopens the tabs, splits and clusters of the last session; background tabs connect when first shown", active=config.restore_session)
+        behavior_group.add(self.restore_session)
+
         self.audible_bell = Adw.SwitchRow(title="Audible Bell", subtitle="Enable the terminal bell sound", active=config.audible_bell)
         behavior_group.add(self.audible_bell)
 
@@ -382,6 +397,29 @@ class AppConfigDialog(Adw.Window):
         self.scrollback = Adw.SpinRow(adjustment=scrollback_adjustment, title="Scrollback Lines", subtitle="Number of lines to keep in history (-1 for unlimited)")
         scrolling_group.add(self.scrollback)
 
+        scrollback_budget_adjustment = Gtk.Adjustment(
+            value=config.scrollback_budget_mb,
+            lower=0,
+            upper=65536,
+            step_increment=64,
+            page_increment=512
+        )
+        self.scrollback_budget_mb = Adw.SpinRow(adjustment=scrollback_budget_adjustment, title="Scrollback Memory Budget", subtitle="Estimated MiB all terminals may use; disconnected and long-hidden ones are trimmed first (0 for no budget)")
+        scrolling_group.add(self.scrollback_budget_mb)
+
+        scrollback_min_adjustment = Gtk.Adjustment(
+            value=config.scrollback_min_lines,
+            lower=0,
+            upper=100000,
+            step_increment=100,
+            page_increment=1000
+        )
+        self.scrollback_min_lines = Adw.SpinRow(adjustment=scrollback_min_adjustment, title="Minimum Scrollback Lines", subtitle="Lines a trimmed terminal always keeps")
+        scrolling_group.add(self.scrollback_min_lines)
+
+        self.scrollback_spill = Adw.SwitchRow(title="Save Trimmed Scrollback", subtitle="Write lines dropped by the budget to compressed files in the cache directory", active=config.scrollback_spill)
+        scrolling_group.add(self.scrollback_spill)
+
         self.scroll_on_output = Adw.SwitchRow(title="Scroll on Output", active=config.scroll_on_output)
         scrolling_group.add(self.scroll_on_output)
 
@@ -391,6 +429,9 @@ class AppConfigDialog(Adw.Window):
         self.scroll_on_insert = Adw.SwitchRow(title="Scroll on Insert (deprecated)", subtitle="This option may have no effect", active=config.scroll_on_insert)
         scrolling_group.add(self.scroll_on_insert)
 
+        self.throttle_hidden_terminals = Adw.SwitchRow(title="Quiet Hidden Terminals", subtitle="Terminals in background tabs or minimized windows stop scrolling on output; their tab is flagged with the number of new lines instead", active=config.throttle_hidden_terminals)
+        scrolling_group.add(self.throttle_hidden_terminals)
+
         return page
 
     def _build_encryption_page(self, config: _app_config.AppConfig):
@@ -438,6 +479,202 @@ class AppConfigDialog(Adw.Window):
         self.ssh_unique_sock_proxy = Adw.SwitchRow(title="Unique SOCKS Proxy (-D)", subtitle="Creates a SOCKS proxy on a unique local port", active=config.ssh_unique_sock_proxy)
         ssh_group.add(self.ssh_unique_sock_proxy)
 
+        self.ssh_shared_sock_proxy = Adw.SwitchRow(title="Share SOCKS Proxy per Host", subtitle="Terminals to the same host reuse the proxy of the first one", active=config.ssh_shared_sock_proxy)
+        ssh_group.add(self.ssh_shared_sock_proxy)
+
+        self.host_key_prescan = Adw.SwitchRow(title="Pre-scan Host Keys", subtitle="Collect unknown host keys before opening several connections and approve them at once", active=config.host_key_prescan)
+        ssh_group.add(self.host_key_prescan)
+
+        proxy_port_start_adjustment = Gtk.Adjustment(
+            value=config.ssh_proxy_port_range_start,
+            lower=1024,
+            upper=65535,
+            step_increment=1,
+            page_increment=100
+        )
+        self.ssh_proxy_port_range_start = Adw.SpinRow(adjustment=proxy_port_start_adjustment, title="SOCKS Proxy Port Range Start", subtitle="First local port handed out to SOCKS proxies")
+        ssh_group.add(self.ssh_proxy_port_range_start)
+
+        proxy_port_end_adjustment = Gtk.Adjustment(
+            value=config.ssh_proxy_port_range_end,
+            lower=1024,
+            upper=65535,
+            step_increment=1,
+            page_increment=100
+        )
+        self.ssh_proxy_port_range_end = Adw.SpinRow(adjustment=proxy_port_end_adjustment, title="SOCKS Proxy Port Range End", subtitle="Last local port handed out to SOCKS proxies")
+        ssh_group.add(self.ssh_proxy_port_range_end)
+
+        admission_group = Adw.PreferencesGroup(title="Connection Pacing", description="Limits how fast new connections reach the same host or jump host")
+        page.add(admission_group)
+
+        admission_rate_adjustment = Gtk.Adjustment(
+            value=config.admission_rate,
+            lower=0,
+            upper=100,
+            step_increment=0.5,
+            page_increment=5
+        )
+        self.admission_rate = Adw.SpinRow(adjustment=admission_rate_adjustment, digits=1, title="Connections per Second", subtitle="Sustained rate of new handshakes per host (0 for unlimited)")
+        admission_group.add(self.admission_rate)
+
+        admission_burst_adjustment = Gtk.Adjustment(
+            value=config.admission_burst,
+            lower=1,
+            upper=100,
+            step_increment=1,
+            page_increment=10
+        )
+        self.admission_burst = Adw.SpinRow(adjustment=admission_burst_adjustment, title="Burst Size", subtitle="Handshakes allowed at once before pacing starts")
+        admission_group.add(self.admission_burst)
+
+        admission_in_flight_adjustment = Gtk.Adjustment(
+            value=config.admission_max_in_flight,
+            lower=0,
+            upper=100,
+            step_increment=1,
+            page_increment=10
+        )
+        self.admission_max_in_flight = Adw.SpinRow(adjustment=admission_in_flight_adjustment, title="Maximum Handshakes in Flight", subtitle="Connections still negotiating per host (0 disables pacing)")
+        admission_group.add(self.admission_max_in_flight)
+
+        reconnect_group = Adw.PreferencesGroup(title="Automatic Reconnect", description="Used when On Disconnect is set to Restart; delays double after each quick failure, with jitter")
+        page.add(reconnect_group)
+
+        reconnect_initial_adjustment = Gtk.Adjustment(
+            value=config.reconnect_initial_delay,
+            lower=0.1,
+            upper=60,
+            step_increment=0.5,
+            page_increment=5
+        )
+        self.reconnect_initial_delay = Adw.SpinRow(adjustment=reconnect_initial_adjustment, digits=1, title="Initial Delay", subtitle="Seconds before the first reconnect attempt")
+        reconnect_group.add(self.reconnect_initial_delay)
+
+        reconnect_max_delay_adjustment = Gtk.Adjustment(
+            value=config.reconnect_max_delay,
+            lower=1,
+            upper=3600,
+            step_increment=5,
+            page_increment=60
+        )
+        self.reconnect_max_delay = Adw.SpinRow(adjustment=reconnect_max_delay_adjustment, title="Maximum Delay", subtitle="Seconds the delay between attempts stops growing at")
+        reconnect_group.add(self.reconnect_max_delay)
+
+        reconnect_attempts_adjustment = Gtk.Adjustment(
+            value=config.reconnect_max_attempts,
+            lower=1,
+            upper=1000,
+            step_increment=1,
+            page_increment=10
+        )
+        self.reconnect_max_attempts = Adw.SpinRow(adjustment=reconnect_attempts_adjustment, title="Maximum Attempts", subtitle="Quick failures in a row before waiting for a key press")
+        reconnect_group.add(self.reconnect_max_attempts)
+
+        reconnect_stable_adjustment = Gtk.Adjustment(
+            value=config.reconnect_stable_seconds,
+            lower=1,
+            upper=600,
+            step_increment=5,
+            page_increment=30
+        )
+        self.reconnect_stable_seconds = Adw.SpinRow(adjustment=reconnect_stable_adjustment, title="Stable After", subtitle="Seconds a session must stay up to count as reconnected")
+        reconnect_group.add(self.reconnect_stable_seconds)
+
+        reconnect_threshold_adjustment = Gtk.Adjustment(
+            value=config.reconnect_breaker_threshold,
+            lower=0,
+            upper=100,
+            step_increment=1,
+            page_increment=5
+        )
+        self.reconnect_breaker_threshold = Adw.SpinRow(adjustment=reconnect_threshold_adjustment, title="Outage Threshold", subtitle="Failures in a row behind one jump host or subnet that pause all its reconnects (0 disables)")
+        reconnect_group.add(self.reconnect_breaker_threshold)
+
+        reconnect_cooldown_adjustment = Gtk.Adjustment(
+            value=config.reconnect_breaker_cooldown,
+            lower=1,
+            upper=3600,
+            step_increment=5,
+            page_increment=60
+        )
+        self.reconnect_breaker_cooldown = Adw.SpinRow(adjustment=reconnect_cooldown_adjustment, title="Outage Cooldown", subtitle="Seconds between single trial reconnects while an outage lasts")
+        reconnect_group.add(self.reconnect_breaker_cooldown)
+
+        reachability_group = Adw.PreferencesGroup(title="Reachability", description="Shows a status dot next to connections and clusters in the sidebar")
+        page.add(reachability_group)
+
+        self.reachability_enabled = Adw.SwitchRow(title="Probe Hosts", subtitle="Check visible connections with a TCP connect to their port", active=config.reachability_enabled)
+        reachability_group.add(self.reachability_enabled)
+
+        self.reachability_ssh_banner = Adw.SwitchRow(title="Read SSH Banner", subtitle="Wait for the server greeting and show it in the tooltip", active=config.reachability_ssh_banner)
+        reachability_group.add(self.reachability_ssh_banner)
+
+        reachability_ttl_adjustment = Gtk.Adjustment(
+            value=config.reachability_ttl,
+            lower=5,
+            upper=3600,
+            step_increment=5,
+            page_increment=60
+        )
+        self.reachability_ttl = Adw.SpinRow(adjustment=reachability_ttl_adjustment, title="Refresh Interval", subtitle="Seconds a probe result is reused")
+        reachability_group.add(self.reachability_ttl)
+
+        dns_group = Adw.PreferencesGroup(title="DNS Cache", description="Resolves hosts of the selected folder, cluster or filter results ahead of time")
+        page.add(dns_group)
+
+        self.dns_cache_enabled = Adw.SwitchRow(title="Pre-resolve Hosts", subtitle="Resolution time is shown when hovering a connection", active=config.dns_cache_enabled)
+        dns_group.add(self.dns_cache_enabled)
+
+        dns_ttl_adjustment = Gtk.Adjustment(
+            value=config.dns_cache_ttl,
+            lower=5,
+            upper=86400,
+            step_increment=30,
+            page_increment=300
+        )
+        self.dns_cache_ttl = Adw.SpinRow(adjustment=dns_ttl_adjustment, title="Default TTL", subtitle="Seconds to keep an answer when the record TTL is not available")
+        dns_group.add(self.dns_cache_ttl)
+
+        self.dns_pass_resolved_ip = Adw.SwitchRow(title="Connect to Resolved Address", subtitle="Pass the cached address to ssh with HostKeyAlias so host keys are still checked by name", active=config.dns_pass_resolved_ip)
+        dns_group.add(self.dns_pass_resolved_ip)
+
+        prewarm_group = Adw.PreferencesGroup(title="Connection Pre-warm", description="Opens an ssh ControlMaster in the background for the connection under the pointer or selected, so activating it attaches almost instantly")
+        page.add(prewarm_group)
+
+        self.prewarm_enabled = Adw.SwitchRow(title="Pre-warm Connections", subtitle="Only ssh connections without sudo are pre-warmed; others just get their DNS pre-resolved", active=config.prewarm_enabled)
+        prewarm_group.add(self.prewarm_enabled)
+
+        prewarm_delay_adjustment = Gtk.Adjustment(
+            value=config.prewarm_delay_ms,
+            lower=0,
+            upper=5000,
+            step_increment=50,
+            page_increment=500
+        )
+        self.prewarm_delay_ms = Adw.SpinRow(adjustment=prewarm_delay_adjustment, title="Hover Delay", subtitle="Milliseconds a connection must stay hovered or selected")
+        prewarm_group.add(self.prewarm_delay_ms)
+
+        prewarm_idle_adjustment = Gtk.Adjustment(
+            value=config.prewarm_idle_timeout,
+            lower=10,
+            upper=3600,
+            step_increment=10,
+            page_increment=60
+        )
+        self.prewarm_idle_timeout = Adw.SpinRow(adjustment=prewarm_idle_adjustment, title="Idle Timeout", subtitle="Seconds an unused pre-warmed connection is kept open")
+        prewarm_group.add(self.prewarm_idle_timeout)
+
+        prewarm_max_adjustment = Gtk.Adjustment(
+            value=config.prewarm_max_masters,
+            lower=1,
+            upper=32,
+            step_increment=1,
+            page_increment=4
+        )
+        self.prewarm_max_masters = Adw.SpinRow(adjustment=prewarm_max_adjustment, title="Maximum Pre-warmed", subtitle="The oldest unused one is closed when this is reached")
+        prewarm_group.add(self.prewarm_max_masters)
+
         options_group = Adw.PreferencesGroup(title="Additional Options")
         page.add(options_group)
 
@@ -557,6 +794,85 @@ class AppConfigDialog(Adw.Window):
         page_grid.attach(self.sudo_path_entry, 1, 4, 1, 1)
         return page_grid
 
+    def _build_inventory_page(self, config: _app_config.AppConfig):
+        page = Adw.PreferencesPage()
+
+        inventory_group = Adw.PreferencesGroup(title="External Inventory", description="Connections are synced from a JSON/YAML file or from the JSON output of a command")
+        page.add(inventory_group)
+
+        self.inventory_source = Adw.EntryRow(title="Source (file path or command)", text=config.inventory_source or "")
+        inventory_group.add(self.inventory_source)
+
+        self.inventory_is_command = Adw.SwitchRow(title="Source is a Command", subtitle="Run the source and read the inventory from its standard output", active=config.inventory_is_command)
+        inventory_group.add(self.inventory_is_command)
+
+        poll_adjustment = Gtk.Adjustment(
+            value=config.inventory_poll_interval,
+            lower=10,
+            upper=86400,
+            step_increment=60,
+            page_increment=600
+        )
+        self.inventory_poll_interval = Adw.SpinRow(adjustment=poll_adjustment, title="Poll Interval", subtitle="Seconds between inventory syncs")
+        inventory_group.add(self.inventory_poll_interval)
+
+        storage_group = Adw.PreferencesGroup(title="Storage")
+        page.add(storage_group)
+
+        self.config_sharded = Adw.SwitchRow(title="Split Configuration by Folder", subtitle="Store each top-level folder in its own file and load it when first expanded, searched or opened", active=config.config_sharded)
+        self.config_sharded.connect("notify::active", self._on_config_sharded_toggled)
+        storage_group.add(self.config_sharded)
+
+        return page
+
+    def _build_logging_page(self, config: _app_config.AppConfig):
+        page = Adw.PreferencesPage()
+
+        logging_group = Adw.PreferencesGroup(title="Session Logging", description="Terminal output is written to disk by a background thread; connections can also enable recording individually")
+        page.add(logging_group)
+
+        self.session_log_enabled = Adw.SwitchRow(title="Log All Sessions", subtitle="Record the output of every terminal", active=config.session_log_enabled)
+        logging_group.add(self.session_log_enabled)
+
+        self.session_log_dir = Adw.EntryRow(title=f"Log Directory (default {_session_log.get_default_log_dir()})", text=config.session_log_dir or "")
+        logging_group.add(self.session_log_dir)
+
+        self.session_log_compression = Adw.ComboRow(title="Compression", subtitle="Zstandard needs the python zstandard module and falls back to gzip without it", model=Gtk.StringList.new(list(SESSION_LOG_COMPRESSIONS.keys())))
+        current_compression_key = next((k for k, v in SESSION_LOG_COMPRESSIONS.items() if v == config.session_log_compression), "Gzip")
+        self.session_log_compression.set_selected(list(SESSION_LOG_COMPRESSIONS.keys()).index(current_compression_key))
+        logging_group.add(self.session_log_compression)
+
+        rotation_group = Adw.PreferencesGroup(title="Rotation", description="A new file is started when either limit is reached; 0 disables a limit")
+        page.add(rotation_group)
+
+        max_mb_adjustment = Gtk.Adjustment(
+            value=config.session_log_max_mb,
+            lower=0,
+            upper=65536,
+            step_increment=16,
+            page_increment=256
+        )
+        self.session_log_max_mb = Adw.SpinRow(adjustment=max_mb_adjustment, title="Maximum Size", subtitle="Uncompressed megabytes per file")
+        rotation_group.add(self.session_log_max_mb)
+
+        max_age_adjustment = Gtk.Adjustment(
+            value=config.session_log_max_age_hours,
+            lower=0,
+            upper=8760,
+            step_increment=1,
+            page_increment=24
+        )
+        self.session_log_max_age_hours = Adw.SpinRow(adjustment=max_age_adjustment, title="Maximum Age", subtitle="Hours per file")
+        rotation_group.add(self.session_log_max_age_hours)
+
+        recording_group = Adw.PreferencesGroup(title="Recording", description="Timed asciicast v2 recordings are saved next to the logs and can be replayed in PulseSSH or with asciinema; single terminals can also be recorded from their menu")
+        page.add(recording_group)
+
+        self.session_record_enabled = Adw.SwitchRow(title="Record All Sessions", subtitle="Write a .cast recording for every terminal", active=config.session_record_enabled)
+        recording_group.add(self.session_record_enabled)
+
+        return page
+
     def _build_shortcuts_page(self):
         page_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6, margin_start=10, margin_end=10, margin_top=10, margin_bottom=10)
 
@@ -604,7 +920,11 @@ class AppConfigDialog(Adw.Window):
             ("{password}", "The password for the connection (if stored)."),
             ("{identity_file}", "Path to the identity file (if any)."),
             ("{key_passphrase}", "The passphrase for the identity file."),
-            ("{proxy_port}", "The dynamic SOCKS proxy port (if enabled).")
+            ("{proxy_port}", "The dynamic SOCKS proxy port (if enabled)."),
+            ("{cluster_name}", "The name of the cluster the terminal belongs to."),
+            ("{terminal_index}", "The position of the terminal in its cluster, starting at 1."),
+            ("{env:NAME}", "The value of the environment variable NAME."),
+            ("{{name}}", "A literal {name}, left unsubstituted.")
         ]
 
         for i, (variable, description) in enumerate(variables):
@@ -732,7 +1052,12 @@ class AppConfigDialog(Adw.Window):
             list_box.insert(dragged_row, pos)
         return True
 
+    def _on_config_sharded_toggled(self, switch, _):
+        if not switch.get_active():
+            self.get_transient_for().load_all_config_shards()
+
     def _on_encryption_toggled(self, switch, _):
+        self.get_transient_for().load_all_config_shards()
         is_active = switch.get_active()
         self.change_password_row.set_visible(is_active)
 
@@ -789,6 +1114,7 @@ class AppConfigDialog(Adw.Window):
 
         def on_response(d, response_id, new_password):
             if response_id == Gtk.ResponseType.OK and new_password:
+                self.get_transient_for().load_all_config_shards()
                 _utils.set_encryption_password(new_password)
                 toast = Adw.Toast.new(GLib.markup_escape_text("Password changed successfully!"))
                 self.get_ancestor(Gtk.ApplicationWindow).toast_overlay.add_toast(toast)
@@ -818,6 +1144,7 @@ class AppConfigDialog(Adw.Window):
         on_disconnect = ON_DISCONNECT[self.on_disconnect.get_selected_item().get_string()]
         cursor_shape = CURSOR_SHAPES[self.cursor_shape.get_selected_item().get_string()]
         color_scheme = COLOR_SCHEMES[self.color_scheme.get_selected_item().get_string()]
+        session_log_compression = SESSION_LOG_COMPRESSIONS[self.session_log_compression.get_selected_item().get_string()]
 
         def get_cmds_from_list(page_box):
             scripts = {}
@@ -867,13 +1194,24 @@ class AppConfigDialog(Adw.Window):
             tree_color_ftp=rgba_to_hex(self.tree_color_ftp_button.get_rgba()),
             cursor_shape=cursor_shape,
             split_at_root=self.split_at_root.get_active(),
+            restore_session=self.restore_session.get_active(),
+            session_log_enabled=self.session_log_enabled.get_active(),
+            session_log_dir=self.session_log_dir.get_text() or None,
+            session_log_compression=session_log_compression,
+            session_log_max_mb=int(self.session_log_max_mb.get_value()),
+            session_log_max_age_hours=int(self.session_log_max_age_hours.get_value()),
+            session_record_enabled=self.session_record_enabled.get_active(),
             shell_program=self.shell_program.get_model().get_string(self.shell_program.get_selected()),
             on_disconnect_behavior=on_disconnect,
             color_scheme=color_scheme,
             scrollback_lines=int(self.scrollback.get_value()),
+            scrollback_budget_mb=int(self.scrollback_budget_mb.get_value()),
+            scrollback_min_lines=int(self.scrollback_min_lines.get_value()),
+            scrollback_spill=self.scrollback_spill.get_active(),
             scroll_on_output=self.scroll_on_output.get_active(),
             scroll_on_keystroke=self.scroll_on_keystroke.get_active(),
             scroll_on_insert=self.scroll_on_insert.get_active(),
+            throttle_hidden_terminals=self.throttle_hidden_terminals.get_active(),
             scrollbar_visible=self.scrollbar_visible.get_active(),
             sidebar_on_right=self.sidebar_on_right.get_active(),
             use_adw_window=self.use_adw_window.get_active(),
@@ -886,6 +1224,29 @@ class AppConfigDialog(Adw.Window):
             ssh_verbose=self.ssh_verbose.get_active(),
             ssh_force_pty=self.ssh_force_pty.get_active(),
             ssh_unique_sock_proxy=self.ssh_unique_sock_proxy.get_active(),
+            ssh_shared_sock_proxy=self.ssh_shared_sock_proxy.get_active(),
+            ssh_proxy_port_range_start=int(self.ssh_proxy_port_range_start.get_value()),
+            ssh_proxy_port_range_end=int(self.ssh_proxy_port_range_end.get_value()),
+            admission_rate=self.admission_rate.get_value(),
+            admission_burst=int(self.admission_burst.get_value()),
+            admission_max_in_flight=int(self.admission_max_in_flight.get_value()),
+            reconnect_initial_delay=self.reconnect_initial_delay.get_value(),
+            reconnect_max_delay=int(self.reconnect_max_delay.get_value()),
+            reconnect_max_attempts=int(self.reconnect_max_attempts.get_value()),
+            reconnect_stable_seconds=int(self.reconnect_stable_seconds.get_value()),
+            reconnect_breaker_threshold=int(self.reconnect_breaker_threshold.get_value()),
+            reconnect_breaker_cooldown=int(self.reconnect_breaker_cooldown.get_value()),
+            host_key_prescan=self.host_key_prescan.get_active(),
+            reachability_enabled=self.reachability_enabled.get_active(),
+            reachability_ssh_banner=self.reachability_ssh_banner.get_active(),
+            reachability_ttl=int(self.reachability_ttl.get_value()),
+            dns_cache_enabled=self.dns_cache_enabled.get_active(),
+            dns_cache_ttl=int(self.dns_cache_ttl.get_value()),
+            dns_pass_resolved_ip=self.dns_pass_resolved_ip.get_active(),
+            prewarm_enabled=self.prewarm_enabled.get_active(),
+            prewarm_delay_ms=int(self.prewarm_delay_ms.get_value()),
+            prewarm_idle_timeout=int(self.prewarm_idle_timeout.get_value()),
+            prewarm_max_masters=int(self.prewarm_max_masters.get_value()),
             ssh_additional_options=[opt for opt in ssh_additional_options if opt],
             mosh_local_echo=self.mosh_local_echo.get_selected_item().get_string(),
             sftp_forward_agent=self.sftp_forward_agent.get_active(),
@@ -904,4 +1265,8 @@ class AppConfigDialog(Adw.Window):
             sshpass_path=self.sshpass_path_entry.get_text(),
             sudo_path=self.sudo_path_entry.get_text(),
             custom_css=custom_css_text,
+            inventory_source=self.inventory_source.get_text().strip() or None,
+            inventory_is_command=self.inventory_is_command.get_active(),
+            inventory_poll_interval=int(self.inventory_poll_interval.get_value()),
+            config_sharded=self.config_sharded.get_active(),
         )
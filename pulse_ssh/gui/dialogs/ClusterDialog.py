@@ -8,7 +8,6 @@ gi.require_version('Vte', '3.91')
 
 from gi.repository import Adw  # type: ignore
 from gi.repository import Gdk  # type: ignore
-from gi.repository import Gio  # type: ignore
 from gi.repository import GLib  # type: ignore
 from gi.repository import GObject  # type: ignore
 from gi.repository import Gtk  # type: ignore
@@ -19,12 +18,6 @@ import pulse_ssh.data.Connection as _connection
 import pulse_ssh.gui.Globals as _gui_globals
 import pulse_ssh.Utils as _utils
 
-class ConnectionCheckListItem(GObject.Object):
-    def __init__(self, connection: _connection.Connection, check_button: Gtk.CheckButton):
-        super().__init__()
-        self.connection = connection
-        self.check_button = check_button
-
 class ClusterDialog(Adw.Window):
     __gsignals__ = {
         'response': (GObject.SignalFlags.RUN_FIRST, None, (int,))
@@ -35,6 +28,8 @@ class ClusterDialog(Adw.Window):
 
         self.cluster = cluster
         self.connections = connections
+        self.checked_uuids = set(uuid for uuid in cluster.connection_uuids if uuid in connections) if cluster else set()
+        self.bound_items = set()
 
         cancel_button = Gtk.Button.new_with_mnemonic("_Cancel")
         cancel_button.connect("clicked", lambda w: self.emit("response", Gtk.ResponseType.CANCEL))
@@ -113,16 +108,15 @@ class ClusterDialog(Adw.Window):
         connections_group = Adw.PreferencesGroup()
         connections_page.add(connections_group)
 
-        self.connections_store = Gio.ListStore(item_type=ConnectionCheckListItem)
-        checked_uuids = self.cluster.connection_uuids if self.cluster else []
-        for conn in sorted(self.connections.values(), key=_utils.connectionsSortFunction):
-            check_button = Gtk.CheckButton(valign=Gtk.Align.CENTER)
-            check_button.set_active(conn.uuid in checked_uuids)
-            self.connections_store.append(ConnectionCheckListItem(conn, check_button))
+        self.labels = {uuid: f"{conn.folder}/{conn.name}" if conn.folder else conn.name for uuid, conn in self.connections.items()}
+        self.search_keys = {uuid: label.lower() for uuid, label in self.labels.items()}
+        self.sorted_uuids = [conn.uuid for conn in sorted(self.connections.values(), key=_utils.connectionsSortFunction)]
+        self.connections_store = Gtk.StringList.new(self.sorted_uuids)
 
         factory = Gtk.SignalListItemFactory()
         factory.connect("setup", self.setup_list_item)
         factory.connect("bind", self.bind_list_item)
+        factory.connect("unbind", self.unbind_list_item)
 
         self.filter_entry = Gtk.SearchEntry(placeholder_text="Filter connections...")
         self.filter_entry.connect("search-changed", self.filter_changed_callback)
@@ -140,9 +134,14 @@ class ClusterDialog(Adw.Window):
         select_all_check = Gtk.CheckButton(valign=Gtk.Align.CENTER)
         select_all_check.connect("toggled", self._on_select_all_toggled)
 
+        self.count_label = Gtk.Label(valign=Gtk.Align.CENTER)
+        self.count_label.add_css_class("dim-label")
+        self._update_count_label()
+
         filter_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6, margin_bottom=6)
         filter_row.set_homogeneous(False)
         filter_row.append(self.filter_entry)
+        filter_row.append(self.count_label)
         filter_row.append(select_all_check)
 
         self.filter_entry.set_hexpand(True)
@@ -156,39 +155,55 @@ class ClusterDialog(Adw.Window):
 
     def setup_list_item(self, factory, list_item):
         row = Adw.ActionRow()
+        check_button = Gtk.CheckButton(valign=Gtk.Align.CENTER)
+        check_button.connect("toggled", self._on_check_toggled, list_item)
+        row.add_suffix(check_button)
+        row.set_activatable_widget(check_button)
         list_item.row = row
+        list_item.check_button = check_button
+        list_item.conn_uuid = None
         list_item.set_child(row)
 
     def bind_list_item(self, factory, list_item):
-        row = list_item.row
-        item = list_item.get_item()
-        check_button = item.check_button
-
-        if row.get_activatable_widget():
-            row.remove(row.get_activatable_widget())
-
-        conn = item.connection
-        label_text = conn.name
-        if conn.folder:
-            label_text = f"{conn.folder}/{conn.name}"
-        row.set_title(GLib.markup_escape_text(label_text))
-        row.add_suffix(check_button)
-        row.set_activatable_widget(check_button)
+        uuid = list_item.get_item().get_string()
+        list_item.row.set_title(GLib.markup_escape_text(self.labels[uuid]))
+        list_item.conn_uuid = None
+        list_item.check_button.set_active(uuid in self.checked_uuids)
+        list_item.conn_uuid = uuid
+        self.bound_items.add(list_item)
+
+    def unbind_list_item(self, factory, list_item):
+        list_item.conn_uuid = None
+        self.bound_items.discard(list_item)
+
+    def _on_check_toggled(self, check_button, list_item):
+        if list_item.conn_uuid is None:
+            return
+        if check_button.get_active():
+            self.checked_uuids.add(list_item.conn_uuid)
+        else:
+            self.checked_uuids.discard(list_item.conn_uuid)
+        self._update_count_label()
 
     def _on_select_all_toggled(self, check_button):
-        for i in range(self.selection_model.get_n_items()):
-            item = self.selection_model.get_item(i)
-            if item:
-                item.check_button.set_active(False)
-
-        is_active = check_button.get_active()
-        if is_active:
-            for i in range(self.filtered_model.get_n_items()):
-                item = self.filtered_model.get_item(i)
-                if item:
-                    item.check_button.set_active(True)
+        search_text = self.filter_entry.get_text().lower()
+        matching = [uuid for uuid in self.sorted_uuids if search_text in self.search_keys[uuid]]
+        if check_button.get_active():
+            self.checked_uuids.update(matching)
+        else:
+            self.checked_uuids.difference_update(matching)
+        self._refresh_bound_items()
 
-        self.filter.changed(Gtk.FilterChange.DIFFERENT)
+    def _refresh_bound_items(self):
+        for list_item in self.bound_items:
+            uuid = list_item.conn_uuid
+            list_item.conn_uuid = None
+            list_item.check_button.set_active(uuid in self.checked_uuids)
+            list_item.conn_uuid = uuid
+        self._update_count_label()
+
+    def _update_count_label(self):
+        self.count_label.set_label(f"{len(self.checked_uuids)} of {len(self.connections)}")
 
     def filter_entry_activated_callback(self, entry):
         selection = self.selection_model.get_selection()
@@ -207,22 +222,10 @@ class ClusterDialog(Adw.Window):
 
     def filter_list_function(self, item):
         search_text = self.filter_entry.get_text().lower()
-        if not search_text:
-            return True
-
-        conn = item.connection
-        full_name = conn.name.lower()
-        if conn.folder:
-            full_name = f"{conn.folder.lower()}/{full_name}"
-
-        return search_text in full_name
+        return not search_text or search_text in self.search_keys[item.get_string()]
 
     def get_data(self) -> _cluster.Cluster:
-        selected_uuids = []
-        for i in range(self.connections_store.get_n_items()):
-            item = self.connections_store.get_item(i)
-            if item.check_button.get_active():
-                selected_uuids.append(item.connection.uuid)
+        selected_uuids = [uuid for uuid in self.sorted_uuids if uuid in self.checked_uuids]
 
         open_mode_str = self.open_mode_dropdown.get_selected_item().get_string()
         open_mode = "split" if open_mode_str == "In Split" else "tabs"
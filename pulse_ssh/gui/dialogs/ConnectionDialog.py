@@ -143,6 +143,9 @@ class ConnectionDialog(Adw.Window):
         self.use_sudo = Adw.SwitchRow(title="Execute with sudo", subtitle="Prepend 'sudo' to the SSH command", active=self.conn.use_sudo if self.conn else False)
         execution_group.add(self.use_sudo)
 
+        self.session_log = Adw.SwitchRow(title="Record Session", subtitle="Log this connection's output even when session logging is off globally", active=self.conn.session_log if self.conn else False)
+        execution_group.add(self.session_log)
+
         is_sshpass_active = self.use_sshpass.get_active()
         self.password.set_sensitive(is_sshpass_active)
 
@@ -613,6 +616,7 @@ class ConnectionDialog(Adw.Window):
             ftp_verbose=self.ftp_verbose.get_active(),
             use_sudo=self.use_sudo.get_active(),
             use_sshpass=self.use_sshpass.get_active(),
+            session_log=self.session_log.get_active(),
         )
         if self.conn and hasattr(self.conn, 'uuid'):
             new_conn.uuid = self.conn.uuid
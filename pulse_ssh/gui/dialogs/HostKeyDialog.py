@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import Adw  # type: ignore
+from gi.repository import Gdk  # type: ignore
+from gi.repository import GLib  # type: ignore
+from gi.repository import GObject  # type: ignore
+from gi.repository import Gtk  # type: ignore
+from typing import Dict
+from typing import List
+from typing import Optional
+import pulse_ssh.HostKeys as _host_keys
+
+class HostKeyDialog(Adw.Window):
+    __gsignals__ = {
+        'response': (GObject.SignalFlags.RUN_FIRST, None, (bool,))
+    }
+
+    def __init__(self, parent, results: Dict[tuple[str, int], List[tuple[str, str]]], via: Optional[Dict[tuple[str, int], str]] = None):
+        super().__init__(transient_for=parent, modal=True)
+        self.set_title("Unknown Host Keys")
+        self.set_default_size(640, 480)
+
+        self.results = results
+        self.switches = {}
+
+        content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=12, margin_bottom=12, margin_start=12, margin_end=12)
+
+        reachable = sum(1 for keys in results.values() if keys)
+        message = f"{reachable} of the hosts about to be opened are not in known_hosts yet. Check their fingerprints and approve the ones you trust; they are added to known_hosts before the connections start."
+        via = via or {}
+        if via:
+            message += " Hosts behind a jump host are scanned from it, which needs a key or agent login and ssh-keyscan on the jump host."
+        content.append(Gtk.Label(label=message, wrap=True, xalign=0))
+
+        list_box = Gtk.ListBox(selection_mode=Gtk.SelectionMode.NONE)
+        list_box.add_css_class("boxed-list")
+
+        for target, keys in sorted(results.items()):
+            title = GLib.markup_escape_text(_host_keys.host_pattern(*target))
+            if not keys:
+                subtitle = f"Could not be scanned through {via[target]}" if target in via else "Could not be reached"
+                row = Adw.ActionRow(title=title, subtitle=GLib.markup_escape_text(f"{subtitle}; its key will be asked for in the terminal"))
+                row.set_sensitive(False)
+                list_box.append(row)
+                continue
+
+            subtitle = "\n".join(f"{key_type} {_host_keys.fingerprint(key)}" for key_type, key in keys)
+            if target in via:
+                subtitle = f"via {via[target]}\n{subtitle}"
+            row = Adw.SwitchRow(title=title, subtitle=GLib.markup_escape_text(subtitle), active=True)
+            row.add_css_class("monospace")
+            self.switches[target] = row
+            list_box.append(row)
+
+        scrolled_window = Gtk.ScrolledWindow(hexpand=True, vexpand=True)
+        scrolled_window.set_child(list_box)
+        content.append(scrolled_window)
+
+        select_all_button = Gtk.Button(label="Select All")
+        select_all_button.connect("clicked", lambda b: self._set_all(True))
+        select_none_button = Gtk.Button(label="Select None")
+        select_none_button.connect("clicked", lambda b: self._set_all(False))
+        selection_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6, halign=Gtk.Align.END)
+        selection_box.append(select_all_button)
+        selection_box.append(select_none_button)
+        content.append(selection_box)
+
+        skip_button = Gtk.Button.new_with_mnemonic("_Skip")
+        skip_button.connect("clicked", lambda b: self.emit("response", False))
+
+        approve_button = Gtk.Button.new_with_mnemonic("_Approve")
+        approve_button.add_css_class("suggested-action")
+        approve_button.connect("clicked", lambda b: self.emit("response", True))
+        self.set_default_widget(approve_button)
+
+        header_bar = Adw.HeaderBar(show_start_title_buttons=False, show_end_title_buttons=False)
+        header_bar.pack_start(skip_button)
+        header_bar.pack_end(approve_button)
+
+        toolbar_view = Adw.ToolbarView(content=content)
+        toolbar_view.add_top_bar(header_bar)
+        self.set_content(toolbar_view)
+
+        evk = Gtk.EventControllerKey()
+        evk.connect("key-pressed", self.on_key_pressed)
+        self.add_controller(evk)
+
+    def on_key_pressed(self, controller, keyval, keycode, state):
+        if keyval == Gdk.KEY_Escape:
+            self.emit("response", False)
+            return True
+
+    def _set_all(self, active: bool):
+        for row in self.switches.values():
+            row.set_active(active)
+
+    def get_approved(self) -> Dict[tuple[str, int], List[tuple[str, str]]]:
+        return {target: self.results[target] for target, row in self.switches.items() if row.get_active()}
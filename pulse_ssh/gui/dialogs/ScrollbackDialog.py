@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import Adw  # type: ignore
+from gi.repository import Gdk  # type: ignore
+from gi.repository import GLib  # type: ignore
+from gi.repository import Gtk  # type: ignore
+import pulse_ssh.data.ScrollbackUsage as _scrollback_usage
+import pulse_ssh.Globals as _globals
+import pulse_ssh.gui.Globals as _gui_globals
+import pulse_ssh.Scrollback as _scrollback
+import time
+
+def format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+class ScrollbackDialog(Adw.Window):
+    def __init__(self, parent):
+        super().__init__(transient_for=parent)
+        self.set_title("Scrollback Usage")
+        self.set_default_size(640, 480)
+
+        content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12, margin_top=12, margin_bottom=12, margin_start=12, margin_end=12)
+
+        self.summary_label = Gtk.Label(wrap=True, xalign=0)
+        content.append(self.summary_label)
+
+        self.list_box = Gtk.ListBox(selection_mode=Gtk.SelectionMode.NONE)
+        self.list_box.add_css_class("boxed-list")
+
+        scrolled_window = Gtk.ScrolledWindow(hexpand=True, vexpand=True)
+        scrolled_window.set_child(self.list_box)
+        content.append(scrolled_window)
+
+        refresh_button = Gtk.Button(icon_name="view-refresh-symbolic")
+        refresh_button.set_tooltip_text("Refresh")
+        refresh_button.connect("clicked", lambda b: self.populate())
+
+        enforce_button = Gtk.Button(label="Enforce Budget")
+        enforce_button.set_tooltip_text("Trim scrollback now instead of waiting for the next check")
+        enforce_button.connect("clicked", self.on_enforce_clicked)
+
+        header_bar = Adw.HeaderBar()
+        header_bar.pack_start(refresh_button)
+        header_bar.pack_end(enforce_button)
+
+        toolbar_view = Adw.ToolbarView(content=content)
+        toolbar_view.add_top_bar(header_bar)
+        self.set_content(toolbar_view)
+
+        evk = Gtk.EventControllerKey()
+        evk.connect("key-pressed", self.on_key_pressed)
+        self.add_controller(evk)
+
+        self.populate()
+
+    def on_key_pressed(self, controller, keyval, keycode, state):
+        if keyval == Gdk.KEY_Escape:
+            self.close()
+            return True
+
+    def on_enforce_clicked(self, button):
+        _gui_globals.scrollback_manager.enforce()
+        self.populate()
+
+    def populate(self):
+        while row := self.list_box.get_first_child():
+            self.list_box.remove(row)
+
+        usages = _gui_globals.scrollback_manager.get_usages()
+        usages.sort(key=lambda usage: _scrollback.estimate_bytes(usage.rows, usage.columns), reverse=True)
+
+        total = sum(_scrollback.estimate_bytes(usage.rows, usage.columns) for usage in usages)
+        budget_mb = _globals.app_config.scrollback_budget_mb
+        budget = f"{budget_mb} MiB budget" if budget_mb > 0 else "no budget set"
+        self.summary_label.set_text(f"{len(usages)} terminals hold about {format_bytes(total)} of scrollback ({budget}). Estimates assume {_scrollback.BYTES_PER_CELL} bytes per cell.")
+
+        now = time.monotonic()
+        for usage in usages:
+            self.list_box.append(self.build_row(usage, now))
+
+    def build_row(self, usage: _scrollback_usage.ScrollbackUsage, now: float) -> Adw.ActionRow:
+        if not usage.connected:
+            state = "disconnected"
+        elif usage.visible:
+            state = "visible"
+        elif usage.hidden_since is not None:
+            state = f"hidden for {int(now - usage.hidden_since) // 60} min"
+        else:
+            state = "hidden"
+
+        limit = "unlimited" if usage.limit < 0 else f"limit {usage.limit}"
+        subtitle = f"{usage.rows} lines × {usage.columns} columns · {limit} · {state}"
+        if usage.spilled_lines:
+            subtitle += f"\n{usage.spilled_lines} older lines in {_gui_globals.scrollback_manager.get_spill_path(usage.key)}"
+
+        row = Adw.ActionRow(title=GLib.markup_escape_text(usage.name), subtitle=GLib.markup_escape_text(subtitle))
+        row.add_suffix(Gtk.Label(label=format_bytes(_scrollback.estimate_bytes(usage.rows, usage.columns))))
+        return row
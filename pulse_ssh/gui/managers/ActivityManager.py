@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import GLib  # type: ignore
+from gi.repository import Gtk  # type: ignore
+from typing import Optional
+import pulse_ssh.Globals as _globals
+import pulse_ssh.gui.Globals as _gui_globals
+
+REFRESH_INTERVAL_SECONDS = 2
+
+class ActivityManager:
+    """Quiets terminals that cannot be seen and flags their tab once they print something; their output is still read and parsed, only scrolling stops."""
+
+    def __init__(self, app_window):
+        self.app_window = app_window
+        self.active_pages = set()
+        self.refresh_source_id: Optional[int] = None
+
+    def start(self):
+        for terminal in self._get_all_terminals():
+            if not _globals.app_config.throttle_hidden_terminals:
+                self.on_shown(terminal)
+            elif not self.is_visible(terminal):
+                self.on_hidden(terminal)
+
+    def watch_window(self, window: Gtk.Window):
+        """Treats every terminal of a window as hidden while the window is minimized or otherwise suspended (GTK 4.12+)."""
+        if window.find_property('suspended'):
+            window.connect("notify::suspended", self.on_window_suspended)
+
+    def is_visible(self, terminal) -> bool:
+        root = terminal.get_root()
+        return terminal.get_mapped() and not (root and root.find_property('suspended') and root.get_property('suspended'))
+
+    def on_window_suspended(self, window, param):
+        for terminal in self.app_window._find_all_terminals_in_widget(window):
+            if self.is_visible(terminal):
+                self.on_shown(terminal)
+            else:
+                self.on_hidden(terminal)
+
+    def on_hidden(self, terminal):
+        if getattr(terminal, 'throttled', False) or not _globals.app_config.throttle_hidden_terminals:
+            return
+        terminal.throttled = True
+        terminal.set_scroll_on_output(False)
+        terminal.hidden_row = terminal.get_cursor_position()[1]
+        terminal.activity_handler_id = terminal.connect("contents-changed", self.on_hidden_output)
+
+    def on_shown(self, terminal):
+        if not getattr(terminal, 'throttled', False):
+            return
+        terminal.throttled = False
+        terminal.set_scroll_on_output(_globals.app_config.scroll_on_output)
+        if terminal.activity_handler_id:
+            terminal.disconnect(terminal.activity_handler_id)
+            terminal.activity_handler_id = None
+        if getattr(terminal, 'has_activity', False):
+            terminal.has_activity = False
+            self._refresh_page(terminal)
+
+    def on_hidden_output(self, terminal):
+        """Runs once per hidden period: later output only moves the cursor, which the periodic refresh reads."""
+        terminal.disconnect(terminal.activity_handler_id)
+        terminal.activity_handler_id = None
+        terminal.has_activity = True
+        self._refresh_page(terminal)
+        if not self.refresh_source_id:
+            self.refresh_source_id = GLib.timeout_add_seconds(REFRESH_INTERVAL_SECONDS, self._on_refresh)
+
+    def get_new_lines(self, terminal) -> int:
+        return max(0, terminal.get_cursor_position()[1] - getattr(terminal, 'hidden_row', 0))
+
+    def _refresh_page(self, terminal):
+        get_ancestor_page = getattr(terminal, 'get_ancestor_page', None)
+        page = get_ancestor_page()[1] if get_ancestor_page else None
+        if not page or not self.app_window:
+            return
+        self.app_window.updatePageTitle(page)
+        if any(getattr(t, 'has_activity', False) for t in self.app_window._find_all_terminals_in_widget(page.get_child())):
+            self.active_pages.add(page)
+        else:
+            self.active_pages.discard(page)
+
+    def _on_refresh(self):
+        for page in list(self.active_pages):
+            if page.get_child() is None:
+                self.active_pages.discard(page)
+            else:
+                self.app_window.updatePageTitle(page)
+        if self.active_pages:
+            return GLib.SOURCE_CONTINUE
+        self.refresh_source_id = None
+        return GLib.SOURCE_REMOVE
+
+    def _get_all_terminals(self) -> list:
+        terminals = []
+        for notebook in _gui_globals.all_notebooks:
+            terminals.extend(self.app_window._find_all_terminals_in_widget(notebook))
+        return terminals
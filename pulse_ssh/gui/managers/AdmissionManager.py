@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from collections import deque
+from gi.repository import GLib  # type: ignore
+from typing import Callable
+from typing import Dict
+from typing import Optional
+import pulse_ssh.Globals as _globals
+import pulse_ssh.Utils as _utils
+import time
+
+SETTLE_TIMEOUT_SECONDS = 15
+
+class HopState:
+    def __init__(self, burst: int):
+        self.tokens = float(burst)
+        self.refilled_at = time.monotonic()
+        self.queue = deque()
+        self.in_flight = set()
+        self.admitted = 0
+        self.max_queue_depth = 0
+        self.total_wait = 0.0
+
+class AdmissionManager:
+    """Paces connection spawns per first hop with a token bucket and a cap on handshakes in flight."""
+
+    def __init__(self, app_window):
+        self.app_window = app_window
+        self.hops: Dict[str, HopState] = {}
+        self.terminal_hops: Dict[object, str] = {}
+        self.timeout_ids: Dict[object, int] = {}
+        self.pump_source_id: Optional[int] = None
+
+    def submit(self, terminal, hop: Optional[str], start: Callable[[], None]):
+        if not hop or _globals.app_config.admission_max_in_flight <= 0:
+            start()
+            return
+
+        state = self.hops.setdefault(hop, HopState(_globals.app_config.admission_burst))
+        self.terminal_hops[terminal] = hop
+        state.queue.append((terminal, start, time.monotonic()))
+        state.max_queue_depth = max(state.max_queue_depth, len(state.queue))
+        self._pump()
+
+        if any(t is terminal for t, _, _ in state.queue):
+            message = f"\r\n{_utils.color_iyellow} --- Waiting for a connection slot on {hop} ({len(state.queue)} queued, {len(state.in_flight)} connecting){_utils.color_reset}\r\n"
+            terminal.feed(message.encode('utf-8'))
+
+    def release(self, terminal):
+        """Frees the terminal's slot once its handshake settled, or drops it from the queue if it never started."""
+        hop = self.terminal_hops.pop(terminal, None)
+        timeout_id = self.timeout_ids.pop(terminal, None)
+        if timeout_id:
+            GLib.source_remove(timeout_id)
+        if hop is None or hop not in self.hops:
+            return
+
+        state = self.hops[hop]
+        state.in_flight.discard(terminal)
+        state.queue = deque(entry for entry in state.queue if entry[0] is not terminal)
+        self._pump()
+
+    def get_metrics(self) -> Dict[str, dict]:
+        metrics = {}
+        for hop, state in self.hops.items():
+            metrics[hop] = {
+                'queued': len(state.queue),
+                'in_flight': len(state.in_flight),
+                'admitted': state.admitted,
+                'max_queue_depth': state.max_queue_depth,
+                'average_wait': state.total_wait / state.admitted if state.admitted else 0.0
+            }
+        return metrics
+
+    def _pump(self):
+        config = _globals.app_config
+        now = time.monotonic()
+        next_token_in = None
+
+        for state in self.hops.values():
+            if config.admission_rate > 0:
+                state.tokens = min(float(config.admission_burst), state.tokens + (now - state.refilled_at) * config.admission_rate)
+            else:
+                state.tokens = float(max(1, config.admission_burst))
+            state.refilled_at = now
+
+            while state.queue and len(state.in_flight) < config.admission_max_in_flight and state.tokens >= 1:
+                terminal, start, queued_at = state.queue.popleft()
+                if config.admission_rate > 0:
+                    state.tokens -= 1
+                state.in_flight.add(terminal)
+                state.admitted += 1
+                state.total_wait += now - queued_at
+                self.timeout_ids[terminal] = GLib.timeout_add_seconds(SETTLE_TIMEOUT_SECONDS, self._on_settle_timeout, terminal)
+                start()
+
+            if state.queue and len(state.in_flight) < config.admission_max_in_flight and config.admission_rate > 0:
+                wait = (1 - state.tokens) / config.admission_rate
+                next_token_in = wait if next_token_in is None else min(next_token_in, wait)
+
+        if next_token_in is not None and not self.pump_source_id:
+            self.pump_source_id = GLib.timeout_add(max(1, int(next_token_in * 1000)), self._on_pump_timeout)
+
+    def _on_pump_timeout(self):
+        self.pump_source_id = None
+        self._pump()
+        return GLib.SOURCE_REMOVE
+
+    def _on_settle_timeout(self, terminal):
+        self.timeout_ids.pop(terminal, None)
+        self.release(terminal)
+        return GLib.SOURCE_REMOVE
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import Adw  # type: ignore
+from gi.repository import Gio  # type: ignore
+from gi.repository import GLib  # type: ignore
+from typing import Optional
+import json
+import os
+import pulse_ssh.data.ConfigDiff as _config_diff
+import pulse_ssh.Globals as _globals
+import pulse_ssh.gui.Globals as _gui_globals
+import pulse_ssh.Utils as _utils
+import threading
+import time
+
+RELOAD_DEBOUNCE_MS = 250
+
+class ConfigReloadManager:
+    def __init__(self, app_window):
+        self.app_window = app_window
+        self.file_monitor: Optional[Gio.FileMonitor] = None
+        self.debounce_source_id: Optional[int] = None
+        self.reload_in_progress = False
+        self.reload_pending = False
+
+    def start(self):
+        self.stop()
+        cfg_path = os.path.join(_globals.config_dir, "settings.json")
+        self.file_monitor = Gio.File.new_for_path(cfg_path).monitor_file(Gio.FileMonitorFlags.WATCH_MOVES, None)
+        self.file_monitor.connect("changed", self._on_file_changed)
+
+    def stop(self):
+        if self.file_monitor:
+            self.file_monitor.cancel()
+            self.file_monitor = None
+
+    def _on_file_changed(self, monitor, file, other_file, event_type):
+        if event_type not in (Gio.FileMonitorEvent.CHANGES_DONE_HINT, Gio.FileMonitorEvent.CREATED, Gio.FileMonitorEvent.MOVED_IN, Gio.FileMonitorEvent.RENAMED):
+            return
+
+        if self.debounce_source_id:
+            GLib.source_remove(self.debounce_source_id)
+        self.debounce_source_id = GLib.timeout_add(RELOAD_DEBOUNCE_MS, self._on_debounce_timeout)
+
+    def _on_debounce_timeout(self):
+        self.debounce_source_id = None
+        self.reload_now()
+        return GLib.SOURCE_REMOVE
+
+    def reload_now(self):
+        if self.reload_in_progress:
+            self.reload_pending = True
+            return
+
+        if _globals.app_config.encryption_enabled and _globals.app_config.encryption_canary and not _globals.encryption_key:
+            return
+
+        self.reload_in_progress = True
+        worker = threading.Thread(
+            target=self._reload_worker,
+            args=(_globals.config_dir, _globals.settings_hash, _globals.app_config, dict(_globals.connections), dict(_globals.clusters)),
+            daemon=True
+        )
+        worker.start()
+
+    def _reload_worker(self, config_dir, known_hash, current_app_config, connections_snapshot, clusters_snapshot):
+        start = time.monotonic()
+        try:
+            with open(os.path.join(config_dir, "settings.json"), 'rb') as f:
+                raw = f.read()
+            new_hash = _utils.hash_settings(raw)
+            if new_hash == known_hash:
+                GLib.idle_add(self._finish_reload, known_hash, None, None)
+                return
+
+            # Folders the tree has not expanded yet are read here so they count as existing, not added, in the diff.
+            unloaded_shards = _utils.read_config_shards(config_dir)
+            for shard_connections in unloaded_shards.values():
+                for uuid_str, conn in shard_connections.items():
+                    connections_snapshot.setdefault(uuid_str, conn)
+
+            data = json.loads(raw) or {}
+            app_config_, connections_, clusters_ = _utils.parse_app_config(data)
+            connections_.update(_utils.read_all_config_shards(config_dir, data))
+        except (OSError, ValueError, TypeError, KeyError):
+            GLib.idle_add(self._finish_reload, known_hash, None, None)
+            return
+
+        if app_config_.encryption_enabled:
+            _utils.decrypt_connections(connections_)
+
+        diff = _utils.diff_app_config(connections_snapshot, clusters_snapshot, connections_, clusters_)
+        if app_config_ != current_app_config:
+            diff.app_config = app_config_
+        diff.duration = time.monotonic() - start
+
+        GLib.idle_add(self._finish_reload, known_hash, new_hash, diff, unloaded_shards)
+
+    def _finish_reload(self, known_hash: Optional[str], new_hash: Optional[str], diff: Optional[_config_diff.ConfigDiff], unloaded_shards: Optional[dict] = None):
+        self.reload_in_progress = False
+
+        if diff is not None:
+            if _globals.settings_hash != known_hash:
+                self.reload_pending = True
+            else:
+                _globals.settings_hash = new_hash
+                if not diff.is_empty():
+                    self.app_window.connections_view.install_config_shards(unloaded_shards or {})
+                    self.app_window.apply_config_diff(diff)
+                    _gui_globals.prewarm_manager.forget(diff.changed_connections + diff.removed_connections)
+                    if diff.app_config:
+                        _gui_globals.inventory_manager.start()
+                        _gui_globals.reachability_manager.start()
+                        _gui_globals.resolver_manager.start()
+                        _gui_globals.prewarm_manager.start()
+                        _gui_globals.reconnect_manager.start()
+                        _gui_globals.scrollback_manager.start()
+                        _gui_globals.activity_manager.start()
+                        _gui_globals.session_log_manager.start()
+                        _gui_globals.recording_manager.start()
+                    message = f"Settings reloaded from disk in {diff.duration * 1000:.0f} ms ({diff.summary()})"
+                    self.app_window.toast_overlay.add_toast(Adw.Toast.new(GLib.markup_escape_text(message)))
+
+        if _globals.settings_conflict_path:
+            message = f"settings.json was changed externally; your unsaved changes were written to {_globals.settings_conflict_path}"
+            self.app_window.toast_overlay.add_toast(Adw.Toast.new(GLib.markup_escape_text(message)))
+            _globals.settings_conflict_path = None
+
+        if self.reload_pending:
+            self.reload_pending = False
+            self.reload_now()
+
+        return GLib.SOURCE_REMOVE
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import Adw  # type: ignore
+from gi.repository import GLib  # type: ignore
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+import pulse_ssh.data.Connection as _connection
+import pulse_ssh.Globals as _globals
+import pulse_ssh.gui.dialogs.HostKeyDialog as _host_key_dialog
+import pulse_ssh.HostKeys as _host_keys
+import pulse_ssh.Utils as _utils
+import threading
+
+SCANNED_TYPES = ('ssh', 'mosh', 'sftp')
+
+class HostKeyManager:
+    def __init__(self, app_window):
+        self.app_window = app_window
+
+    def get_scan_targets(self, connections: List[_connection.Connection]) -> Dict[tuple[str, int], Optional[_connection.Connection]]:
+        """Maps each (host, port) these connections check a host key for to the jump host it is reached through, or None when reached directly."""
+        targets = {}
+        for conn in connections:
+            if conn.type not in SCANNED_TYPES or not conn.host:
+                continue
+            target = (conn.host, int(conn.port or 22))
+            jump_conn = _globals.connections.get(conn.ssh_proxy_jump) if conn.ssh_proxy_jump else None
+            if jump_conn and jump_conn.host:
+                targets[(jump_conn.host, int(jump_conn.port or 22))] = None
+                targets.setdefault(target, jump_conn)
+            else:
+                targets[target] = None
+        return targets
+
+    def prescan(self, connections: List[_connection.Connection], on_done: Callable[[], None]):
+        """Collects the host keys of unknown hosts before on_done launches the connections."""
+        if not _globals.app_config.host_key_prescan:
+            on_done()
+            return
+
+        targets = self.get_scan_targets(connections)
+        if not targets:
+            on_done()
+            return
+
+        worker = threading.Thread(target=self._scan_worker, args=(targets, on_done), daemon=True)
+        worker.start()
+
+    def _scan_worker(self, targets, on_done):
+        """Scans direct hosts first, so hosts behind a jump host not in known_hosts yet can be scanned with its keys pinned."""
+        host_fields = _host_keys.load_known_hosts()
+        unknown = {target: jump_conn for target, jump_conn in targets.items() if not _host_keys.is_host_known(target[0], target[1], host_fields)}
+        if not unknown:
+            GLib.idle_add(self._finish, on_done)
+            return
+
+        results = _host_keys.scan_hosts(target for target, jump_conn in unknown.items() if jump_conn is None)
+
+        via_jumps = {}
+        via = {}
+        for target, jump_conn in unknown.items():
+            if jump_conn is None:
+                continue
+            jump_target = (jump_conn.host, int(jump_conn.port or 22))
+            via[target] = jump_conn.name or jump_conn.host
+            if jump_target not in unknown:
+                via_jumps[target] = (_utils.build_jump_argv(_globals.app_config, jump_conn), None)
+            elif results.get(jump_target):
+                via_jumps[target] = (_utils.build_jump_argv(_globals.app_config, jump_conn), {jump_target: results[jump_target]})
+            else:
+                results[target] = []
+        results.update(_host_keys.scan_hosts_via_jumps(via_jumps))
+        GLib.idle_add(self._show_results, results, via, on_done)
+
+    def _finish(self, on_done):
+        on_done()
+        return GLib.SOURCE_REMOVE
+
+    def _show_results(self, results, via, on_done):
+        if not any(results.values()):
+            on_done()
+            return GLib.SOURCE_REMOVE
+
+        dialog = _host_key_dialog.HostKeyDialog(self.app_window, results, via)
+        def on_response(d, approved):
+            if approved:
+                try:
+                    _host_keys.append_known_hosts(d.get_approved())
+                except OSError as e:
+                    self.app_window.toast_overlay.add_toast(Adw.Toast.new(GLib.markup_escape_text(f"Could not update known_hosts: {e}")))
+            d.destroy()
+            on_done()
+        dialog.connect("response", on_response)
+        dialog.present()
+        return GLib.SOURCE_REMOVE
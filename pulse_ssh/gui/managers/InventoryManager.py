@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import Adw  # type: ignore
+from gi.repository import GLib  # type: ignore
+from typing import List
+from typing import Optional
+import pulse_ssh.data.ConfigDiff as _config_diff
+import pulse_ssh.Globals as _globals
+import pulse_ssh.Inventory as _inventory
+import pulse_ssh.Utils as _utils
+import threading
+import time
+
+MIN_POLL_INTERVAL = 10
+
+class InventoryManager:
+    def __init__(self, app_window):
+        self.app_window = app_window
+        self.poll_source_id: Optional[int] = None
+        self.sync_in_progress = False
+        self.last_sync_duration: Optional[float] = None
+        self.last_skipped: List[str] = []
+
+    def start(self):
+        self.stop()
+        if not _globals.app_config.inventory_source:
+            return
+
+        self.sync_now()
+        interval = max(MIN_POLL_INTERVAL, _globals.app_config.inventory_poll_interval)
+        self.poll_source_id = GLib.timeout_add_seconds(interval, self._on_poll_timeout)
+
+    def stop(self):
+        if self.poll_source_id:
+            GLib.source_remove(self.poll_source_id)
+            self.poll_source_id = None
+
+    def _on_poll_timeout(self):
+        self.sync_now()
+        return GLib.SOURCE_CONTINUE
+
+    def sync_now(self):
+        if self.sync_in_progress or not _globals.app_config.inventory_source:
+            return
+
+        self.sync_in_progress = True
+        self.app_window.load_all_config_shards()
+        worker = threading.Thread(
+            target=self._sync_worker,
+            args=(_globals.app_config.inventory_source, _globals.app_config.inventory_is_command, dict(_globals.connections), dict(_globals.clusters)),
+            daemon=True
+        )
+        worker.start()
+
+    def _sync_worker(self, source, is_command, connections_snapshot, clusters_snapshot):
+        start = time.monotonic()
+        try:
+            diff = _inventory.load_inventory_diff(source, is_command, connections_snapshot, clusters_snapshot)
+            diff.duration = time.monotonic() - start
+            GLib.idle_add(self._apply_diff, diff)
+        except Exception as e:
+            GLib.idle_add(self._report_error, str(e) or type(e).__name__)
+
+    def _report_error(self, message: str):
+        self.sync_in_progress = False
+        self.app_window.toast_overlay.add_toast(Adw.Toast.new(GLib.markup_escape_text(f"Inventory sync failed: {message}")))
+        return GLib.SOURCE_REMOVE
+
+    def _apply_diff(self, diff: _config_diff.ConfigDiff):
+        self.sync_in_progress = False
+        self.last_sync_duration = diff.duration
+
+        if diff.skipped and diff.skipped != self.last_skipped:
+            message = f"Inventory entries skipped, their uuid belongs to a local entry: {', '.join(diff.skipped)}"
+            self.app_window.toast_overlay.add_toast(Adw.Toast.new(GLib.markup_escape_text(message)))
+        self.last_skipped = diff.skipped
+
+        if diff.is_empty():
+            return GLib.SOURCE_REMOVE
+
+        self.app_window.apply_config_diff(diff)
+
+        _utils.save_app_config(_globals.config_dir, _globals.readonly, _globals.app_config, _globals.connections, _globals.clusters)
+
+        message = f"Inventory synced in {diff.duration * 1000:.0f} ms ({diff.summary()})"
+        self.app_window.toast_overlay.add_toast(Adw.Toast.new(GLib.markup_escape_text(message)))
+
+        return GLib.SOURCE_REMOVE
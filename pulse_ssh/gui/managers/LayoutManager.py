@@ -6,44 +6,27 @@ gi.require_version('Gdk', '4.0')
 gi.require_version('Gtk', '4.0')
 gi.require_version('Vte', '3.91')
 
-from gi.repository import GLib  # type: ignore
 from gi.repository import Gtk  # type: ignore
+from typing import Dict
 from typing import Optional
 import pulse_ssh.data.Connection as _connection
+import pulse_ssh.data.LayoutNode as _layout_node
 import pulse_ssh.Globals as _globals
 import pulse_ssh.gui.Globals as _gui_globals
+import pulse_ssh.gui.TilingLayout as _tiling_layout
+import pulse_ssh.gui.VteTerminal as _vte_terminal
 import pulse_ssh.gui.VteTerminalLOCAL as _vte_terminal_local
 import pulse_ssh.gui.VteTerminalSSH as _vte_terminal_ssh
 import pulse_ssh.gui.VteTerminalMOSH as _vte_terminal_mosh
 import pulse_ssh.gui.VteTerminalSFTP as _vte_terminal_sftp
 import pulse_ssh.gui.VteTerminalFTP as _vte_terminal_ftp
+import pulse_ssh.gui.VteTerminalPlayer as _vte_terminal_player
+import pulse_ssh.Layout as _layout
 
 class LayoutManager:
     def __init__(self, app_window):
         self.app_window = app_window
 
-    def build_paned_widget(self, orientation, source_content: Gtk.Widget, target_content: Gtk.Widget) -> Gtk.Paned:
-        paned = Gtk.Paned(orientation=orientation, wide_handle=False)
-        paned.set_start_child(source_content)
-        paned.set_end_child(target_content)
-
-        def set_initial_position(p):
-            if p.get_orientation() == Gtk.Orientation.HORIZONTAL:
-                width = p.get_allocated_width()
-                if width > 0:
-                    p.set_position(width // 2)
-                    return GLib.SOURCE_REMOVE
-            else:
-                height = p.get_allocated_height()
-                if height > 0:
-                    p.set_position(height // 2)
-                    return GLib.SOURCE_REMOVE
-            return GLib.SOURCE_CONTINUE
-
-        paned.connect_after("map", lambda p: GLib.idle_add(set_initial_position, p))
-
-        return paned
-
     def open_connection_tab(self, conn: _connection.Connection, cluster_id: Optional[str] = None, cluster_name: Optional[str] = None):
         terminal = _gui_globals.layout_manager.create_terminal(conn, cluster_id, cluster_name)
 
@@ -53,6 +36,22 @@ class LayoutManager:
         _gui_globals.all_notebooks[0].set_selected_page(page)
         self.app_window.updatePageTitle(page)
 
+    def open_recording_tab(self, path: str):
+        player = _vte_terminal_player.VteTerminalPlayer(self.app_window, path)
+
+        scrolled = Gtk.ScrolledWindow()
+        if _globals.app_config.scrollbar_visible:
+            scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.ALWAYS)
+        scrolled.set_child(player)
+
+        boxy = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        boxy.append(scrolled)
+        boxy.append(player.build_controls())
+        page = _gui_globals.all_notebooks[0].append(boxy)
+        _gui_globals.all_notebooks[0].set_selected_page(page)
+        self.app_window.updatePageTitle(page)
+        player.play()
+
     def create_terminal(self, conn: _connection.Connection, cluster_id: Optional[str] = None, cluster_name: Optional[str] = None) -> Gtk.ScrolledWindow:
         conn_uuid = conn if isinstance(conn, str) else conn.uuid
         if conn_uuid in _globals.connections:
@@ -60,6 +59,9 @@ class LayoutManager:
         else:
             conn_obj = conn
 
+        if conn_obj.ssh_proxy_jump and conn_obj.ssh_proxy_jump not in _globals.connections:
+            self.app_window.load_all_config_shards()
+
         terminal = None
         if conn_obj.type == "ssh":
             terminal = _vte_terminal_ssh.VteTerminalSSH(self.app_window, conn_obj, cluster_id, cluster_name)
@@ -72,6 +74,10 @@ class LayoutManager:
         elif conn_obj.type == "local":
             terminal = _vte_terminal_local.VteTerminalLOCAL(self.app_window, conn_obj, cluster_id, cluster_name)
 
+        if terminal:
+            _gui_globals.recording_manager.watch(terminal)
+            _gui_globals.session_log_manager.watch(terminal)
+
         scrolled = Gtk.ScrolledWindow()
         if _globals.app_config.scrollbar_visible:
             scrolled.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.ALWAYS)
@@ -79,24 +85,6 @@ class LayoutManager:
 
         return scrolled
 
-    def replace_terminal(self, old_terminal, new_scrolled_window):
-        notebook, page = old_terminal.get_ancestor_page()
-
-        old_scrolled_window = old_terminal.get_parent()
-        parent = old_scrolled_window.get_parent()
-        if not parent:
-            return
-        if isinstance(parent, Gtk.Box):
-            parent.remove(old_scrolled_window)
-            parent.append(new_scrolled_window)
-        elif isinstance(parent, Gtk.Paned):
-            if parent.get_start_child() == old_scrolled_window:
-                parent.set_start_child(new_scrolled_window)
-            else:
-                parent.set_end_child(new_scrolled_window)
-        if page:
-            self.app_window.updatePageTitle(page)
-
     def split_terminal_or_tab(self, action, param, terminal, source_page, orientation, target_page, target_notebook):
         if _globals.app_config.split_at_root or not terminal:
             self.split_tab(terminal, source_page, orientation, target_page, target_notebook)
@@ -104,26 +92,36 @@ class LayoutManager:
             self.split_terminal(terminal, source_page, orientation, target_page, target_notebook)
         self.app_window.updatePageTitle(source_page)
 
+    def take_target_content(self, terminal, target_page, target_notebook) -> Optional[Gtk.Widget]:
+        """Returns the pane a split adds: the content of target_page, or a new terminal to the same connection."""
+        if not target_page:
+            if not terminal or not hasattr(terminal, 'pulse_conn'):
+                return None
+            return self.create_terminal(terminal.pulse_conn)
+
+        target_content = target_page.get_child().get_first_child()
+        target_content.unparent()
+        target_notebook.close_page(target_page)
+        return target_content
+
     def split_tab(self, terminal, source_page, orientation, target_page, target_notebook):
         source_container = source_page.get_child()
         source_content = source_container.get_first_child()
-        source_content.unparent()
 
-        if not target_page:
-            if not terminal:
-                return
-            if not hasattr(terminal, 'pulse_conn'):
-                return
-            target_content = _gui_globals.layout_manager.create_terminal(terminal.pulse_conn)
-        else:
-            target_container = target_page.get_child()
-            target_content = target_container.get_first_child()
-            target_content.unparent()
-            target_notebook.close_page(target_page)
+        target_content = self.take_target_content(terminal, target_page, target_notebook)
+        if not target_content:
+            return
 
-        paned = self.build_paned_widget(orientation, source_content, target_content)
+        mode = _tiling_layout.orientation_mode(orientation)
+        if isinstance(source_content, _tiling_layout.TilingLayout) and source_content.mode == mode:
+            source_content.append(target_content)
+            return
 
-        source_container.append(paned)
+        source_container.remove(source_content)
+        tiling_layout = _tiling_layout.TilingLayout(mode)
+        tiling_layout.append(source_content)
+        tiling_layout.append(target_content)
+        source_container.append(tiling_layout)
 
     def split_terminal(self, terminal, source_page, orientation, target_page, target_notebook):
         source_scrolled_window = terminal.get_parent()
@@ -133,30 +131,40 @@ class LayoutManager:
 
         if isinstance(parent, Gtk.Box):
             self.split_tab(terminal, source_page, orientation, target_page, target_notebook)
-        elif isinstance(parent, Gtk.Paned):
-            is_start_child = parent.get_start_child() == source_scrolled_window
-            source_scrolled_window.unparent()
-            if is_start_child:
-                parent.set_start_child(None)
-            else:
-                parent.set_end_child(None)
-
-            if not target_page:
-                if not hasattr(terminal, 'pulse_conn'):
-                    return
-                target_content = _gui_globals.layout_manager.create_terminal(terminal.pulse_conn)
-            else:
-                target_container = target_page.get_child()
-                target_content = target_container.get_first_child()
-                target_content.unparent()
-                target_notebook.close_page(target_page)
-
-            paned = self.build_paned_widget(orientation, source_scrolled_window, target_content)
-
-            if is_start_child:
-                parent.set_start_child(paned)
-            else:
-                parent.set_end_child(paned)
+        elif isinstance(parent, _tiling_layout.TilingLayout):
+            target_content = self.take_target_content(terminal, target_page, target_notebook)
+            if not target_content:
+                return
+
+            mode = _tiling_layout.orientation_mode(orientation)
+            if parent.mode == mode:
+                parent.insert_after(target_content, source_scrolled_window)
+                return
+
+            tiling_layout = _tiling_layout.TilingLayout(mode)
+            parent.replace(source_scrolled_window, tiling_layout)
+            tiling_layout.append(source_scrolled_window)
+            tiling_layout.append(target_content)
+
+    def remove_pane(self, pane: Gtk.Widget) -> Optional[Gtk.Widget]:
+        """Takes pane out of its tiling layout, collapsing the layout into its last pane; returns the pane to focus next."""
+        tiling_layout = pane.get_parent()
+        tiling_layout.remove(pane)
+        if tiling_layout.n_panes > 1:
+            return tiling_layout.get_first_child()
+
+        sibling = tiling_layout.get_first_child()
+        if not sibling:
+            return None
+        tiling_layout.remove(sibling)
+
+        grandparent = tiling_layout.get_parent()
+        if isinstance(grandparent, _tiling_layout.TilingLayout):
+            grandparent.replace(tiling_layout, sibling)
+        elif isinstance(grandparent, Gtk.Box):
+            grandparent.remove(tiling_layout)
+            grandparent.append(sibling)
+        return sibling
 
     def unsplit_terminal(self, action, param, terminal):
         notebook, page = terminal.get_ancestor_page()
@@ -165,45 +173,22 @@ class LayoutManager:
 
         source_scrolled_window = terminal.get_parent()
         parent = source_scrolled_window.get_parent()
-        if not parent:
+        if not isinstance(parent, _tiling_layout.TilingLayout):
             return
 
-        if isinstance(parent, Gtk.Paned):
-            if parent.get_start_child() == source_scrolled_window:
-                sibling = parent.get_end_child()
-            else:
-                sibling = parent.get_start_child()
-
-            sibling.unparent()
-
-            parent.set_start_child(None)
-            parent.set_end_child(None)
-
-            boxy = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-            boxy.append(source_scrolled_window)
-            page = notebook.append(boxy)
-            self.app_window.updatePageTitle(page)
-
-            grandparent = parent.get_parent()
-            if not grandparent:
-                return
-
-            if isinstance(grandparent, Gtk.Box):
-                parent.unparent()
-                grandparent.append(sibling)
+        focus_pane = self.remove_pane(source_scrolled_window)
 
-            if isinstance(grandparent, Gtk.Paned):
-                if grandparent.get_start_child() == parent:
-                    grandparent.set_start_child(sibling)
-                else:
-                    grandparent.set_end_child(sibling)
+        boxy = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        boxy.append(source_scrolled_window)
+        new_page = notebook.append(boxy)
+        self.app_window.updatePageTitle(new_page)
 
-            if sibling:
-                term = self.app_window._find_first_terminal_in_widget(sibling)
-                if term:
-                    term.grab_focus()
+        if focus_pane:
+            term = self.app_window._find_first_terminal_in_widget(focus_pane)
+            if term:
+                term.grab_focus()
 
-            self.app_window.updatePageTitle(page)
+        self.app_window.updatePageTitle(page)
 
     def close_terminal(self, action, param, terminal):
         notebook, page = terminal.get_ancestor_page()
@@ -223,37 +208,120 @@ class LayoutManager:
                 if window_to_close: window_to_close.close()
             return
 
-        if isinstance(parent, Gtk.Paned):
-            if parent.get_start_child() == source_scrolled_window:
-                sibling = parent.get_end_child()
-            else:
-                sibling = parent.get_start_child()
+        if isinstance(parent, _tiling_layout.TilingLayout):
+            focus_pane = self.remove_pane(source_scrolled_window)
+            terminal.close()
+            if focus_pane:
+                term = self.app_window._find_first_terminal_in_widget(focus_pane)
+                if term:
+                    term.grab_focus()
 
-            sibling.unparent()
+            self.app_window.updatePageTitle(page)
 
-            parent.set_start_child(None)
-            parent.set_end_child(None)
+    def capture_layout(self, widget: Optional[Gtk.Widget]) -> Optional[_layout_node.LayoutNode]:
+        """Describes the panes under widget as a layout model."""
+        if isinstance(widget, _tiling_layout.TilingLayout):
+            children = [node for node in (self.capture_layout(pane) for pane in widget.get_panes()) if node]
+            node = _layout.split(widget.mode, children, widget.columns)
+            node.row_ratios = list(widget.row_ratios)
+            node.column_ratios = list(widget.column_ratios)
+            return node
+
+        terminal = widget.get_child() if isinstance(widget, Gtk.ScrolledWindow) else None
+        if isinstance(terminal, _vte_terminal.VteTerminal):
+            return _layout.leaf(terminal.terminal_id, terminal.pulse_conn.uuid, getattr(terminal, 'pulse_cluster_id', None), getattr(terminal, 'pulse_cluster_name', None))
+        return None
+
+    def collect_panes(self, widget: Gtk.Widget) -> Dict[str, Gtk.Widget]:
+        return {terminal.terminal_id: terminal.get_parent() for terminal in self.app_window._find_all_terminals_in_widget(widget)}
+
+    def render_layout(self, node: _layout_node.LayoutNode, panes: Dict[str, Gtk.Widget]) -> Optional[Gtk.Widget]:
+        """Builds the widget tree for a layout model, moving the existing pane widgets into it."""
+        if node.is_leaf():
+            pane = panes.get(node.terminal_id)
+            if pane and pane.get_parent():
+                pane.get_parent().remove(pane)
+            return pane
+
+        tiling_layout = _tiling_layout.TilingLayout(node.mode, node.columns)
+        for child in node.children:
+            widget = self.render_layout(child, panes)
+            if widget:
+                tiling_layout.append(widget)
+        tiling_layout.set_layout(node.mode, node.columns, node.row_ratios, node.column_ratios)
+        return tiling_layout
+
+    def apply_layout(self, page, node: Optional[_layout_node.LayoutNode], panes: Optional[Dict[str, Gtk.Widget]] = None):
+        """Re-renders a page from a layout model in one batch, swapping its whole content at once."""
+        container = page.get_child()
+        if panes is None:
+            panes = self.collect_panes(container)
+        focused = next((pane.get_child() for pane in panes.values() if pane.get_child().has_focus()), None)
+
+        old_root = container.get_first_child()
+        node = _layout.normalize(node)
+        new_root = self.render_layout(node, panes) if node else None
+        if old_root and old_root.get_parent() is container:
+            container.remove(old_root)
+        if new_root:
+            container.append(new_root)
+
+        if focused:
+            focused.grab_focus()
+        self.app_window.updatePageTitle(page)
 
-            grandparent = parent.get_parent()
-            if not grandparent:
-                return
+    def get_page_layout(self, page) -> Optional[_layout_node.LayoutNode]:
+        return self.capture_layout(page.get_child().get_first_child()) if page and page.get_child() else None
 
-            if isinstance(grandparent, Gtk.Box):
-                parent.unparent()
-                grandparent.append(sibling)
+    def rebalance_page(self, action, param, terminal):
+        notebook, page = terminal.get_ancestor_page()
+        node = self.get_page_layout(page)
+        if node:
+            self.apply_layout(page, _layout.rebalance(node))
 
-            if isinstance(grandparent, Gtk.Paned):
-                if grandparent.get_start_child() == parent:
-                    grandparent.set_start_child(sibling)
-                else:
-                    grandparent.set_end_child(sibling)
+    def swap_panes(self, action, param, terminal, other_terminal):
+        notebook, page = terminal.get_ancestor_page()
+        node = self.get_page_layout(page)
+        if node:
+            self.apply_layout(page, _layout.swap_panes(node, terminal.terminal_id, other_terminal.terminal_id))
 
-            if sibling:
-                term = self.app_window._find_first_terminal_in_widget(sibling)
-                if term:
-                    term.grab_focus()
+    def tabs_to_grid(self, action, param, terminal):
+        notebook, page = terminal.get_ancestor_page()
+        if not notebook or not page:
+            return
 
-            self.app_window.updatePageTitle(page)
+        pages = [notebook.get_nth_page(i) for i in range(notebook.get_n_pages())]
+        nodes = []
+        panes = {}
+        for tab_page in pages:
+            node = self.get_page_layout(tab_page)
+            if node:
+                nodes.append(node)
+                panes.update(self.collect_panes(tab_page.get_child()))
+        if len(nodes) < 2:
+            return
+
+        columns = _layout.best_grid_columns(len(panes), notebook.get_allocated_width(), notebook.get_allocated_height())
+        self.apply_layout(page, _layout.tabs_to_grid(nodes, columns), panes)
+
+        for tab_page in pages:
+            if tab_page is not page and not self.app_window._find_first_terminal_in_widget(tab_page.get_child()):
+                notebook.close_page(tab_page)
+        notebook.set_selected_page(page)
+
+    def grid_to_tabs(self, action, param, terminal):
+        notebook, page = terminal.get_ancestor_page()
+        node = self.get_page_layout(page)
+        if not node or node.is_leaf():
+            return
+
+        panes = self.collect_panes(page.get_child())
+        tabs = _layout.grid_to_tabs(node)
+        self.apply_layout(page, tabs[0], panes)
+        for tab in tabs[1:]:
+            boxy = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+            boxy.append(self.render_layout(tab, panes))
+            self.app_window.updatePageTitle(notebook.append(boxy))
 
     def detatch_terminal(self, action, param, terminal):
         notebook, page = terminal.get_ancestor_page()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import GLib  # type: ignore
+from typing import List
+from typing import Optional
+import pulse_ssh.data.Connection as _connection
+import pulse_ssh.Globals as _globals
+import pulse_ssh.gui.Globals as _gui_globals
+import pulse_ssh.Utils as _utils
+import threading
+
+class PrewarmManager:
+    def __init__(self, app_window):
+        self.app_window = app_window
+        self.pending_source_id: Optional[int] = None
+        self.pending_uuid: Optional[str] = None
+        self.in_progress = set()
+        self.lock = threading.Lock()
+
+    def start(self):
+        self.cancel()
+        config = _globals.app_config
+        _globals.prewarm.configure(config.prewarm_max_masters, config.prewarm_idle_timeout, config.ssh_path)
+        if not config.prewarm_enabled:
+            threading.Thread(target=_globals.prewarm.close, daemon=True).start()
+
+    def stop(self):
+        self.cancel()
+        _globals.prewarm.close()
+
+    def forget(self, connections: List[_connection.Connection]):
+        """Closes the masters of connections that changed, since a master stays connected to the old destination."""
+        conn_uuids = [conn.uuid for conn in connections]
+        if conn_uuids:
+            threading.Thread(target=self._forget_worker, args=(conn_uuids,), daemon=True).start()
+
+    def _forget_worker(self, conn_uuids: List[str]):
+        for conn_uuid in conn_uuids:
+            _globals.prewarm.close_connection(conn_uuid)
+
+    def schedule(self, conn: _connection.Connection):
+        """Pre-warms conn once the pointer or selection has rested on it for the configured delay."""
+        if not _globals.app_config.prewarm_enabled or conn.uuid == self.pending_uuid:
+            return
+        self.cancel()
+        self.pending_uuid = conn.uuid
+        self.pending_source_id = GLib.timeout_add(max(0, _globals.app_config.prewarm_delay_ms), self._on_timeout)
+
+    def cancel(self):
+        if self.pending_source_id:
+            GLib.source_remove(self.pending_source_id)
+        self.pending_source_id = None
+        self.pending_uuid = None
+
+    def _on_timeout(self):
+        conn = _globals.connections.get(self.pending_uuid)
+        self.pending_source_id = None
+        self.pending_uuid = None
+        if not conn:
+            return GLib.SOURCE_REMOVE
+
+        _gui_globals.resolver_manager.prefetch_connections([conn])
+        with self.lock:
+            if conn.uuid in self.in_progress:
+                return GLib.SOURCE_REMOVE
+            self.in_progress.add(conn.uuid)
+        threading.Thread(target=self._prewarm_worker, args=(conn,), daemon=True).start()
+        return GLib.SOURCE_REMOVE
+
+    def _prewarm_worker(self, conn: _connection.Connection):
+        try:
+            _utils.prewarm_connection(_globals.app_config, conn)
+        finally:
+            with self.lock:
+                self.in_progress.discard(conn.uuid)
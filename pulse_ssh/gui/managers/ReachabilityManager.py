@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import GLib  # type: ignore
+from gi.repository import Gtk  # type: ignore
+from typing import Dict
+from typing import List
+from typing import Optional
+import pulse_ssh.data.Connection as _connection
+import pulse_ssh.Globals as _globals
+import pulse_ssh.Reachability as _reachability
+import threading
+
+PROBED_TYPES = ('ssh', 'mosh', 'sftp', 'ftp')
+STATUS_CLASSES = ('reachability-up', 'reachability-down', 'reachability-partial', 'reachability-pending')
+
+class ReachabilityManager:
+    def __init__(self, app_window):
+        self.app_window = app_window
+        self.prober = _reachability.ReachabilityProber(self._on_result)
+        self.dots: Dict[Gtk.Widget, List[tuple[str, int]]] = {}
+        self.target_dots: Dict[tuple[str, int], set] = {}
+        self.updated_targets = set()
+        self.updated_lock = threading.Lock()
+        self.flush_scheduled = False
+        self.refresh_source_id: Optional[int] = None
+
+    def start(self):
+        self.stop()
+        if not _globals.app_config.reachability_enabled:
+            for dot in self.dots:
+                dot.set_visible(False)
+            return
+
+        self.prober.configure(_globals.app_config.reachability_ttl, _globals.app_config.reachability_ssh_banner)
+        self.prober.start()
+        self.refresh_source_id = GLib.timeout_add_seconds(max(5, _globals.app_config.reachability_ttl), self._on_refresh_timeout)
+        for dot, targets in self.dots.items():
+            self._update_dot(dot)
+            self.prober.request(targets, _reachability.PRIORITY_VISIBLE)
+
+    def stop(self):
+        if self.refresh_source_id:
+            GLib.source_remove(self.refresh_source_id)
+            self.refresh_source_id = None
+        self.prober.stop()
+
+    def get_target(self, conn: _connection.Connection) -> Optional[tuple[str, int]]:
+        """Returns the endpoint a connection's first handshake goes to, or None for local sessions."""
+        if conn.type not in PROBED_TYPES or not conn.host:
+            return None
+        if conn.ssh_proxy_jump and conn.type != 'ftp':
+            jump_conn = _globals.connections.get(conn.ssh_proxy_jump)
+            return (jump_conn.host, int(jump_conn.port or 22)) if jump_conn and jump_conn.host else None
+        return (conn.host, int(conn.port or 22))
+
+    def watch(self, dot: Gtk.Widget, connections: List[_connection.Connection], priority: int = _reachability.PRIORITY_VISIBLE):
+        """Binds a status dot to the connections it summarises and probes them if their results are stale."""
+        self.unwatch(dot)
+        targets = list(dict.fromkeys(t for t in (self.get_target(conn) for conn in connections) if t))
+        if not targets:
+            dot.set_visible(False)
+            return
+
+        self.dots[dot] = targets
+        for target in targets:
+            self.target_dots.setdefault(target, set()).add(dot)
+
+        if not _globals.app_config.reachability_enabled:
+            dot.set_visible(False)
+            return
+
+        self._update_dot(dot)
+        self.prober.request(targets, priority)
+
+    def unwatch(self, dot: Gtk.Widget):
+        for target in self.dots.pop(dot, []):
+            dots = self.target_dots.get(target)
+            if dots:
+                dots.discard(dot)
+                if not dots:
+                    del self.target_dots[target]
+
+    def probe_connections(self, connections: List[_connection.Connection], priority: int = _reachability.PRIORITY_EXPANDED):
+        if not _globals.app_config.reachability_enabled:
+            return
+        self.prober.request([t for t in (self.get_target(conn) for conn in connections) if t], priority)
+
+    def _on_result(self, target, result):
+        with self.updated_lock:
+            self.updated_targets.add(target)
+            if self.flush_scheduled:
+                return
+            self.flush_scheduled = True
+        GLib.idle_add(self._flush)
+
+    def _flush(self):
+        with self.updated_lock:
+            targets = self.updated_targets
+            self.updated_targets = set()
+            self.flush_scheduled = False
+
+        dots = set()
+        for target in targets:
+            dots.update(self.target_dots.get(target, ()))
+        for dot in dots:
+            self._update_dot(dot)
+        return GLib.SOURCE_REMOVE
+
+    def _on_refresh_timeout(self):
+        targets = list(self.target_dots.keys())
+        self.prober.request(targets, _reachability.PRIORITY_VISIBLE)
+        return GLib.SOURCE_CONTINUE
+
+    def _update_dot(self, dot: Gtk.Widget):
+        targets = self.dots.get(dot)
+        if not targets:
+            return
+
+        results = [self.prober.get(target) for target in targets]
+        known = [result for result in results if result]
+        up = [result for result in known if result.reachable]
+
+        if not known:
+            status = 'reachability-pending'
+            tooltip = "Checking…"
+        elif len(targets) == 1:
+            result = known[0]
+            status = 'reachability-up' if result.reachable else 'reachability-down'
+            if result.reachable:
+                tooltip = f"Reachable in {result.latency * 1000:.0f} ms"
+                if result.banner:
+                    tooltip += f"\n{result.banner}"
+            else:
+                tooltip = f"Unreachable: {result.error}"
+        else:
+            if len(up) == len(targets):
+                status = 'reachability-up'
+            elif not up:
+                status = 'reachability-down' if len(known) == len(targets) else 'reachability-pending'
+            else:
+                status = 'reachability-partial'
+            tooltip = f"{len(up)} of {len(targets)} hosts reachable"
+
+        for css_class in STATUS_CLASSES:
+            if css_class != status:
+                dot.remove_css_class(css_class)
+        dot.add_css_class(status)
+        dot.set_tooltip_text(tooltip)
+        dot.set_visible(True)
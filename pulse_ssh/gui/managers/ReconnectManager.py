@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import GLib  # type: ignore
+from gi.repository import Gtk  # type: ignore
+from typing import Dict
+from typing import Optional
+import pulse_ssh.Globals as _globals
+import pulse_ssh.Reconnect as _reconnect
+import pulse_ssh.Utils as _utils
+import random
+
+class PendingReconnect:
+    def __init__(self, domain: Optional[str]):
+        self.domain = domain
+        self.source_id: Optional[int] = None
+
+class ReconnectManager:
+    """Restarts dropped sessions with per-terminal exponential backoff and a circuit breaker per jump host or subnet."""
+
+    def __init__(self, app_window):
+        self.app_window = app_window
+        self.breaker = _reconnect.CircuitBreaker()
+        self.pending: Dict[object, PendingReconnect] = {}
+        self.paused = False
+        self.indicator: Optional[Gtk.Revealer] = None
+
+    def start(self):
+        self.breaker.threshold = _globals.app_config.reconnect_breaker_threshold
+        self.breaker.cooldown = _globals.app_config.reconnect_breaker_cooldown
+
+    def build_indicator(self) -> Gtk.Widget:
+        self.indicator_label = Gtk.Label()
+
+        self.pause_btn = Gtk.Button(label="Pause")
+        self.pause_btn.set_tooltip_text("Hold all pending reconnects")
+        self.pause_btn.connect("clicked", lambda b: self.pause())
+
+        resume_btn = Gtk.Button(label="Resume All")
+        resume_btn.set_tooltip_text("Reconnect every waiting session now")
+        resume_btn.connect("clicked", lambda b: self.resume_all())
+
+        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        box.add_css_class("toolbar")
+        box.add_css_class("toolbar_with_bg")
+        box.append(Gtk.Image.new_from_icon_name("view-refresh-symbolic"))
+        box.append(self.indicator_label)
+        box.append(self.pause_btn)
+        box.append(resume_btn)
+
+        self.indicator = Gtk.Revealer(transition_type=Gtk.RevealerTransitionType.SLIDE_LEFT)
+        self.indicator.set_child(box)
+        return self.indicator
+
+    def schedule(self, terminal) -> bool:
+        """Queues a reconnect for a terminal whose session just ended; returns False once it ran out of attempts."""
+        config = _globals.app_config
+        domain = _utils.get_failure_domain(terminal.pulse_conn)
+        session_length = (GLib.get_monotonic_time() - terminal.connect_time) / 1_000_000
+        if session_length >= config.reconnect_stable_seconds:
+            terminal.reconnect_attempts = 0
+        else:
+            self.breaker.record_failure(domain)
+
+        if terminal.reconnect_attempts >= config.reconnect_max_attempts:
+            terminal.reconnect_attempts = 0
+            return False
+
+        delay = _reconnect.backoff_delay(terminal.reconnect_attempts, config.reconnect_initial_delay, config.reconnect_max_delay)
+        terminal.reconnect_attempts += 1
+
+        message = f"\r\n{_utils.color_iyellow} --- Reconnecting in {delay:.1f}s (attempt {terminal.reconnect_attempts} of {config.reconnect_max_attempts}).{_utils.color_reset}"
+        if self.breaker.is_open(domain):
+            message += f"\r\n{_utils.color_iyellow} --- Too many failures for {domain}; retrying one session at a time.{_utils.color_reset}"
+        terminal.feed(f"{message}\r\n".encode('utf-8'))
+
+        self.cancel(terminal)
+        self.pending[terminal] = PendingReconnect(domain)
+        self._arm(terminal, delay)
+        self._update_indicator()
+        return True
+
+    def cancel(self, terminal):
+        entry = self.pending.pop(terminal, None)
+        if entry is None:
+            return
+        if entry.source_id:
+            GLib.source_remove(entry.source_id)
+        self._update_indicator()
+
+    def pause(self):
+        self.paused = True
+        self._update_indicator()
+
+    def resume_all(self):
+        """Lifts a pause and reconnects every waiting session right away, still paced by the admission queue."""
+        self.paused = False
+        for terminal in list(self.pending):
+            terminal.reconnect_attempts = 0
+            self._fire(terminal)
+        self._update_indicator()
+
+    def _arm(self, terminal, delay: float):
+        self.pending[terminal].source_id = GLib.timeout_add(max(1, int(delay * 1000)), self._on_due, terminal)
+
+    def _on_due(self, terminal):
+        entry = self.pending.get(terminal)
+        if entry is None:
+            return GLib.SOURCE_REMOVE
+        entry.source_id = None
+        if self.paused:
+            return GLib.SOURCE_REMOVE
+
+        wait = self.breaker.acquire(entry.domain)
+        if wait > 0:
+            self._arm(terminal, wait + random.uniform(0, min(wait, 5.0)))
+        else:
+            self._fire(terminal)
+        return GLib.SOURCE_REMOVE
+
+    def _fire(self, terminal):
+        entry = self.pending.pop(terminal, None)
+        if entry and entry.source_id:
+            GLib.source_remove(entry.source_id)
+        self._update_indicator()
+        if terminal.connected or not terminal.get_root():
+            return
+
+        terminal.respawn()
+        GLib.timeout_add_seconds(max(1, _globals.app_config.reconnect_stable_seconds), self._on_stable, terminal, terminal.connect_time)
+
+    def _on_stable(self, terminal, connect_time):
+        if terminal.connected and terminal.connect_time == connect_time:
+            terminal.reconnect_attempts = 0
+            self.breaker.record_success(_utils.get_failure_domain(terminal.pulse_conn))
+        return GLib.SOURCE_REMOVE
+
+    def _update_indicator(self):
+        if not self.indicator:
+            return
+        count = len(self.pending)
+        noun = "session" if count == 1 else "sessions"
+        self.indicator_label.set_text(f"{count} {noun} paused" if self.paused else f"{count} {noun} reconnecting")
+        open_domains = self.breaker.get_open_domains()
+        self.indicator_label.set_tooltip_text(f"Waiting out failures on: {', '.join(open_domains)}" if open_domains else None)
+        self.pause_btn.set_sensitive(not self.paused)
+        self.indicator.set_reveal_child(count > 0)
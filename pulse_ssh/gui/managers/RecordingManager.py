@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import Adw  # type: ignore
+from gi.repository import GLib  # type: ignore
+from gi.repository import Vte  # type: ignore
+from typing import Optional
+import os
+import pulse_ssh.Asciicast as _asciicast
+import pulse_ssh.Globals as _globals
+import pulse_ssh.gui.Globals as _gui_globals
+import pulse_ssh.SessionLog as _session_log
+import time
+import weakref
+
+FRAME_INTERVAL_MS = 40
+
+class Recording:
+    def __init__(self, automatic: bool):
+        self.automatic = automatic
+        self.started = time.monotonic()
+        self.diff = _asciicast.ScreenDiff()
+        self.size = (0, 0)
+        self.keyframe_at = 0.0
+        self.handler_id: Optional[int] = None
+        self.source_id: Optional[int] = None
+
+class RecordingManager:
+    """Writes asciicast v2 recordings of terminals, one screen frame per burst of output at most every FRAME_INTERVAL_MS."""
+
+    def __init__(self, app_window):
+        self.app_window = app_window
+        self.writer = _session_log.SessionLogWriter(self._on_error)
+        self.recordings = weakref.WeakKeyDictionary()
+
+    def start(self):
+        for notebook in _gui_globals.all_notebooks:
+            for terminal in self.app_window._find_all_terminals_in_widget(notebook):
+                recording = self.recordings.get(terminal)
+                if _globals.app_config.session_record_enabled:
+                    self.watch(terminal)
+                elif recording and recording.automatic:
+                    self.stop_recording(terminal)
+
+    def stop(self):
+        for terminal in list(self.recordings):
+            self.stop_recording(terminal)
+        self.writer.shutdown()
+
+    def watch(self, terminal):
+        if _globals.app_config.session_record_enabled:
+            self.record(terminal, automatic=True)
+
+    def is_recording(self, terminal) -> bool:
+        return terminal in self.recordings
+
+    def toggle(self, action, param, terminal):
+        if self.is_recording(terminal):
+            self.stop_recording(terminal)
+        else:
+            self.record(terminal)
+
+    def record(self, terminal, automatic: bool = False):
+        if terminal.is_replay or terminal.closed or terminal in self.recordings:
+            return
+
+        config = _globals.app_config
+        spec = _session_log.LogSpec(
+            config.session_log_dir or _session_log.get_default_log_dir(),
+            terminal.pulse_conn.name,
+            'none', 0, 0,
+            _asciicast.EXTENSION
+        )
+        self.writer.open(terminal.terminal_id, spec)
+        env = {"TERM": "xterm-256color", "SHELL": os.environ.get('SHELL', config.shell_program)}
+        header = _asciicast.encode_header(terminal.get_column_count(), terminal.get_row_count(), int(time.time()), terminal.pulse_conn.name, env)
+        self.writer.write(terminal.terminal_id, header)
+
+        recording = Recording(automatic)
+        recording.size = (terminal.get_column_count(), terminal.get_row_count())
+        recording.handler_id = terminal.connect("contents-changed", self.on_contents_changed)
+        self.recordings[terminal] = recording
+        self.capture(terminal, keyframe=True)
+
+    def stop_recording(self, terminal):
+        recording = self.recordings.pop(terminal, None)
+        if not recording:
+            return
+        terminal.disconnect(recording.handler_id)
+        if recording.source_id:
+            GLib.source_remove(recording.source_id)
+        self.writer.close(terminal.terminal_id)
+
+    def release(self, terminal):
+        recording = self.recordings.get(terminal)
+        if recording and recording.source_id:
+            GLib.source_remove(recording.source_id)
+            recording.source_id = None
+            self.capture(terminal)
+        self.stop_recording(terminal)
+
+    def on_contents_changed(self, terminal):
+        recording = self.recordings.get(terminal)
+        if recording and not recording.source_id:
+            recording.source_id = GLib.timeout_add(FRAME_INTERVAL_MS, self._on_frame_due, terminal)
+
+    def _on_frame_due(self, terminal):
+        recording = self.recordings.get(terminal)
+        if recording:
+            recording.source_id = None
+            self.capture(terminal)
+        return GLib.SOURCE_REMOVE
+
+    def capture(self, terminal, keyframe: bool = False):
+        """Diffs the visible screen against the last frame; a resize or KEYFRAME_INTERVAL_SECONDS without one forces a full repaint."""
+        recording = self.recordings[terminal]
+        elapsed = time.monotonic() - recording.started
+        columns, rows = terminal.get_column_count(), terminal.get_row_count()
+
+        if (columns, rows) != recording.size:
+            recording.size = (columns, rows)
+            self.writer.write(terminal.terminal_id, _asciicast.encode_event(elapsed, "r", f"{columns}x{rows}"))
+            keyframe = True
+
+        adjustment = terminal.get_vadjustment()
+        top = max(int(adjustment.get_lower()), int(adjustment.get_upper()) - rows) if adjustment else 0
+        text, _ = terminal.get_text_range_format(Vte.Format.TEXT, top, 0, top + rows - 1, columns)
+        screen = _asciicast.split_rows(text or "", columns, rows)
+        col, row = terminal.get_cursor_position()
+
+        if keyframe or elapsed - recording.keyframe_at >= _asciicast.KEYFRAME_INTERVAL_SECONDS:
+            data = recording.diff.keyframe(screen, top, (row - top, col))
+            recording.keyframe_at = elapsed
+        else:
+            data = recording.diff.frame(screen, top, (row - top, col))
+        if data:
+            self.writer.write(terminal.terminal_id, _asciicast.encode_event(elapsed, "o", data))
+
+    def _on_error(self, key: str, message: str):
+        GLib.idle_add(self._show_error, message)
+
+    def _show_error(self, message: str):
+        self.app_window.toast_overlay.add_toast(Adw.Toast.new(GLib.markup_escape_text(f"Recording stopped: {message}")))
+        return GLib.SOURCE_REMOVE
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import GLib  # type: ignore
+from gi.repository import Gtk  # type: ignore
+from typing import Dict
+from typing import List
+from typing import Optional
+import pulse_ssh.data.Connection as _connection
+import pulse_ssh.Globals as _globals
+import pulse_ssh.Resolver as _resolver
+import threading
+
+RESOLVED_TYPES = ('ssh', 'mosh', 'sftp', 'ftp')
+PREFETCH_LIMIT = 500
+
+class ResolverManager:
+    def __init__(self, app_window):
+        self.app_window = app_window
+        self.widgets: Dict[Gtk.Widget, str] = {}
+        self.host_widgets: Dict[str, set] = {}
+        self.updated_hosts = set()
+        self.updated_lock = threading.Lock()
+        self.flush_scheduled = False
+
+    def start(self):
+        _globals.resolver.on_resolved = self._on_resolved
+        _globals.resolver.default_ttl = _globals.app_config.dns_cache_ttl
+        if not _globals.app_config.dns_cache_enabled:
+            _globals.resolver.clear()
+        for widget in self.widgets:
+            self._update_widget(widget)
+
+    def get_host(self, conn: _connection.Connection) -> Optional[str]:
+        """Returns the name resolved locally for a connection; hosts behind a jump host are resolved by the jump host."""
+        if conn.type not in RESOLVED_TYPES or not conn.host or _resolver.is_ip_address(conn.host):
+            return None
+        if conn.ssh_proxy_jump and conn.type != 'ftp':
+            return None
+        return conn.host
+
+    def prefetch_connections(self, connections: List[_connection.Connection]):
+        if not _globals.app_config.dns_cache_enabled:
+            return
+        hosts = [host for host in (self.get_host(conn) for conn in connections) if host]
+        _globals.resolver.prefetch(hosts[:PREFETCH_LIMIT])
+
+    def watch(self, widget: Gtk.Widget, conn: _connection.Connection):
+        self.unwatch(widget)
+        host = self.get_host(conn)
+        if not host:
+            widget.set_tooltip_text(None)
+            return
+
+        self.widgets[widget] = host
+        self.host_widgets.setdefault(host, set()).add(widget)
+        self._update_widget(widget)
+
+    def unwatch(self, widget: Gtk.Widget):
+        host = self.widgets.pop(widget, None)
+        if host is None:
+            return
+        widgets = self.host_widgets.get(host)
+        if widgets:
+            widgets.discard(widget)
+            if not widgets:
+                del self.host_widgets[host]
+
+    def _on_resolved(self, host, entry):
+        with self.updated_lock:
+            self.updated_hosts.add(host)
+            if self.flush_scheduled:
+                return
+            self.flush_scheduled = True
+        GLib.idle_add(self._flush)
+
+    def _flush(self):
+        with self.updated_lock:
+            hosts = self.updated_hosts
+            self.updated_hosts = set()
+            self.flush_scheduled = False
+
+        for host in hosts:
+            for widget in self.host_widgets.get(host, ()):
+                self._update_widget(widget)
+        return GLib.SOURCE_REMOVE
+
+    def _update_widget(self, widget: Gtk.Widget):
+        host = self.widgets.get(widget)
+        entry = _globals.resolver.lookup(host) if host and _globals.app_config.dns_cache_enabled else None
+        if not entry:
+            widget.set_tooltip_text(None)
+        elif entry.address:
+            widget.set_tooltip_text(f"{host} → {entry.address} (resolved in {entry.latency * 1000:.0f} ms)")
+        else:
+            widget.set_tooltip_text(f"{host} did not resolve: {entry.error}")
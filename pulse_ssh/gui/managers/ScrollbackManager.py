@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import GLib  # type: ignore
+from gi.repository import Vte  # type: ignore
+from typing import List
+from typing import Optional
+import pulse_ssh.data.ScrollbackUsage as _scrollback_usage
+import pulse_ssh.Globals as _globals
+import pulse_ssh.gui.Globals as _gui_globals
+import pulse_ssh.Scrollback as _scrollback
+import time
+
+CHECK_INTERVAL_SECONDS = 10
+
+class ScrollbackManager:
+    """Keeps the estimated scrollback of all terminals under a global budget by trimming hidden and disconnected ones."""
+
+    def __init__(self, app_window):
+        self.app_window = app_window
+        self.source_id: Optional[int] = None
+        self.spill_writer = _scrollback.SpillWriter()
+
+    def start(self):
+        if self.source_id:
+            GLib.source_remove(self.source_id)
+            self.source_id = None
+        if _globals.app_config.scrollback_budget_mb > 0:
+            self.source_id = GLib.timeout_add_seconds(CHECK_INTERVAL_SECONDS, self._on_tick)
+        self.enforce()
+
+    def get_terminals(self) -> list:
+        terminals = []
+        for notebook in _gui_globals.all_notebooks:
+            terminals.extend(self.app_window._find_all_terminals_in_widget(notebook))
+        return terminals
+
+    def get_usage(self, terminal) -> _scrollback_usage.ScrollbackUsage:
+        adjustment = terminal.get_vadjustment()
+        rows = int(adjustment.get_upper() - adjustment.get_lower()) - terminal.get_row_count() if adjustment else 0
+        return _scrollback_usage.ScrollbackUsage(
+            terminal.terminal_id,
+            terminal.pulse_conn.name,
+            max(0, rows),
+            terminal.get_column_count(),
+            terminal.scrollback_limit,
+            terminal.connected,
+            terminal.get_mapped(),
+            terminal.hidden_since,
+            terminal.spilled_lines
+        )
+
+    def get_usages(self) -> List[_scrollback_usage.ScrollbackUsage]:
+        return [self.get_usage(terminal) for terminal in self.get_terminals()]
+
+    def enforce(self):
+        config = _globals.app_config
+        terminals = {terminal.terminal_id: terminal for terminal in self.get_terminals()}
+        usages = [self.get_usage(terminal) for terminal in terminals.values()]
+        limits = _scrollback.plan_limits(usages, config.scrollback_lines, config.scrollback_budget_mb * 1024 * 1024, config.scrollback_min_lines, time.monotonic())
+        for usage in usages:
+            if limits[usage.key] != usage.limit:
+                self.set_limit(terminals[usage.key], usage, limits[usage.key])
+
+    def set_limit(self, terminal, usage: _scrollback_usage.ScrollbackUsage, limit: int):
+        trimmed = usage.rows - limit if limit >= 0 else 0
+        if trimmed > 0 and _globals.app_config.scrollback_spill:
+            first_row = int(terminal.get_vadjustment().get_lower())
+            text, _ = terminal.get_text_range_format(Vte.Format.TEXT, first_row, 0, first_row + trimmed - 1, usage.columns)
+            if text:
+                self.spill_writer.append(terminal.terminal_id, text)
+                terminal.spilled_lines += trimmed
+
+        terminal.scrollback_limit = limit
+        terminal.set_scrollback_lines(limit)
+
+    def get_spill_path(self, terminal_id: str) -> str:
+        return self.spill_writer.get_path(terminal_id)
+
+    def release(self, terminal):
+        if terminal.spilled_lines:
+            self.spill_writer.discard(terminal.terminal_id)
+            terminal.spilled_lines = 0
+
+    def _on_tick(self):
+        self.enforce()
+        return GLib.SOURCE_CONTINUE
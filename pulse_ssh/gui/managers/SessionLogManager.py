@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from gi.repository import Adw  # type: ignore
+from gi.repository import GLib  # type: ignore
+from gi.repository import Vte  # type: ignore
+import pulse_ssh.Globals as _globals
+import pulse_ssh.gui.Globals as _gui_globals
+import pulse_ssh.SessionLog as _session_log
+import weakref
+
+CAPTURE_INTERVAL_MS = 100
+
+class SessionLogManager:
+    """Copies each logged terminal's finished lines to the background log writer, at most once every CAPTURE_INTERVAL_MS."""
+
+    def __init__(self, app_window):
+        self.app_window = app_window
+        self.writer = _session_log.SessionLogWriter(self._on_error)
+        # Weak keys: closing a tab must not be held up by its log.
+        self.terminals = weakref.WeakKeyDictionary()
+        self.pending = weakref.WeakKeyDictionary()
+
+    def start(self):
+        for notebook in _gui_globals.all_notebooks:
+            for terminal in self.app_window._find_all_terminals_in_widget(notebook):
+                if self.is_logged(terminal):
+                    self.watch(terminal)
+                else:
+                    self.unwatch(terminal)
+
+    def stop(self):
+        for terminal in list(self.terminals):
+            self.unwatch(terminal)
+        self.writer.shutdown()
+
+    def is_logged(self, terminal) -> bool:
+        return not terminal.is_replay and (_globals.app_config.session_log_enabled or terminal.pulse_conn.session_log)
+
+    def watch(self, terminal):
+        if terminal in self.terminals or terminal.closed or not self.is_logged(terminal):
+            return
+
+        config = _globals.app_config
+        spec = _session_log.LogSpec(
+            config.session_log_dir or _session_log.get_default_log_dir(),
+            terminal.pulse_conn.name,
+            config.session_log_compression,
+            config.session_log_max_mb * 1024 * 1024,
+            config.session_log_max_age_hours * 3600
+        )
+        self.writer.open(terminal.terminal_id, spec)
+        timestamp = GLib.DateTime.new_now_local().format("%Y-%m-%d %H:%M:%S")
+        self.writer.write(terminal.terminal_id, f"--- Session log for '{terminal.pulse_conn.name}' started at {timestamp}\n")
+
+        terminal.log_row = 0
+        self.terminals[terminal] = terminal.connect("contents-changed", self.on_contents_changed)
+
+    def unwatch(self, terminal):
+        handler_id = self.terminals.pop(terminal, None)
+        if handler_id is None:
+            return
+        terminal.disconnect(handler_id)
+        source_id = self.pending.pop(terminal, None)
+        if source_id:
+            GLib.source_remove(source_id)
+        self.capture(terminal, include_cursor_row=True)
+        self.writer.close(terminal.terminal_id)
+
+    def on_contents_changed(self, terminal):
+        if terminal not in self.pending:
+            self.pending[terminal] = GLib.timeout_add(CAPTURE_INTERVAL_MS, self._on_capture_due, terminal)
+
+    def _on_capture_due(self, terminal):
+        if self.pending.pop(terminal, None):
+            self.capture(terminal)
+        return GLib.SOURCE_REMOVE
+
+    def capture(self, terminal, include_cursor_row: bool = False):
+        """Sends the rows between the last captured one and the cursor; the cursor row is still being written, so it waits."""
+        col, row = terminal.get_cursor_position()
+        if row < terminal.log_row:
+            terminal.log_row = row
+        end_row = row + 1 if include_cursor_row else row
+        if end_row <= terminal.log_row:
+            return
+
+        adjustment = terminal.get_vadjustment()
+        first_row = max(terminal.log_row, int(adjustment.get_lower()) if adjustment else 0)
+        text, _ = terminal.get_text_range_format(Vte.Format.TEXT, first_row, 0, end_row, 0)
+        terminal.log_row = end_row
+        if text:
+            self.writer.write(terminal.terminal_id, text if text.endswith("\n") else f"{text}\n")
+
+    def _on_error(self, key: str, message: str):
+        GLib.idle_add(self._show_error, message)
+
+    def _show_error(self, message: str):
+        self.app_window.toast_overlay.add_toast(Adw.Toast.new(GLib.markup_escape_text(f"Session logging stopped: {message}")))
+        return GLib.SOURCE_REMOVE
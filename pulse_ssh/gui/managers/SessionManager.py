@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+import gi
+gi.require_version('Adw', '1')
+gi.require_version('Gdk', '4.0')
+gi.require_version('Gtk', '4.0')
+gi.require_version('Vte', '3.91')
+
+from dataclasses import replace
+from gi.repository import Adw  # type: ignore
+from gi.repository import Gtk  # type: ignore
+from typing import Dict
+from typing import List
+from typing import Optional
+import pulse_ssh.data.LayoutNode as _layout_node
+import pulse_ssh.data.SessionTab as _session_tab
+import pulse_ssh.Globals as _globals
+import pulse_ssh.gui.Globals as _gui_globals
+import pulse_ssh.Layout as _layout
+
+class SessionManager:
+    def __init__(self, app_window):
+        self.app_window = app_window
+        self.restoring = False
+
+    def capture(self) -> tuple[List[_session_tab.SessionTab], int]:
+        """Returns the tabs of every window, in order, and the index of the main window's selected tab."""
+        tabs = []
+        selected = 0
+        for notebook in _gui_globals.all_notebooks:
+            selected_page = notebook.get_selected_page()
+            for i in range(notebook.get_n_pages()):
+                page = notebook.get_nth_page(i)
+                node = getattr(page, 'pending_layout', None) or _gui_globals.layout_manager.get_page_layout(page)
+                if not node:
+                    continue
+                if notebook == _gui_globals.all_notebooks[0] and page == selected_page:
+                    selected = len(tabs)
+                tabs.append(_session_tab.SessionTab(_layout.layout_to_dict(node), getattr(page, 'custom_title', None)))
+        return (tabs, selected)
+
+    def save(self):
+        if _globals.app_config.restore_session:
+            _gui_globals.cache_config.session_tabs, _gui_globals.cache_config.session_selected = self.capture()
+        else:
+            _gui_globals.cache_config.session_tabs, _gui_globals.cache_config.session_selected = [], 0
+
+    def restore(self):
+        """Reopens the saved tabs as placeholders; only the selected one connects right away."""
+        if not _globals.app_config.restore_session or not _gui_globals.cache_config.session_tabs:
+            return
+
+        nodes = [(tab, _layout.layout_from_dict(tab.layout)) for tab in _gui_globals.cache_config.session_tabs]
+        if any(leaf.conn_uuid not in _globals.connections for _, node in nodes if node for leaf in _layout.iter_leaves(node)):
+            self.app_window.load_all_config_shards()
+
+        notebook = _gui_globals.all_notebooks[0]
+        pages = []
+        self.restoring = True
+        try:
+            for tab, node in nodes:
+                node = _layout.normalize(self.drop_missing(node)) if node else None
+                if not node:
+                    continue
+                status_page = Adw.StatusPage(icon_name="network-offline-symbolic", title="Not Connected Yet", description="This tab connects when it is shown.")
+                boxy = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+                boxy.append(status_page)
+                page = notebook.append(boxy)
+                page.pending_layout = node
+                page.custom_title = tab.custom_title
+                self.app_window.updatePageTitle(page)
+                pages.append(page)
+        finally:
+            self.restoring = False
+
+        if not pages:
+            return
+        selected_page = pages[min(max(0, _gui_globals.cache_config.session_selected), len(pages) - 1)]
+        notebook.set_selected_page(selected_page)
+        self.materialize(selected_page)
+
+    def drop_missing(self, node: _layout_node.LayoutNode) -> Optional[_layout_node.LayoutNode]:
+        if node.is_leaf():
+            return node if node.conn_uuid in _globals.connections else None
+        return replace(node, children=[child for child in (self.drop_missing(child) for child in node.children) if child])
+
+    def materialize(self, page):
+        """Spawns the terminals of a restored tab the first time it is selected."""
+        node = getattr(page, 'pending_layout', None)
+        if self.restoring or not node:
+            return
+        page.pending_layout = None
+        node = _layout.normalize(self.drop_missing(node))
+
+        panes: Dict[str, Gtk.Widget] = {}
+        def _assign_terminals(current: _layout_node.LayoutNode) -> _layout_node.LayoutNode:
+            if not current.is_leaf():
+                return replace(current, children=[_assign_terminals(child) for child in current.children])
+            scrolled = _gui_globals.layout_manager.create_terminal(_globals.connections[current.conn_uuid], current.cluster_id, current.cluster_name)
+            terminal_id = scrolled.get_child().terminal_id
+            panes[terminal_id] = scrolled
+            return replace(current, terminal_id=terminal_id)
+
+        _gui_globals.layout_manager.apply_layout(page, _assign_terminals(node) if node else None, panes)
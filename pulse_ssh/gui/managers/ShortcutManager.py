@@ -200,7 +200,7 @@ class ShortcutManager:
     def _on_edit_shortcut(self, window, *args):
         focused_widget = window.get_focus()
 
-        if isinstance(focused_widget, _vte_terminal.VteTerminal) and hasattr(focused_widget, 'pulse_conn'):
+        if isinstance(focused_widget, _vte_terminal.VteTerminal) and hasattr(focused_widget, 'pulse_conn') and not focused_widget.is_replay:
             connection = focused_widget.pulse_conn
             if connection:
                 self.app_window.connections_view.open_edit_modal(None, None, connection)
@@ -214,7 +214,7 @@ class ShortcutManager:
 
     def _on_duplicate_shortcut(self, widget, *args):
         focused_widget = widget.get_focus()
-        if isinstance(focused_widget, _vte_terminal.VteTerminal) and hasattr(focused_widget, 'pulse_conn'):
+        if isinstance(focused_widget, _vte_terminal.VteTerminal) and hasattr(focused_widget, 'pulse_conn') and not focused_widget.is_replay:
             _gui_globals.layout_manager.open_connection_tab(focused_widget.pulse_conn)
         return True
 
@@ -17,6 +17,7 @@ import pulse_ssh.gui.dialogs.AppConfigDialog as _app_config_dialog
 import pulse_ssh.gui.dialogs.ClusterDialog as _cluster_dialog
 import pulse_ssh.gui.Globals as _gui_globals
 import pulse_ssh.gui.views.list_items.ClusterListItem as _cluster_list_item
+import pulse_ssh.Reachability as _reachability
 import pulse_ssh.Utils as _utils
 
 class ClustersView():
@@ -25,20 +26,39 @@ class ClustersView():
         self.app_window = app_window
 
     def setup_list_item(self, factory, list_item):
-        label = Gtk.Label(xalign=0)
+        label = Gtk.Label(xalign=0, hexpand=True)
         label.set_use_markup(True)
 
         click_gesture = Gtk.GestureClick(button=Gdk.BUTTON_SECONDARY)
         click_gesture.connect("pressed", self.build_menu, list_item)
         label.add_controller(click_gesture)
 
-        list_item.set_child(label)
+        status_dot = Gtk.Label(label="●", visible=False)
+        status_dot.add_css_class("status-dot")
+
+        row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        row_box.append(label)
+        row_box.append(status_dot)
+
+        list_item.set_child(row_box)
 
     def bind_list_item(self, factory, list_item):
-        label = list_item.get_child()
+        label = list_item.get_child().get_first_child()
         item = list_item.get_item()
         label.set_markup(f'<span font_desc="Monospace" weight="bold">»</span> {item.name}')
 
+        conns = [_globals.connections[uuid] for uuid in item.cluster_data.connection_uuids if uuid in _globals.connections]
+        _gui_globals.reachability_manager.watch(list_item.get_child().get_last_child(), conns, _reachability.PRIORITY_EXPANDED)
+
+    def selection_changed_callback(self, selection_model, position, n_items):
+        item = selection_model.get_selected_item()
+        if item:
+            conns = [_globals.connections[uuid] for uuid in item.cluster_data.connection_uuids if uuid in _globals.connections]
+            _gui_globals.resolver_manager.prefetch_connections(conns)
+
+    def unbind_list_item(self, factory, list_item):
+        _gui_globals.reachability_manager.unwatch(list_item.get_child().get_last_child())
+
     def get_adw_toolbar_view(self) -> Adw.ToolbarView:
         self.root_store = Gio.ListStore(item_type=_cluster_list_item.ClusterListItem)
 
@@ -49,6 +69,7 @@ class ClustersView():
         factory = Gtk.SignalListItemFactory()
         factory.connect("setup", self.setup_list_item)
         factory.connect("bind", self.bind_list_item)
+        factory.connect("unbind", self.unbind_list_item)
 
         self.filter_entry = Gtk.SearchEntry(placeholder_text="Filter clusters...")
         self.filter_entry.connect("search-changed", self.filter_changed_callback)
@@ -58,6 +79,7 @@ class ClustersView():
         self.filter = Gtk.CustomFilter.new(self.filter_list_function)
         filter_model = Gtk.FilterListModel(model=self.sorted_model, filter=self.filter)
         self.selection_model = Gtk.SingleSelection(model=filter_model)
+        self.selection_model.connect("selection-changed", self.selection_changed_callback)
 
         self.list_view = Gtk.ListView(model=self.selection_model, factory=factory)
         self.list_view.connect("activate", self.item_activated_callback)
@@ -227,6 +249,7 @@ class ClustersView():
         popover.popup()
 
     def open_add_modal(self, button):
+        self.app_window.load_all_config_shards()
         dlg = _cluster_dialog.ClusterDialog(self.app_window, _globals.connections)
         dlg.connect("response", self.add_callback)
         dlg.present()
@@ -252,6 +275,7 @@ class ClustersView():
         self.open_edit_modal(None, None, cluster_to_edit)
 
     def open_edit_modal(self, action, param, cluster_to_edit: _cluster.Cluster):
+        self.app_window.load_all_config_shards()
         dlg = _cluster_dialog.ClusterDialog(self.app_window, _globals.connections, cluster_to_edit)
         dlg.connect("response", self.edit_callback)
         dlg.present()
@@ -298,6 +322,15 @@ class ClustersView():
             for notebook in _gui_globals.all_notebooks:
                 for terminal in self.app_window._find_all_terminals_in_widget(notebook):
                     terminal.apply_theme()
+            _gui_globals.inventory_manager.start()
+            _gui_globals.reachability_manager.start()
+            _gui_globals.resolver_manager.start()
+            _gui_globals.prewarm_manager.start()
+            _gui_globals.reconnect_manager.start()
+            _gui_globals.scrollback_manager.start()
+            _gui_globals.activity_manager.start()
+            _gui_globals.session_log_manager.start()
+            _gui_globals.recording_manager.start()
 
         if response_id == Gtk.ResponseType.OK or response_id == Gtk.ResponseType.CANCEL:
             dialog.destroy()
@@ -313,6 +346,8 @@ class ClustersView():
         self.open_cluster_in_tab(None, None, cluster)
 
     def open_cluster_in_tab(self, action, param, cluster: _cluster.Cluster):
+        if any(uuid not in _globals.connections for uuid in cluster.connection_uuids):
+            self.app_window.load_all_config_shards()
         conns_to_start = [_globals.connections[uuid] for uuid in cluster.connection_uuids if uuid in _globals.connections]
 
         if not conns_to_start:
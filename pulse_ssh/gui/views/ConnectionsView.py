@@ -13,12 +13,17 @@ from gi.repository import GLib  # type: ignore
 from gi.repository import GObject  # type: ignore
 from gi.repository import Gtk  # type: ignore
 from typing import List
+import os
+import pulse_ssh.Asciicast as _asciicast
 import pulse_ssh.data.Connection as _connection
 import pulse_ssh.Globals as _globals
+import pulse_ssh.gui.dialogs.AdmissionDialog as _admission_dialog
 import pulse_ssh.gui.dialogs.AppConfigDialog as _app_config_dialog
 import pulse_ssh.gui.dialogs.ConnectionDialog as _connection_dialog
+import pulse_ssh.gui.dialogs.ScrollbackDialog as _scrollback_dialog
 import pulse_ssh.gui.Globals as _gui_globals
 import pulse_ssh.gui.views.list_items.ConnectionListItem as _connection_list_item
+import pulse_ssh.SessionLog as _session_log
 import pulse_ssh.Utils as _utils
 
 class ConnectionsView():
@@ -27,11 +32,18 @@ class ConnectionsView():
         self.app_window = app_window
 
     def setup_list_item(self, factory, list_item):
-        label = Gtk.Label(xalign=0)
+        label = Gtk.Label(xalign=0, hexpand=True)
         label.set_use_markup(True)
 
+        status_dot = Gtk.Label(label="●", visible=False)
+        status_dot.add_css_class("status-dot")
+
+        row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        row_box.append(label)
+        row_box.append(status_dot)
+
         expander = Gtk.TreeExpander()
-        expander.set_child(label)
+        expander.set_child(row_box)
         list_item.set_child(expander)
 
         click_gesture = Gtk.GestureClick()
@@ -40,6 +52,11 @@ class ConnectionsView():
         click_gesture.connect("pressed", self.build_menu, list_item)
         expander.add_controller(click_gesture)
 
+        motion_controller = Gtk.EventControllerMotion()
+        motion_controller.connect("enter", self.row_entered_callback, list_item)
+        motion_controller.connect("leave", lambda controller: _gui_globals.prewarm_manager.cancel())
+        expander.add_controller(motion_controller)
+
     def create_submodel(self, item: _connection_list_item.ConnectionListItem):
         if item.is_folder:
             expression = Gtk.PropertyExpression.new(_connection_list_item.ConnectionListItem, None, "sort_key")
@@ -52,7 +69,8 @@ class ConnectionsView():
         tree_row = list_item.get_item()
         item = tree_row.get_item()
 
-        label = expander.get_child()
+        label = expander.get_child().get_first_child()
+        status_dot = expander.get_child().get_last_child()
 
         if item.type:
             label.set_markup(f'<span font_desc="Monospace" size="x-small" weight="bold">{item.type.upper()}://</span>{item.name}')
@@ -69,6 +87,17 @@ class ConnectionsView():
             expander.add_css_class("connection-item-folder")
         expander.set_list_row(tree_row)
 
+        conn = _globals.connections.get(item.conn_uuid) if item.conn_uuid else None
+        if conn:
+            _gui_globals.reachability_manager.watch(status_dot, [conn])
+            _gui_globals.resolver_manager.watch(label, conn)
+        else:
+            status_dot.set_visible(False)
+            label.set_tooltip_text(None)
+
+        if item.is_folder:
+            list_item.expanded_handler_id = tree_row.connect("notify::expanded", self.folder_expanded_callback)
+
         drag_source = Gtk.DragSource()
         drag_source.set_actions(Gdk.DragAction.MOVE)
         expander.add_controller(drag_source)
@@ -80,6 +109,61 @@ class ConnectionsView():
 
         drop_target.connect("drop", lambda target, value, x, y: self.item_dropped_callback(target, value, x, y, list_item))
 
+    def unbind_list_item(self, factory, list_item):
+        _gui_globals.reachability_manager.unwatch(list_item.get_child().get_child().get_last_child())
+        _gui_globals.resolver_manager.unwatch(list_item.get_child().get_child().get_first_child())
+
+        handler_id = getattr(list_item, 'expanded_handler_id', None)
+        if handler_id:
+            list_item.get_item().disconnect(handler_id)
+            list_item.expanded_handler_id = None
+
+    def collect_connections(self, item) -> List[_connection.Connection]:
+        if item.conn_uuid:
+            conn = _globals.connections.get(item.conn_uuid)
+            return [conn] if conn else []
+        conns = []
+        for i in range(item.children_store.get_n_items()):
+            conns.extend(self.collect_connections(item.children_store.get_item(i)))
+        return conns
+
+    def row_entered_callback(self, controller, x, y, list_item):
+        tree_row = list_item.get_item()
+        conn_uuid = tree_row.get_item().conn_uuid if tree_row else None
+        if conn_uuid in _globals.connections:
+            _gui_globals.prewarm_manager.schedule(_globals.connections[conn_uuid])
+
+    def selection_changed_callback(self, selection_model, position, n_items):
+        conns = []
+        selection_bitset = selection_model.get_selection()
+        for i in range(selection_bitset.get_size()):
+            tree_row = self.filter_model.get_item(selection_bitset.get_nth(i))
+            if tree_row:
+                conns.extend(self.collect_connections(tree_row.get_item()))
+        _gui_globals.resolver_manager.prefetch_connections(conns)
+        if selection_bitset.get_size() == 1 and len(conns) == 1:
+            _gui_globals.prewarm_manager.schedule(conns[0])
+
+    def folder_expanded_callback(self, tree_row, pspec):
+        if not tree_row.get_expanded():
+            return
+
+        if tree_row.get_depth() == 0:
+            self.load_config_shards([tree_row.get_item().name])
+
+        store = tree_row.get_item().children_store
+        children = [store.get_item(i) for i in range(store.get_n_items())]
+        _gui_globals.reachability_manager.probe_connections([_globals.connections[child.conn_uuid] for child in children if child.conn_uuid in _globals.connections])
+
+    def load_config_shards(self, keys=None):
+        return self.install_config_shards(_utils.read_config_shards(_globals.config_dir, keys))
+
+    def install_config_shards(self, shards):
+        added = _utils.install_config_shards(_globals.connections, shards)
+        for conn in added:
+            self.add_tree_entry(conn)
+        return added
+
     def get_adw_toolbar_view(self) -> Adw.ToolbarView:
         self.root_store = Gio.ListStore.new(_connection_list_item.ConnectionListItem)
 
@@ -90,13 +174,14 @@ class ConnectionsView():
         self.tree_store = Gtk.TreeListModel.new(
             root=self.sorted_root_model,
             passthrough=False,
-            autoexpand=True,
+            autoexpand=not _utils.has_unloaded_config_shards(),
             create_func=self.create_submodel
         )
 
         factory = Gtk.SignalListItemFactory()
         factory.connect("setup", self.setup_list_item)
         factory.connect("bind", self.bind_list_item)
+        factory.connect("unbind", self.unbind_list_item)
 
         self.filter_entry = Gtk.SearchEntry(placeholder_text="Filter connections...")
         self.filter_entry.connect("search-changed", self.filter_changed_callback)
@@ -106,6 +191,7 @@ class ConnectionsView():
         self.filter = Gtk.CustomFilter.new(self.filter_list_function)
         self.filter_model = Gtk.FilterListModel(model=self.tree_store, filter=self.filter)
         self.selection_model = Gtk.MultiSelection(model=self.filter_model)
+        self.selection_model.connect("selection-changed", self.selection_changed_callback)
 
         self.list_view = Gtk.ListView(model=self.selection_model, factory=factory)
         self.list_view.connect("activate", self.item_activated_callback)
@@ -140,6 +226,21 @@ class ConnectionsView():
         add_btn.connect("clicked", self.open_add_modal)
         bottom_bar.append(add_btn)
 
+        scrollback_btn = Gtk.Button(icon_name="utilities-system-monitor-symbolic")
+        scrollback_btn.set_tooltip_text("Scrollback Usage")
+        scrollback_btn.connect("clicked", self.open_scrollback_modal)
+        bottom_bar.append(scrollback_btn)
+
+        admission_btn = Gtk.Button(icon_name="network-transmit-receive-symbolic")
+        admission_btn.set_tooltip_text("Connection Pacing")
+        admission_btn.connect("clicked", self.open_admission_modal)
+        bottom_bar.append(admission_btn)
+
+        recording_btn = Gtk.Button(icon_name="media-playback-start-symbolic")
+        recording_btn.set_tooltip_text("Play Recording")
+        recording_btn.connect("clicked", self.open_recording_dialog)
+        bottom_bar.append(recording_btn)
+
         config_btn = Gtk.Button(icon_name="emblem-system-symbolic")
         config_btn.connect("clicked", self.open_appconfig_modal)
         bottom_bar.append(config_btn)
@@ -157,6 +258,10 @@ class ConnectionsView():
         for conn in _globals.connections.values():
             self.add_tree_entry(conn)
 
+        for key, shard in _globals.config_shards.items():
+            if key and not shard.loaded and not self.find_tree_entry(self.root_store, key, True)[0]:
+                self.root_store.append(_connection_list_item.ConnectionListItem(key, self.root_store, "", None))
+
         self.filter.changed(Gtk.FilterChange.DIFFERENT)
         GLib.idle_add(self.list_view.scroll_to, 0, Gtk.ListScrollFlags.NONE, None)
         return toolbar_view
@@ -267,11 +372,22 @@ class ConnectionsView():
                     tree_row.set_expanded(True)
 
         if self.filter:
+            if entry.get_text():
+                self.load_config_shards()
             self.filter.changed(Gtk.FilterChange.DIFFERENT)
             if entry.get_text():
                 _expand_all_folders()
+                self.prefetch_filter_results()
             GLib.idle_add(self.select_first_item)
 
+    def prefetch_filter_results(self):
+        conns = []
+        for i in range(self.filter_model.get_n_items()):
+            conn_uuid = self.filter_model.get_item(i).get_item().conn_uuid
+            if conn_uuid in _globals.connections:
+                conns.append(_globals.connections[conn_uuid])
+        _gui_globals.resolver_manager.prefetch_connections(conns)
+
     def select_first_item(self):
         self.selection_model.unselect_all()
         self.selection_model.select_item(0, True)
@@ -341,6 +457,13 @@ class ConnectionsView():
 
         selected_conns = []
 
+        selected_folders = []
+        for i in range(selection_bitset.get_size()):
+            tree_list_row = self.selection_model.get_model().get_item(selection_bitset.get_nth(i))
+            if tree_list_row and tree_list_row.get_depth() == 0 and tree_list_row.get_item().is_folder:
+                selected_folders.append(tree_list_row.get_item().name)
+        self.load_config_shards(selected_folders)
+
         def collect_connections_recursive(item):
             if item.conn_uuid:
                 if conn := _globals.connections.get(item.conn_uuid):
@@ -442,13 +565,16 @@ class ConnectionsView():
             if dragged_conn:
                 self.delete_tree_entry(dragged_conn)
                 dragged_conn.folder = target_folder if target_folder else ""
+                _utils.bump_connection_version(dragged_conn.uuid)
                 self.add_tree_entry(dragged_conn)
             else:
                 move_folder = uuid_str.split('/')[-1]
+                self.load_config_shards([_utils.config_shard_key(uuid_str)])
                 for conn in _globals.connections.values():
                     if conn.folder.startswith(uuid_str):
                         self.delete_tree_entry(conn)
                         conn.folder = (f"{target_folder if target_folder else ""}/{move_folder}").strip().strip('/').replace('//', '/')
+                        _utils.bump_connection_version(conn.uuid)
                         self.add_tree_entry(conn)
 
         _utils.save_app_config(_globals.config_dir, _globals.readonly, _globals.app_config, _globals.connections, _globals.clusters)
@@ -456,6 +582,7 @@ class ConnectionsView():
         return True
 
     def open_add_modal(self, button):
+        self.load_config_shards()
         dlg = _connection_dialog.ConnectionDialog(self.app_window)
         dlg.connect("response", self.add_callback)
         dlg.present()
@@ -483,6 +610,7 @@ class ConnectionsView():
             self.open_edit_modal(None, None, _globals.connections[node.conn_uuid])
 
     def open_edit_modal(self, action, param, conn_to_edit: _connection.Connection):
+        self.load_config_shards()
         dlg = _connection_dialog.ConnectionDialog(self.app_window, conn_to_edit)
         dlg.connect("response", self.edit_callback)
         dlg.present()
@@ -491,6 +619,7 @@ class ConnectionsView():
         if response_id == Gtk.ResponseType.OK:
             new_conn: _connection.Connection = dialog.get_data()
             self.delete_tree_entry(_globals.connections[new_conn.uuid])
+            _gui_globals.prewarm_manager.forget([_globals.connections[new_conn.uuid]])
             _globals.connections[new_conn.uuid] = new_conn
             _utils.save_app_config(_globals.config_dir, _globals.readonly, _globals.app_config, _globals.connections, _globals.clusters)
             self.add_tree_entry(new_conn)
@@ -513,6 +642,7 @@ class ConnectionsView():
                     if conn.uuid in _globals.connections:
                         self.delete_tree_entry(_globals.connections[conn.uuid])
                         del _globals.connections[conn.uuid]
+                _gui_globals.prewarm_manager.forget(conns)
                 _utils.save_app_config(_globals.config_dir, _globals.readonly, _globals.app_config, _globals.connections, _globals.clusters)
             dialog.destroy()
 
@@ -528,6 +658,39 @@ class ConnectionsView():
         dialog.connect("response", remove_callback, conn_to_remove)
         dialog.present()
 
+    def open_scrollback_modal(self, button):
+        _scrollback_dialog.ScrollbackDialog(self.app_window).present()
+
+    def open_admission_modal(self, button):
+        _admission_dialog.AdmissionDialog(self.app_window).present()
+
+    def open_recording_dialog(self, button):
+        cast_filter = Gtk.FileFilter()
+        cast_filter.set_name("Asciicast Recordings")
+        cast_filter.add_pattern(f"*{_asciicast.EXTENSION}")
+
+        file_dialog = Gtk.FileDialog.new()
+        file_dialog.set_title("Select Recording")
+        file_dialog.set_default_filter(cast_filter)
+
+        log_dir = os.path.expanduser(_globals.app_config.session_log_dir or _session_log.get_default_log_dir())
+        if os.path.isdir(log_dir):
+            file_dialog.set_initial_folder(Gio.File.new_for_path(log_dir))
+
+        file_dialog.open(self.app_window, None, self.on_recording_selected)
+
+    def on_recording_selected(self, dialog, result):
+        try:
+            file = dialog.open_finish(result)
+        except GLib.Error:
+            return
+        if not file:
+            return
+        try:
+            _gui_globals.layout_manager.open_recording_tab(file.get_path())
+        except (OSError, ValueError) as e:
+            self.app_window.toast_overlay.add_toast(Adw.Toast.new(GLib.markup_escape_text(f"Cannot play {file.get_basename()}: {e}")))
+
     def open_appconfig_modal(self, button):
         dlg = _app_config_dialog.AppConfigDialog(self.app_window, _globals.app_config, _globals.about_info)
         dlg.connect("response", self.appconfig_dialog_callback)
@@ -541,6 +704,15 @@ class ConnectionsView():
             for notebook in _gui_globals.all_notebooks:
                 for terminal in self.app_window._find_all_terminals_in_widget(notebook):
                     terminal.apply_theme()
+            _gui_globals.inventory_manager.start()
+            _gui_globals.reachability_manager.start()
+            _gui_globals.resolver_manager.start()
+            _gui_globals.prewarm_manager.start()
+            _gui_globals.reconnect_manager.start()
+            _gui_globals.scrollback_manager.start()
+            _gui_globals.activity_manager.start()
+            _gui_globals.session_log_manager.start()
+            _gui_globals.recording_manager.start()
 
         if response_id == Gtk.ResponseType.OK or response_id == Gtk.ResponseType.CANCEL:
             dialog.destroy()
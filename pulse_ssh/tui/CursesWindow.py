@@ -1,6 +1,7 @@
 #!/usr/bin/python
 
 import curses
+import os
 import pulse_ssh.Globals as _globals
 import pulse_ssh.Utils as _utils
 import signal
@@ -8,6 +9,8 @@ import subprocess
 import sys
 import traceback
 
+PROXY_PORT_OWNER = "tui"
+
 class CursesWindow:
     def __init__(self):
         self.original_tree = None
@@ -196,21 +199,21 @@ class CursesWindow:
                 if uuid_to_execute:
                     conn_details = _globals.connections.get(uuid_to_execute)
                     if conn_details:
-                        final_cmd = None
-                        proxy_port = None
+                        plan = None
 
                         if conn_details.type == 'ssh':
-                            final_cmd, proxy_port = _utils.build_ssh_command(_globals.app_config, conn_details)
+                            plan = _utils.build_ssh_command(_globals.app_config, conn_details, PROXY_PORT_OWNER)
                         elif conn_details.type == 'mosh':
-                            final_cmd, proxy_port = _utils.build_mosh_command(_globals.app_config, conn_details)
+                            plan = _utils.build_mosh_command(_globals.app_config, conn_details, PROXY_PORT_OWNER)
                         elif conn_details.type == 'sftp':
-                            final_cmd, proxy_port = _utils.build_sftp_command(_globals.app_config, conn_details)
+                            plan = _utils.build_sftp_command(_globals.app_config, conn_details)
                         elif conn_details.type == 'ftp':
-                            final_cmd, proxy_port = _utils.build_ftp_command(_globals.app_config, conn_details)
+                            plan = _utils.build_ftp_command(_globals.app_config, conn_details)
 
-                        if final_cmd:
+                        if plan:
                             curses.endwin()
-                            subprocess.run(final_cmd, shell=True)
+                            subprocess.run(plan.spawn_argv(_globals.app_config.shell_program), env={**os.environ, **plan.env})
+                            _utils.release_proxy_port(PROXY_PORT_OWNER)
                             curses.doupdate()
 
             elif key == curses.KEY_BACKSPACE or key == 127:
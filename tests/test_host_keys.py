@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+import base64
+import hashlib
+import hmac
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulse_ssh.HostKeys as _host_keys
+
+def hashed_field(name: str) -> str:
+    salt = b"0123456789abcdefghij"
+    digest = hmac.new(salt, name.encode('utf-8'), hashlib.sha1).digest()
+    return f"|1|{base64.b64encode(salt).decode()}|{base64.b64encode(digest).decode()}"
+
+class IsHostKnownTest(unittest.TestCase):
+    def test_bracketed_host_with_port(self):
+        self.assertTrue(_host_keys.is_host_known("example.com", 2222, ["[example.com]:2222"]))
+        self.assertFalse(_host_keys.is_host_known("example.com", 2200, ["[example.com]:2222"]))
+        self.assertFalse(_host_keys.is_host_known("example.com", 22, ["[example.com]:2222"]))
+
+    def test_bracketed_host_in_list(self):
+        self.assertTrue(_host_keys.is_host_known("10.0.0.5", 2222, ["other,[10.0.0.5]:2222"]))
+
+    def test_plain_host_on_default_port(self):
+        self.assertTrue(_host_keys.is_host_known("example.com", 22, ["example.com"]))
+        self.assertFalse(_host_keys.is_host_known("example.com", 2222, ["example.com"]))
+
+    def test_wildcards_and_negation(self):
+        self.assertTrue(_host_keys.is_host_known("a.example.com", 22, ["*.example.com"]))
+        self.assertTrue(_host_keys.is_host_known("web1", 22, ["web?"]))
+        self.assertFalse(_host_keys.is_host_known("a.example.com", 22, ["*.example.com,!a.example.com"]))
+        self.assertTrue(_host_keys.is_host_known("example.com", 2222, ["[*.com]:2222"]))
+
+    def test_hashed_entry(self):
+        self.assertTrue(_host_keys.is_host_known("example.com", 2222, [hashed_field("[example.com]:2222")]))
+        self.assertFalse(_host_keys.is_host_known("example.com", 22, [hashed_field("[example.com]:2222")]))
+
+class ScanViaJumpTest(unittest.TestCase):
+    def run_scan(self, jump_entries):
+        pinned = []
+        def fake_run(argv, **kwargs):
+            for arg in argv:
+                if arg.startswith("UserKnownHostsFile="):
+                    with open(arg.split("=", 1)[1]) as f:
+                        pinned.append(f.read())
+            return mock.Mock(stdout="inner ssh-ed25519 AAAA\n")
+        with mock.patch("subprocess.run", side_effect=fake_run) as run:
+            keys = _host_keys.scan_host_via_jump("inner", 2200, ["ssh", "-p", "22", "bastion"], jump_entries)
+        return keys, run.call_args[0][0], pinned
+
+    def test_runs_keyscan_on_the_jump_host(self):
+        keys, argv, pinned = self.run_scan(None)
+        self.assertEqual(keys, [("ssh-ed25519", "AAAA")])
+        self.assertEqual(argv[argv.index("bastion"):], ["bastion", "ssh-keyscan", "-T", str(_host_keys.SCAN_TIMEOUT), "-p", "2200", "inner"])
+        self.assertEqual(pinned, [])
+
+    def test_pins_an_unknown_jump_host(self):
+        keys, argv, pinned = self.run_scan({("bastion", 22): [("ssh-ed25519", "BBBB")]})
+        self.assertIn("StrictHostKeyChecking=yes", argv)
+        self.assertEqual(pinned, ["bastion ssh-ed25519 BBBB\n"])
+
+if __name__ == "__main__":
+    unittest.main()
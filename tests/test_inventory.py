@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulse_ssh.data.Connection as _connection
+import pulse_ssh.Inventory as _inventory
+
+class DropUuidCollisionsTest(unittest.TestCase):
+    def test_local_entry_is_not_overwritten(self):
+        current = {"u1": _connection.Connection(uuid="u1", name="hand-made")}
+        incoming = {"u1": _connection.Connection(uuid="u1", name="from inventory", inventory_managed=True)}
+        self.assertEqual(_inventory.drop_uuid_collisions(incoming, current), ["from inventory"])
+        self.assertEqual(incoming, {})
+
+    def test_inventory_entry_is_updated(self):
+        current = {"u1": _connection.Connection(uuid="u1", name="old", inventory_managed=True)}
+        incoming = {"u1": _connection.Connection(uuid="u1", name="new", inventory_managed=True)}
+        self.assertEqual(_inventory.drop_uuid_collisions(incoming, current), [])
+        self.assertIn("u1", incoming)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pulse_ssh.PortAllocator as _port_allocator
+
+class PortAllocatorTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(_port_allocator, 'is_port_available', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.allocator = _port_allocator.PortAllocator(30000, 30009)
+
+    def test_leases_distinct_ports(self):
+        first, _ = self.allocator.acquire("a")
+        second, _ = self.allocator.acquire("b")
+        self.assertNotEqual(first, second)
+        self.allocator.release("a")
+        self.assertIsNone(self.allocator.owner_of(first))
+        self.assertEqual(self.allocator.owner_of(second), "b")
+
+    def test_sharers_join_the_carrier(self):
+        self.assertEqual(self.allocator.acquire("a", "ssh:host"), (30000, True))
+        self.assertEqual(self.allocator.acquire("b", "ssh:host"), (30000, False))
+
+    def test_shared_port_outlives_its_carrier(self):
+        port, _ = self.allocator.acquire("a", "ssh:host")
+        self.allocator.acquire("b", "ssh:host")
+        self.allocator.release("a")
+
+        other, _ = self.allocator.acquire("c")
+        self.assertNotEqual(other, port)
+        self.assertIsNone(self.allocator.owner_of(port))
+        self.assertEqual(self.allocator.acquire("d", "ssh:host"), (port, True))
+
+    def test_carrier_respawn_keeps_the_shared_port(self):
+        port, _ = self.allocator.acquire("a", "ssh:host")
+        self.allocator.acquire("b", "ssh:host")
+        self.assertEqual(self.allocator.acquire("a", "ssh:host"), (port, True))
+        self.assertEqual(self.allocator.owner_of(port), "a")
+
+    def test_shared_port_freed_with_last_sharer(self):
+        port, _ = self.allocator.acquire("a", "ssh:host")
+        self.allocator.acquire("b", "ssh:host")
+        self.allocator.release("a")
+        self.allocator.release("b")
+        self.assertEqual(self.allocator.leases(), {})
+        self.assertEqual(self.allocator.acquire("c", "ssh:host")[1], True)
+
+if __name__ == "__main__":
+    unittest.main()